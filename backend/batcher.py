@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mikro-Batch Birleştirici
+Aynı hastalık için kısa bir pencerede gelen tek hastalık istekleri tek bir matriste toplanır;
+scaler + predict_proba her model için bir kez çalışır ve sonuçlar bekleyen isteklere dağıtılır.
+"""
+
+import asyncio
+import os
+import time
+
+import numpy as np
+
+# HEALTHAI_MICROBATCH=1 ile açılır; kapalıyken her istek ayrı çalışır
+MICROBATCH = os.environ.get("HEALTHAI_MICROBATCH", "0") == "1"
+# İlk istekten sonra en fazla bu kadar beklenir (ms)
+MAX_WAIT_MS = float(os.environ.get("HEALTHAI_MICROBATCH_WAIT_MS", "5"))
+# Bu kadar satır birikince pencere beklenmeden çalıştırılır
+MAX_BATCH = int(os.environ.get("HEALTHAI_MICROBATCH_SIZE", "64"))
+
+
+class MicroBatcher:
+    """Hastalık başına bekleyen satırları toplayan birleştirici
+
+    run_batch(model_id, X) -> (sonuç listesi, bekleme ms) bir coroutine'dir
+    (örn. yürütücü üzerinden predict_batch). Tüm durum olay döngüsü thread'inde tutulur.
+    """
+
+    def __init__(self, run_batch, max_wait_ms: float = MAX_WAIT_MS, max_batch: int = MAX_BATCH):
+        self.run_batch = run_batch
+        self.max_wait = max_wait_ms / 1000
+        self.max_batch = max_batch
+        # model_id -> [(satır, future, gönderim zamanı)]
+        self.pending = {}
+        self.timers = {}
+        # Çalışan batch görevleri (çöp toplayıcıya karşı referans tutulur)
+        self.tasks = set()
+        self.batches = 0
+        self.rows = 0
+        self.full_batches = 0
+
+    async def submit(self, model_id: str, row: np.ndarray) -> tuple:
+        """Tek satırı sıraya koy; (sonuç, kuyrukta bekleme ms) döndür"""
+        future = asyncio.get_running_loop().create_future()
+        queue = self.pending.setdefault(model_id, [])
+        queue.append((row, future, time.perf_counter()))
+        if len(queue) >= self.max_batch:
+            self._flush(model_id)
+        elif model_id not in self.timers:
+            self.timers[model_id] = asyncio.get_running_loop().call_later(self.max_wait, self._flush, model_id)
+        return await future
+
+    def _flush(self, model_id: str):
+        timer = self.timers.pop(model_id, None)
+        if timer is not None:
+            timer.cancel()
+        queue = self.pending.pop(model_id, [])
+        if queue:
+            task = asyncio.get_running_loop().create_task(self._run(model_id, queue))
+            self.tasks.add(task)
+            task.add_done_callback(self.tasks.discard)
+
+    async def _run(self, model_id: str, queue: list):
+        self.batches += 1
+        self.rows += len(queue)
+        self.full_batches += len(queue) >= self.max_batch
+        started = time.perf_counter()
+        try:
+            results, executor_wait_ms = await self.run_batch(model_id, np.vstack([row for row, _, _ in queue]))
+        except Exception as e:
+            for _, future, _ in queue:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for result, (_, future, submitted) in zip(results, queue):
+            if not future.done():
+                # Birleştirme penceresi + yürütücü kuyruğu
+                future.set_result((result, (started - submitted) * 1000 + executor_wait_ms))
+
+    def status(self) -> dict:
+        return {
+            "max_wait_ms": self.max_wait * 1000,
+            "max_batch": self.max_batch,
+            "batches": self.batches,
+            "rows": self.rows,
+            "avg_batch_size": round(self.rows / self.batches, 2) if self.batches else None,
+            "fill_ratio": round(self.rows / (self.batches * self.max_batch), 3) if self.batches else None,
+            "full_batches": self.full_batches,
+        }
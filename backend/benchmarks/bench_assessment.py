@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+model/*/assessment.py assess_batch benchmark'ı ve doğrulaması
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_assessment.py --model parkinson --rows 5000
+
+  1. DataFrame, sözlük listesi ve 2-D dizi girdileriyle assess_batch çalıştırılır; örnek satırlarda
+     batch[i] assess_risk(satır) ile birebir aynı sözlük olmalıdır
+  2. N hasta için assess_risk döngüsü ile tek assess_batch çağrısı (sütunsal sonuç) karşılaştırılır
+  3. Bellekte tutulan N değerlendirmenin boyutu: tembel sonuçlar (LazyAssessment) ile her alanı
+     hasta başına kopyalanmış eski tip sözlükler (tracemalloc)
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+import warnings
+from collections.abc import Mapping
+
+import numpy as np
+import pandas as pd
+
+from common import random_matrix
+
+import main
+from bench_bulk import load_assessment_class
+from scoring import feature_columns
+
+warnings.simplefilter("ignore")
+
+
+def patient_frame(model_id: str, n_rows: int, seed: int) -> pd.DataFrame:
+    schema = main.INPUT_SCHEMAS[model_id]
+    df = pd.DataFrame(random_matrix(schema, n_rows, seed=seed), columns=list(schema.model_fields))
+    for name, field in schema.model_fields.items():
+        if field.annotation is int:
+            df[name] = df[name].astype(np.int64)
+    return df[feature_columns(model_id)]
+
+
+def same(a, b) -> bool:
+    """assess_risk sonuçlarını tür dahil karşılaştır (list/tuple veya dict/MappingProxyType farkı da fark sayılır)"""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, Mapping):
+        return isinstance(b, Mapping) and a.keys() == b.keys() and all(same(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple, np.ndarray)):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def mutable_parts(value) -> bool:
+    """İç içe yapıda değiştirilebilir dict/list var mı"""
+    if isinstance(value, (dict, list)):
+        return True
+    if isinstance(value, Mapping):
+        return any(mutable_parts(item) for item in value.values())
+    if isinstance(value, tuple):
+        return any(mutable_parts(item) for item in value)
+    return False
+
+
+def eager(value):
+    """Değerlendirmeyi eski assess_risk gibi hasta başına ayrı sözlük/listelerle kopyala"""
+    if isinstance(value, Mapping):
+        return {key: eager(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [eager(item) for item in value]
+    return value
+
+
+def retained_bytes(build) -> int:
+    """build() sonucunu canlı tutarken ayrılan bellek"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def check(assessment, df: pd.DataFrame, n_sample: int) -> dict:
+    sample = df.head(n_sample)
+    expected = [assessment.assess_risk(row) for row in sample.to_dict("records")]
+    inputs = {
+        "DataFrame": sample,
+        "sözlük listesi": sample.to_dict("records"),
+        "2-D dizi": sample.to_numpy(dtype=np.float64),
+    }
+    checks = {}
+    for name, patients in inputs.items():
+        batch = assessment.assess_batch(patients)
+        checks[f"{name}: batch[i] == assess_risk"] = all(same(a, b) for a, b in zip(expected, batch))
+    if hasattr(assessment, "RESULT_KEYS"):
+        # risk_dagilimi ve risk_faktorleri sonuca özeldir; metin alanları paylaşılan şablondan gelir
+        checks["paylaşılan şablonlar salt okunur"] = not any(
+            mutable_parts(assessment._severity_template(result.severity, result.data)) for result in expected
+        )
+    return checks
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="assess_batch benchmark")
+    parser.add_argument("--model", default="parkinson", choices=["asthma", "parkinson"])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--sample", type=int, default=200)
+    args = parser.parse_args()
+
+    assessment = load_assessment_class(args.model)
+    df = patient_frame(args.model, args.rows, seed=18)
+    checks = check(assessment, df, args.sample)
+
+    records = df.to_dict("records")
+    started = time.perf_counter()
+    for row in records:
+        assessment.assess_risk(row)
+    loop = time.perf_counter() - started
+    started = time.perf_counter()
+    batch = assessment.assess_batch(df)
+    summary = batch.to_frame()
+    vector = time.perf_counter() - started
+    checks["to_frame satır sayısı"] = len(summary) == args.rows
+
+    if hasattr(assessment, "RESULT_KEYS"):
+        dicts = retained_bytes(lambda: [eager(item) for item in batch])
+        for label, build in (
+            ("LazyAssessment", lambda: list(batch)),
+            ("+ risk_faktorleri", lambda: [item for item in batch if item["risk_faktorleri"]]),
+        ):
+            lazy = retained_bytes(build)
+            print(f"   bellek / değerlendirme: {label:<18} {lazy / args.rows:>6,.0f} B, "
+                  f"sözlük {dicts / args.rows:,.0f} B ({dicts / lazy:.1f}x)")
+
+    print(f"   {args.rows:,} hasta: assess_risk döngüsü {loop:.2f} sn, assess_batch {vector * 1000:.1f} ms "
+          f"({loop / vector:,.0f}x)")
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
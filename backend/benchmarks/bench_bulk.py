@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplu skorlama (cli.py score) benchmark'ı ve doğrulaması
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_bulk.py --model parkinson --rows 200000
+
+  1. Rastgele bir hasta dosyası üretilir ve parça parça skorlanır (satır/sn, tepe bellek)
+  2. --workers > 1 ise aynı dosya süreç havuzuyla skorlanır; sonuç dosyası tek süreçli çıktıyla
+     bayt bayt aynı olmalıdır (sıralı birleştirme) ve worker başına verim raporlanır
+  3. Örnek satırlarda seviye, genel_risk_skoru ve olasılıklar model/<hastalık>/assessment.py
+     sınıfının assess_risk çıktısıyla aynı olmalıdır
+"""
+
+import argparse
+import importlib
+import os
+import resource
+import sys
+import tempfile
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from common import random_matrix
+
+import main
+from registry import MODEL_DIRS
+from cli import print_worker_stats
+from scoring import CLASS_NAMES, feature_columns, score_file, score_file_parallel
+
+warnings.simplefilter("ignore")
+
+ASSESSMENT_CLASSES = {
+    "asthma": "AsthmaRiskAssessment",
+    "diabetes": "DiabetesRiskAssessment",
+    "hypertension": "HypertensionRiskAssessment",
+    "parkinson": "ParkinsonRiskAssessment",
+    "animal_bite": "AnimalBiteRiskAssessment",
+}
+
+
+def load_assessment_class(model_id: str):
+    module = importlib.import_module(f"model.{MODEL_DIRS[model_id]}.assessment")
+    return getattr(module, ASSESSMENT_CLASSES[model_id])()
+
+
+def write_input(model_id: str, path: str, n_rows: int):
+    features = feature_columns(model_id)
+    schema = main.INPUT_SCHEMAS[model_id]
+    X = random_matrix(schema, n_rows, seed=21)
+    # random_matrix şema sırasında; dosyaya feature_columns sırasıyla ve bir kimlik sütunuyla yaz
+    df = pd.DataFrame(X, columns=list(schema.model_fields))[features]
+    for name, field in schema.model_fields.items():
+        if field.annotation is int:
+            df[name] = df[name].astype(np.int64)
+    df.insert(0, "hasta_id", np.arange(n_rows))
+    df.to_csv(path, index=False)
+
+
+def reference(assessment, model_id: str, row: dict) -> tuple:
+    result = assessment.assess_risk(row)
+    if model_id == "asthma":
+        return result["has_asthma"], result["risk_percentage"], None
+    return int(result["seviye"]), result["genel_risk_skoru"], result["risk_dagilimi"]
+
+
+def check_sample(model_id: str, src: str, dst: str, n_sample: int) -> bool:
+    assessment = load_assessment_class(model_id)
+    features = feature_columns(model_id)
+    inputs = pd.read_csv(src, nrows=n_sample)
+    outputs = pd.read_csv(dst, nrows=n_sample)
+    ok = (inputs["hasta_id"] == outputs["hasta_id"]).all()
+    for (_, row), (_, out) in zip(inputs.iterrows(), outputs.iterrows()):
+        severity, score, distribution = reference(assessment, model_id, row[features].to_dict())
+        ok &= severity == out["seviye"] and abs(score - out["genel_risk_skoru"]) < 0.051
+        if distribution is not None:
+            for value, name in zip(distribution.values(), CLASS_NAMES[model_id]):
+                ok &= abs(value - out[f"olasilik_{name}"] * 100) < 0.051
+    return bool(ok)
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Toplu skorlama benchmark")
+    parser.add_argument("--model", default="parkinson", choices=["asthma", "parkinson"])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--chunk-rows", type=int, default=50_000)
+    parser.add_argument("--sample", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=0, help="0: CPU sayısı")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "girdi.csv")
+        dst = os.path.join(tmp, "sonuc.csv")
+        write_input(args.model, src, args.rows)
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        progress = score_file(args.model, src, dst, chunk_rows=args.chunk_rows, keep=["hasta_id"])
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"   {progress.rows:,} satır, {progress.rate:,.0f} satır/sn, "
+              f"tepe RSS {rss_before:.0f} -> {rss_after:.0f} MB ({args.chunk_rows:,} satırlık parçalar)")
+        checks = {
+            "satır sayısı": progress.rows == args.rows,
+            "assess_risk ile aynı sonuçlar": check_sample(args.model, src, dst, args.sample),
+        }
+
+        workers = args.workers or os.cpu_count() or 1
+        if workers > 1:
+            parallel_dst = os.path.join(tmp, "sonuc_paralel.csv")
+            parallel, stats = score_file_parallel(
+                args.model, src, parallel_dst, workers, chunk_rows=args.chunk_rows, keep=["hasta_id"]
+            )
+            print(f"   {workers} worker: {parallel.rate:,.0f} satır/sn "
+                  f"(tek süreç {progress.rate:,.0f}, {parallel.rate / progress.rate:.2f}x)")
+            print_worker_stats(stats)
+            with open(dst, "rb") as a, open(parallel_dst, "rb") as b:
+                checks["paralel çıktı tek süreçle aynı"] = a.read() == b.read()
+        else:
+            print("⚠️ Tek CPU: paralel karşılaştırma için --workers 2+ verin")
+
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
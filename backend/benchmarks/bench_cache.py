@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tahmin önbelleği (HEALTHAI_CACHE_MB) benchmark'ı ve doğrulaması
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_cache.py --model parkinson --requests 2000 --distinct 200
+
+  1. Sınırlı sayıda farklı girdiden oluşan trafikte isabet oranı ve isabet/ıskalama gecikmesi
+  2. Önbellekten dönen sonuçların yeniden hesaplananlarla aynı olması
+  3. m3.pkl'nin değişiklik zamanı değişince kayıtların geçersiz kalması ve modelin yeniden yüklenmesi
+  4. Bellek sınırı aşılınca LRU atılması
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import warnings
+
+from fastapi.testclient import TestClient
+
+from common import percentiles, random_rows
+
+import main
+from cache import PredictionCache
+from registry import model_path
+
+warnings.simplefilter("ignore")
+
+SCHEMAS = {
+    "asthma": main.AsthmaInput,
+    "diabetes": main.DiabetesInput,
+    "hypertension": main.HypertensionInput,
+    "parkinson": main.ParkinsonInput,
+    "animal_bite": main.AnimalBiteInput,
+}
+
+
+def hit_ratio(client, model_id: str, pool: list, n_requests: int) -> bool:
+    main.prediction_cache = PredictionCache()
+    rng = random.Random(10)
+    timings = {"hit": [], "miss": []}
+    first = {}
+    ok = True
+    for _ in range(n_requests):
+        i = rng.randrange(len(pool))
+        start = time.perf_counter()
+        response = client.post(f"/api/predict/{model_id}", json=pool[i])
+        timings[response.headers["X-Cache"]].append(time.perf_counter() - start)
+        ensemble = response.json()["ensemble"]
+        ok &= first.setdefault(i, ensemble) == ensemble
+    status = main.prediction_cache.status()
+    print(f"   {n_requests} istek / {len(pool)} farklı girdi -> isabet oranı {status['hit_ratio']}, "
+          f"{status['entries']} kayıt, {status['memory_mb']} MB")
+    for kind, samples in timings.items():
+        if samples:
+            r = percentiles(samples)
+            print(f"   {kind:<5} p50 {r['p50_us']:>9} µs  p99 {r['p99_us']:>9} µs")
+    print(f"   önbellek sonuçları hesaplananlarla aynı: {ok}")
+    return ok
+
+
+def invalidation(client, model_id: str, row: dict) -> bool:
+    main.prediction_cache = PredictionCache()
+    main.registry.version_check_s = 0
+    url = f"/api/predict/{model_id}"
+    client.post(url, json=row)
+    before = client.post(url, json=row).headers["X-Cache"]
+    path = os.path.join(model_path(model_id), "m3.pkl")
+    stat = os.stat(path)
+    loads = main.registry.entries[model_id].loads
+    try:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        after = client.post(url, json=row).headers["X-Cache"]
+    finally:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    reloaded = main.registry.entries[model_id].loads == loads + 1
+    print(f"   dosya değişmeden önce: {before}, değiştikten sonra: {after}, model yeniden yüklendi: {reloaded}")
+    return before == "hit" and after == "miss" and reloaded
+
+
+def lru_cap(client, model_id: str, pool: list) -> bool:
+    main.prediction_cache = PredictionCache(max_mb=0.01)
+    for row in pool:
+        client.post(f"/api/predict/{model_id}", json=row)
+    status = main.prediction_cache.status()
+    print(f"   {status['max_mb']} MB sınır, {len(pool)} girdi -> {status['entries']} kayıt, "
+          f"{status['evictions']} atılma, {status['memory_mb']} MB")
+    return status["evictions"] > 0 and main.prediction_cache.nbytes <= main.prediction_cache.max_bytes
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Tahmin önbelleği benchmark")
+    parser.add_argument("--model", default="parkinson", choices=list(SCHEMAS))
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--distinct", type=int, default=200)
+    args = parser.parse_args()
+
+    pool = random_rows(SCHEMAS[args.model], args.distinct, seed=11)
+    with TestClient(main.app) as client:
+        checks = {
+            "isabet oranı": hit_ratio(client, args.model, pool, args.requests),
+            "dosya değişince geçersiz kılma": invalidation(client, args.model, pool[0]),
+            "bellek sınırı": lru_cap(client, args.model, pool),
+        }
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
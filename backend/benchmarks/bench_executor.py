@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Olay döngüsü dışında çıkarım (HEALTHAI_EXECUTOR) benchmark'ı
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_executor.py --model parkinson --requests 200 --concurrency 32
+
+Her yürütücü türü için uygulama süreç içinde (ASGI, ağ yok) çalıştırılır:
+  - eş zamanlı tahmin isteklerinin toplam süresi ve istek/sn
+  - aynı anda / örnek sayısı ve gecikmesi (olay döngüsü bloklanıyor mu?); /api/health process
+    havuzunda worker'a sorulduğundan kuyruğu ölçerdi
+  - X-Queue-Wait-Ms ortalaması ve küçük kuyrukta 429 ile reddedilen istek sayısı
+"""
+
+import argparse
+import asyncio
+import time
+import warnings
+
+import httpx
+
+from common import percentiles, random_rows
+
+import main
+from executor import InferenceExecutor
+
+warnings.simplefilter("ignore")
+
+SCHEMAS = {
+    "asthma": main.AsthmaInput,
+    "diabetes": main.DiabetesInput,
+    "hypertension": main.HypertensionInput,
+    "parkinson": main.ParkinsonInput,
+    "animal_bite": main.AnimalBiteInput,
+}
+
+
+async def probe_health(client: httpx.AsyncClient, stop: asyncio.Event, samples: list):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/")
+        samples.append(time.perf_counter() - start)
+        await asyncio.sleep(0.005)
+
+
+async def run(kind: str, model_id: str, rows: list, concurrency: int, max_pending: int) -> dict:
+    main.executor.shutdown()
+    main.executor = InferenceExecutor(kind=kind, max_pending=max_pending, initializer=main.preload_worker)
+    main.executor.start()
+    transport = httpx.ASGITransport(app=main.app)
+    url = f"/api/predict/{model_id}"
+    statuses, waits, health = [], [], []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Isınma: process worker'ları ve modeller hazır olsun
+        await asyncio.gather(*(client.post(url, json=rows[0]) for _ in range(main.executor.workers)))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def request(row):
+            async with semaphore:
+                response = await client.post(url, json=row)
+            statuses.append(response.status_code)
+            if "X-Queue-Wait-Ms" in response.headers:
+                waits.append(float(response.headers["X-Queue-Wait-Ms"]))
+
+        stop = asyncio.Event()
+        prober = asyncio.create_task(probe_health(client, stop, health))
+        start = time.perf_counter()
+        await asyncio.gather(*(request(row) for row in rows))
+        elapsed = time.perf_counter() - start
+        stop.set()
+        await prober
+
+    main.executor.shutdown()
+    return {
+        "elapsed": elapsed,
+        "ok": statuses.count(200),
+        "rejected": statuses.count(429),
+        "wait_ms": sum(waits) / len(waits) if waits else 0.0,
+        "health": percentiles(health) if health else None,
+        "health_n": len(health),
+    }
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Yürütücü türleri benchmark")
+    parser.add_argument("--model", default="parkinson", choices=list(SCHEMAS))
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--kinds", default="inline,thread,process")
+    args = parser.parse_args()
+
+    if main.registry.get(args.model) is None:
+        print(f"{args.model} modeli yüklü değil, atlandı")
+        return
+    rows = random_rows(SCHEMAS[args.model], args.requests, seed=8)
+
+    print(f"{'yürütücü':<10}{'süre s':>8}{'istek/sn':>10}{'429':>6}{'kuyruk ms':>11}"
+          f"{'health n':>10}{'health p50 µs':>15}{'health p99 µs':>15}")
+    for kind in args.kinds.split(","):
+        for label, max_pending in ((kind, 10**6), (f"{kind}/8", 8)):
+            if kind == "inline" and max_pending == 8:
+                continue
+            r = asyncio.run(run(kind, args.model, rows, args.concurrency, max_pending))
+            health = r["health"] or {"p50_us": "-", "p99_us": "-"}
+            print(f"{label:<10}{r['elapsed']:>8.2f}{r['ok'] / r['elapsed']:>10.1f}{r['rejected']:>6}"
+                  f"{r['wait_ms']:>11.2f}{r['health_n']:>10}{health['p50_us']:>15}{health['p99_us']:>15}")
+
+
+if __name__ == "__main__":
+    main_cli()
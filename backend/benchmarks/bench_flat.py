@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Düz dizi değerlendirici (HEALTHAI_ENGINE=flat) vs pickle'dan yüklenen sklearn modelleri
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_flat.py --repeat 1000
+
+Yüklü her model için:
+  1. Olasılık farkı (rf/gb/ensemble) ve argmax uyuşmazlığı — toplama sırası farklı
+     olduğundan sonuçlar birebir değil, ~1e-15 içinde eşit olmalıdır
+  2. Tek satır predict() gecikmesi (p50/p99)
+  3. Farklı batch boyutlarında satır/sn (flat motor kesme noktası için)
+  4. Bellek: ağaç düğümleri (sklearn) vs düz diziler
+"""
+
+import argparse
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from common import percentiles, random_matrix, time_calls
+from registry import estimate_nbytes
+
+import main
+
+warnings.simplefilter("ignore")
+
+SCHEMAS = {
+    "asthma": main.AsthmaInput,
+    "diabetes": main.DiabetesInput,
+    "hypertension": main.HypertensionInput,
+    "parkinson": main.ParkinsonInput,
+    "animal_bite": main.AnimalBiteInput,
+}
+
+BATCH_SIZES = (1, 16, 128, 512, 4096)
+TOLERANCE = 1e-9
+
+
+def components(model, X: np.ndarray) -> tuple:
+    rf_proba, gb_proba = model._components(np.array(X, dtype=np.float64))
+    return rf_proba, gb_proba, (rf_proba + gb_proba) / 2
+
+
+def rows_per_second(model, X: np.ndarray, batch: int) -> float:
+    features = main.FEATURE_ORDERS[model.model_prefix]
+    n = 0
+    start = time.perf_counter()
+    for offset in range(0, len(X), batch):
+        n += len(model.predict_batch(X[offset:offset + batch], features))
+    return n / (time.perf_counter() - start)
+
+
+def run(model_id: str, repeat: int) -> bool:
+    sk = main.BaseRiskAssessment(model_id, engine="sklearn")
+    if not sk.is_loaded:
+        return None
+    flat = main.BaseRiskAssessment(model_id, engine="flat")
+    flat.flat_max_rows = sys.maxsize
+    features = main.FEATURE_ORDERS[model_id]
+
+    X = random_matrix(SCHEMAS[model_id], 4096, seed=6)
+    expected = components(sk, X)
+    actual = components(flat, X)
+    worst = max(float(np.abs(a - e).max()) for a, e in zip(actual, expected))
+    mismatches = int((expected[2].argmax(axis=1) != actual[2].argmax(axis=1)).sum())
+    ok = worst <= TOLERANCE and mismatches == 0
+    print(f"   en büyük olasılık farkı: {worst:.2e}, argmax uyuşmazlığı: {mismatches}")
+
+    row = dict(zip(features, X[0].tolist()))
+    for label, model in (("sklearn", sk), ("flat", flat)):
+        r = percentiles(time_calls(lambda: model.predict(row, features), repeat))
+        print(f"   predict {label:<8} p50 {r['p50_us']:>9} µs  p99 {r['p99_us']:>9} µs")
+
+    print(f"   {'batch':>8}{'sklearn satır/sn':>20}{'flat satır/sn':>18}")
+    for batch in BATCH_SIZES:
+        n = min(len(X), batch * 64)
+        print(f"   {batch:>8}{rows_per_second(sk, X[:n], batch):>20,.0f}"
+              f"{rows_per_second(flat, X[:n], batch):>18,.0f}")
+
+    trees_mb = (estimate_nbytes(sk.rf_model) + estimate_nbytes(sk.gb_model)) / 2**20
+    print(f"   bellek: sklearn ağaçları {trees_mb:.2f} MB, düz diziler {flat.flat.nbytes / 2**20:.2f} MB")
+    return ok
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Düz dizi ensemble değerlendirici benchmark")
+    parser.add_argument("--repeat", type=int, default=1000, help="Tek satır ölçüm sayısı")
+    args = parser.parse_args()
+
+    failed = False
+    for model_id in SCHEMAS:
+        print(f"🌲 {model_id}")
+        ok = run(model_id, args.repeat)
+        if ok is None:
+            print("   (model dosyaları yok, atlandı)")
+        failed |= ok is False
+    if failed:
+        print("❌ Düz değerlendirici sklearn ile uyuşmuyor")
+        sys.exit(1)
+    print("✅ Düz değerlendirici sklearn ile aynı tahminleri üretiyor")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON kodlayıcı (HEALTHAI_JSON) doğrulaması + benchmark'ı
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_json.py --rows 1000
+
+  1. encode_json her iki kodlayıcıyla FastAPI JSONResponse ile bayt bayt aynı çıktı vermelidir
+     (çok küçük/büyük float'lar, Türkçe karakterler, salt okunur öneri tabloları dahil)
+  2. encode_ensemble, ensemble sözlüğünün genel kodlamasıyla aynı olmalıdır
+Ardından /api/statistics, /api/models/status ve batch yanıt gövdesi için stdlib ve orjson süreleri karşılaştırılır.
+"""
+
+import argparse
+import random
+import sys
+import warnings
+from typing import Mapping
+
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from common import percentiles, random_rows, time_calls
+
+import main
+import serialization
+
+warnings.simplefilter("ignore")
+
+EDGE_FLOATS = [0.0, -0.0, 1e-4, 9.99e-5, 3.9e-09, 5.5e-7, 1e-05, 0.1, 1 / 3, 1e15, 1e16, 1.5e17, -2.5e-8]
+
+
+def plain(value):
+    """Salt okunur tabloları JSONResponse'un kabul ettiği dict/list yapısına çevir"""
+    if isinstance(value, Mapping):
+        return {key: plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    return value
+
+
+def fastapi_bytes(content) -> bytes:
+    return JSONResponse(plain(content)).body
+
+
+def ensemble_sample(rng: random.Random) -> dict:
+    p = rng.choice([rng.random(), rng.random() * 1e-6, 1 - 1e-9, 0.0, 1.0])
+    q = rng.choice([rng.random(), 1e-12, 0.5])
+    return {
+        "predicted_class": int(p > 0.5),
+        "probabilities": [1 - p, p],
+        "rf_proba": [1 - q, q],
+        "gb_proba": [rng.choice(EDGE_FLOATS), rng.random()],
+    }
+
+
+def check_compat(payloads: dict, use_orjson: bool) -> int:
+    serialization.USE_ORJSON = use_orjson
+    mismatches = 0
+    for name, content in payloads.items():
+        if serialization.encode_json(content) != fastapi_bytes(content):
+            print(f"   ❌ {name}")
+            mismatches += 1
+    rng = random.Random(5)
+    for _ in range(2000):
+        ensemble = ensemble_sample(rng)
+        mismatches += serialization.encode_ensemble(ensemble) != fastapi_bytes(ensemble)
+        mismatches += serialization.encode_json(ensemble) != fastapi_bytes(ensemble)
+    return mismatches
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="JSON kodlayıcı benchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--model", default="parkinson", choices=["asthma", "parkinson"])
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    schema = {"asthma": main.AsthmaInput, "parkinson": main.ParkinsonInput}[args.model]
+    with TestClient(main.app) as client:
+        batch = client.post(f"/api/predict/{args.model}/batch", json=random_rows(schema, args.rows, seed=3)).json()
+        payloads = {
+            "statistics": client.get("/api/statistics").json(),
+            "models/status": client.get("/api/models/status").json(),
+            f"{args.model} batch ({args.rows} satır)": batch,
+            "öneri tablosu": main.ASTHMA_RECOMMENDATIONS[2],
+            "uç float'lar": {"values": EDGE_FLOATS, "text": "Çok Düşük ğüşıöç"},
+        }
+
+    encoders = [False] + ([True] if serialization.orjson is not None else [])
+    if serialization.orjson is None:
+        print("⚠️ orjson kurulu değil, yalnızca stdlib ölçülüyor")
+
+    checks = {}
+    for use_orjson in encoders:
+        label = "orjson" if use_orjson else "stdlib"
+        checks[f"{label}: JSONResponse ile aynı baytlar"] = check_compat(payloads, use_orjson) == 0
+
+    print(f"{'yük':<32} " + " ".join(f"{'orjson' if e else 'stdlib':>14}" for e in encoders))
+    for name, content in payloads.items():
+        cells = []
+        for use_orjson in encoders:
+            serialization.USE_ORJSON = use_orjson
+            r = percentiles(time_calls(lambda: serialization.encode_json(content), args.repeat))
+            cells.append(f"{r['p50_us']:>11} µs")
+        print(f"{name:<32} " + " ".join(cells))
+    serialization.USE_ORJSON = serialization.JSON_ENCODER == "orjson" and serialization.orjson is not None
+
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Mikro-batch birleştirici (HEALTHAI_MICROBATCH) benchmark'ı
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_microbatch.py --model parkinson --requests 500 --concurrency 64
+
+Aynı hastalığa eş zamanlı tek hasta istekleri birleştirici kapalı ve farklı pencere/boyut
+ayarlarıyla gönderilir; istek/sn, gecikme yüzdelikleri ve batch doluluk oranı raporlanır.
+Birleştirilmiş yanıtların tek tek hesaplananlarla aynı olduğu doğrulanır.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import warnings
+
+import httpx
+
+from common import percentiles, random_rows
+
+import main
+from batcher import MicroBatcher
+
+warnings.simplefilter("ignore")
+
+SCHEMAS = {
+    "asthma": main.AsthmaInput,
+    "diabetes": main.DiabetesInput,
+    "hypertension": main.HypertensionInput,
+    "parkinson": main.ParkinsonInput,
+    "animal_bite": main.AnimalBiteInput,
+}
+
+# (etiket, max_wait_ms, max_batch); None: birleştirici kapalı
+SETTINGS = (("kapalı", None, None), ("2ms/16", 2, 16), ("5ms/64", 5, 64), ("10ms/128", 10, 128))
+
+
+async def run(model_id: str, rows: list, concurrency: int, max_wait_ms, max_batch) -> tuple:
+    main.batcher = MicroBatcher(main.run_ensemble_batch, max_wait_ms, max_batch) if max_wait_ms else None
+    transport = httpx.ASGITransport(app=main.app)
+    url = f"/api/predict/{model_id}"
+    latencies, ensembles = [], [None] * len(rows)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def request(i, row):
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post(url, json=row)
+                latencies.append(time.perf_counter() - start)
+            ensembles[i] = response.json()["ensemble"]
+
+        start = time.perf_counter()
+        await asyncio.gather(*(request(i, row) for i, row in enumerate(rows)))
+        elapsed = time.perf_counter() - start
+
+    status = main.batcher.status() if main.batcher is not None else None
+    main.batcher = None
+    return elapsed, percentiles(latencies), status, ensembles
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Mikro-batch birleştirici benchmark")
+    parser.add_argument("--model", default="parkinson", choices=list(SCHEMAS))
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    if main.registry.get(args.model) is None:
+        print(f"{args.model} modeli yüklü değil, atlandı")
+        return
+    main.executor.max_pending = 10**6
+    rows = random_rows(SCHEMAS[args.model], args.requests, seed=9)
+
+    print(f"{'ayar':<10}{'istek/sn':>10}{'p50 ms':>9}{'p99 ms':>9}{'batch':>7}{'ort. boyut':>12}{'doluluk':>9}")
+    expected = None
+    failed = False
+    for label, max_wait_ms, max_batch in SETTINGS:
+        elapsed, lat, status, ensembles = asyncio.run(
+            run(args.model, rows, args.concurrency, max_wait_ms, max_batch)
+        )
+        if expected is None:
+            expected = ensembles
+        same = ensembles == expected
+        failed |= not same
+        status = status or {"batches": "-", "avg_batch_size": "-", "fill_ratio": "-"}
+        print(f"{label:<10}{len(rows) / elapsed:>10.1f}{lat['p50_us'] / 1000:>9.2f}{lat['p99_us'] / 1000:>9.2f}"
+              f"{status['batches']:>7}{status['avg_batch_size']:>12}{status['fill_ratio']:>9}"
+              f"{'' if same else '  ❌ farklı sonuç'}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Pickle vs bellek eşlemeli (HEALTHAI_MODEL_FORMAT=mmap) model yükleme
+
+Kullanım:
+    cd backend
+    python model_store.py
+    python benchmarks/bench_model_store.py --repeat 5
+
+Yüklü her model için yükleme süresi ve worker başına özel bellekte tutulan model verisi
+raporlanır; mmap modelinin pickle modeliyle aynı tahminleri ürettiği doğrulanır.
+"""
+
+import argparse
+import gc
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from common import random_matrix
+from registry import estimate_nbytes
+
+import main
+import model_store
+
+warnings.simplefilter("ignore")
+
+SCHEMAS = {
+    "asthma": main.AsthmaInput,
+    "diabetes": main.DiabetesInput,
+    "hypertension": main.HypertensionInput,
+    "parkinson": main.ParkinsonInput,
+    "animal_bite": main.AnimalBiteInput,
+}
+
+TOLERANCE = 1e-9
+
+
+def load(model_id: str, model_format: str, repeat: int) -> tuple:
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        model = main.BaseRiskAssessment(model_id, model_format=model_format)
+        timings.append(time.perf_counter() - start)
+    return model, min(timings) * 1000
+
+
+def heap_mb(model) -> float:
+    """Süreç başına özel bellekte tutulan model verisi (mmap dizileri sayılmaz)"""
+    if model.rf_model is not None:
+        return (estimate_nbytes(model.rf_model) + estimate_nbytes(model.gb_model)) / 2**20
+    return sum(getattr(model.flat, name).nbytes for name in model.flat.ARRAYS
+               if not isinstance(getattr(model.flat, name), np.memmap)) / 2**20
+
+
+def run(model_id: str, repeat: int) -> bool:
+    try:
+        model_store.load(model_id)
+    except FileNotFoundError:
+        return None
+    pickled, pickle_ms = load(model_id, "pickle", repeat)
+    mapped, mmap_ms = load(model_id, "mmap", repeat)
+
+    X = random_matrix(SCHEMAS[model_id], 4096, seed=7)
+    features = main.FEATURE_ORDERS[model_id]
+    expected = np.array([r["probabilities"] for r in pickled.predict_batch(X, features)])
+    actual = np.array([r["probabilities"] for r in mapped.predict_batch(X, features)])
+    worst = float(np.abs(expected - actual).max())
+    mismatches = int((expected.argmax(axis=1) != actual.argmax(axis=1)).sum())
+
+    print(f"   yükleme   pickle {pickle_ms:8.1f} ms   mmap {mmap_ms:8.1f} ms   ({pickle_ms / mmap_ms:.0f}x)")
+    print(f"   worker başına özel bellek   pickle {heap_mb(pickled):6.2f} MB   mmap {heap_mb(mapped):6.2f} MB"
+          f"   (paylaşılan sayfa önbelleği {mapped.flat.nbytes / 2**20:.2f} MB)")
+    print(f"   en büyük olasılık farkı: {worst:.2e}, argmax uyuşmazlığı: {mismatches}")
+    return worst <= TOLERANCE and mismatches == 0
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Pickle vs mmap model yükleme benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Model başına yükleme sayısı")
+    args = parser.parse_args()
+
+    failed = False
+    for model_id in SCHEMAS:
+        print(f"💾 {model_id}")
+        ok = run(model_id, args.repeat)
+        if ok is None:
+            print("   (dönüştürülmüş model yok, atlandı)")
+        failed |= ok is False
+    if failed:
+        print("❌ mmap modeli pickle modelinden farklı sonuç veriyor")
+        sys.exit(1)
+    print("✅ mmap modelleri pickle modelleriyle aynı tahminleri üretiyor")
+
+
+if __name__ == "__main__":
+    main_cli()
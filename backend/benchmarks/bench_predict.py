@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+BaseRiskAssessment.predict: pandas yolu vs NumPy hızlı yolu
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_predict.py --repeat 2000
+
+Yüklü her model için aynı hasta satırları iki yoldan geçirilir; olasılıkların birebir
+aynı olduğu doğrulanır ve tek satır gecikmesinin p50/p95/p99 değerleri raporlanır.
+"""
+
+import argparse
+import sys
+import warnings
+
+from common import percentiles, random_rows, time_calls
+
+import main
+
+warnings.simplefilter("ignore")
+
+SCHEMAS = {
+    "asthma": main.AsthmaInput,
+    "diabetes": main.DiabetesInput,
+    "hypertension": main.HypertensionInput,
+    "parkinson": main.ParkinsonInput,
+    "animal_bite": main.AnimalBiteInput,
+}
+
+
+def run(model_id: str, repeat: int) -> dict:
+    model = main.registry.get(model_id)
+    if model is None:
+        return None
+    schema = SCHEMAS[model_id]
+    features = main.FEATURE_ORDERS[model_id]
+    rows = [schema(**row) for row in random_rows(schema, repeat, seed=3)]
+
+    results = {}
+    outputs = {}
+    for name, fast in (("pandas", False), ("numpy", True)):
+        model.fast_path = fast
+        outputs[name] = [model.predict(row, features) for row in rows[:200]]
+        it = iter(rows)
+        results[name] = percentiles(time_calls(lambda: model.predict(next(it), features), repeat))
+    model.fast_path = main.FAST_PATH
+
+    results["identical"] = outputs["pandas"] == outputs["numpy"]
+    return results
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="predict() pandas vs NumPy benchmark")
+    parser.add_argument("--repeat", type=int, default=2000, help="Model başına ölçüm sayısı")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'model':<14}{'yol':<8}{'p50 µs':>10}{'p95 µs':>10}{'p99 µs':>10}")
+    for model_id in SCHEMAS:
+        results = run(model_id, args.repeat)
+        if results is None:
+            print(f"{model_id:<14}(model dosyaları yok, atlandı)")
+            continue
+        for name in ("pandas", "numpy"):
+            r = results[name]
+            print(f"{model_id:<14}{name:<8}{r['p50_us']:>10}{r['p95_us']:>10}{r['p99_us']:>10}")
+        gain = results["pandas"]["p50_us"] / results["numpy"]["p50_us"]
+        print(f"{'':<14}p50 kazanç: {gain:.2f}x, olasılıklar aynı: {results['identical']}")
+        failed |= not results["identical"]
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
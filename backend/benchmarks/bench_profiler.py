@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İstatistiksel profil çıkarıcı doğrulaması ve maliyeti
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_profiler.py --repeat 300
+
+  1. HEALTHAI_PROFILE_TOKEN tanımsızken middleware ve /api/profile olmamalı (ayrı süreçte)
+  2. Başlıksız istekler profillenmez; yanlış başlık 403, doğru başlıkla istekler profillenir
+  3. /api/profile çıktısı katlanmış yığın biçiminde olmalı ve model çağrısını (predict_proba /
+     predict_components) içermeli; reset=true sonrası boş olmalı
+  4. PUT /api/profile?sample=1 ile başlıksız istekler de profillenir
+  5. Tek satır /api/predict/parkinson p50: profil kapalı ve her istek profillenirken
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import warnings
+
+os.environ.setdefault("HEALTHAI_CACHE_MB", "0")
+os.environ["HEALTHAI_PROFILE_TOKEN"] = "bench-token"
+
+from fastapi.testclient import TestClient
+
+from common import BACKEND_DIR, percentiles, random_rows, time_calls
+
+import main
+
+warnings.simplefilter("ignore")
+
+URL = "/api/predict/parkinson"
+ADMIN = {"X-HealthAI-Profile": "bench-token"}
+
+DISABLED_CHECK = (
+    "import main\n"
+    "from fastapi.testclient import TestClient\n"
+    "from profiler import ProfilerMiddleware\n"
+    "assert main.profiler is None\n"
+    "assert not any(m.cls is ProfilerMiddleware for m in main.app.user_middleware)\n"
+    "assert TestClient(main.app).get('/api/profile').status_code == 404\n"
+)
+
+
+def disabled_without_token() -> bool:
+    env = {key: value for key, value in os.environ.items() if key != "HEALTHAI_PROFILE_TOKEN"}
+    result = subprocess.run([sys.executable, "-c", DISABLED_CHECK], cwd=BACKEND_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return result.returncode == 0
+
+
+def valid_collapsed(text: str) -> bool:
+    lines = text.splitlines()
+    return bool(lines) and all(
+        ";" in stack and count.isdigit() for stack, _, count in (line.rpartition(" ") for line in lines)
+    )
+
+
+def p50(client: TestClient, rows: list, headers: dict = None) -> float:
+    bodies = iter(rows)
+    return percentiles(time_calls(lambda: client.post(URL, json=next(bodies), headers=headers), len(rows)))["p50_us"]
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Profil çıkarıcı doğrulaması")
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    rows = random_rows(main.ParkinsonInput, args.repeat, seed=24)
+    checks = {"token yokken middleware ve endpoint yok": disabled_without_token()}
+    with TestClient(main.app) as client:
+        p50(client, rows[:20])  # ısınma
+        off = p50(client, rows)
+        checks["başlıksız istek profillenmez"] = main.profiler.status()["requests"] == 0
+        checks["yanlış başlık 403"] = client.get("/api/profile", headers={"X-HealthAI-Profile": "x"}).status_code == 403
+
+        on = p50(client, rows, ADMIN)
+        response = client.get("/api/profile", headers=ADMIN)
+        status = main.profiler.status()
+        text = response.text
+        checks["başlıklı istekler profillendi"] = status["requests"] == args.repeat and status["samples"] > 0
+        checks["katlanmış yığın biçimi"] = valid_collapsed(text)
+        checks["model çağrısı yığınlarda"] = "predict_proba" in text or "predict_components" in text
+        client.get("/api/profile?reset=true", headers=ADMIN)
+        checks["reset sonrası boş"] = client.get("/api/profile", headers=ADMIN).text == ""
+
+        client.put("/api/profile?sample=1", headers=ADMIN)
+        p50(client, rows[:20])
+        checks["sample=1 ile başlıksız istek profillenir"] = main.profiler.status()["requests"] == 20
+        client.put("/api/profile?sample=0", headers=ADMIN)
+
+    total = sum(int(line.rpartition(" ")[2]) for line in text.splitlines())
+    print(f"   {status['samples']} örnek, {status['stacks']} farklı yığın, {total} yığın örneği")
+    for line in sorted(text.splitlines(), key=lambda line: -int(line.rpartition(" ")[2]))[:3]:
+        stack, _, count = line.rpartition(" ")
+        print(f"   {count:>6}  ...;{';'.join(stack.split(';')[-3:])}")
+    print(f"   {URL} p50: profil kapalı {off:,.0f} µs, her istek profillenirken {on:,.0f} µs "
+          f"({(on / off - 1) * 100:+.1f}%)")
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
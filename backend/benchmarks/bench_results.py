@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+AssessmentTable (kayıt dizisi) bellek benchmark'ı ve doğrulaması
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_results.py --rows 1000000
+
+  1. --batch-rows hastalık assess_batch ile değerlendirilir ve --rows sonuca ulaşana kadar
+     AssessmentTable.from_batches ile birleştirilir (aynı batch tekrar kullanılır)
+  2. Örnek satırlarda table[i].to_dict() assess_risk sözlüğüyle aynı olmalıdır
+  3. --rows sonuç için tutulan bellek: AssessmentTable, LazyAssessment listesi ve hasta başına
+     ayrı sözlükler (son ikisi --sample sonuçta ölçülüp ölçeklenir)
+  4. Tüm kaynak batch'lerden table[i].to_dict() çağrıldıktan sonra tabloda kalan bellek:
+     hasta satırları istendiğinde okunur, tablo sütun kopyası biriktirmemelidir
+"""
+
+import argparse
+import sys
+import time
+import warnings
+
+import numpy as np
+
+from bench_assessment import eager, patient_frame, retained_bytes, same
+from bench_bulk import load_assessment_class
+from model.batch_assessment import AssessmentTable
+
+warnings.simplefilter("ignore")
+
+# to_dict() çağrılarından sonra tabloda kalabilecek en fazla bellek (sütun kopyası değil, önbellek kırıntısı)
+TO_DICT_RETAINED_LIMIT = 64 * 1024
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="AssessmentTable bellek benchmark")
+    parser.add_argument("--model", default="parkinson", choices=["parkinson"])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-rows", type=int, default=50_000)
+    parser.add_argument("--sample", type=int, default=100_000)
+    args = parser.parse_args()
+
+    assessment = load_assessment_class(args.model)
+    df = patient_frame(args.model, args.batch_rows, seed=20)
+    batch = assessment.assess_batch(df)
+    repeats = -(-args.rows // args.batch_rows)
+
+    table_bytes = retained_bytes(lambda: AssessmentTable.from_batches([batch] * repeats))
+    started = time.perf_counter()
+    table = AssessmentTable.from_batches([batch] * repeats)
+    print(f"   {len(table):,} sonuç, from_batches {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    checks = {
+        "seviye dizisi": bool((table.records["seviye"] == np.tile(batch.seviye, repeats)).all()),
+        "to_dict == assess_risk": all(
+            same(assessment.assess_risk(df.iloc[i % len(df)].to_dict()).to_dict(), table[i].to_dict())
+            for i in range(0, len(table), max(1, len(table) // 50))
+        ),
+    }
+
+    # Her kaynak batch'ten bir satır; dönen sözlükler atılır, yalnızca tabloda kalan ölçülür
+    to_dict_kept = retained_bytes(lambda: [table[i].to_dict() for i in range(0, len(table), args.batch_rows)] and None)
+    checks["to_dict bellek biriktirmez"] = to_dict_kept < TO_DICT_RETAINED_LIMIT
+
+    sample = min(args.sample, len(batch))
+    lazy = retained_bytes(lambda: [batch[i] for i in range(sample)]) / sample
+    dicts = retained_bytes(lambda: [eager(batch[i]) for i in range(sample)]) / sample
+    started = time.perf_counter()
+    high = int((table.records["seviye"] >= 2).sum())
+    mean_risk = float(table.records["genel_risk"].mean())
+    scan_ms = (time.perf_counter() - started) * 1000
+
+    print(f"   {'kap':<22} {'bayt/sonuç':>11} {'toplam':>11}   ({len(table):,} sonuç)")
+    for name, per_row in (
+        ("AssessmentTable", table_bytes / len(table)),
+        ("LazyAssessment", lazy),
+        ("sözlük (eski)", dicts),
+    ):
+        print(f"   {name:<22} {per_row:>11,.0f} {per_row * len(table) / 2 ** 20:>8,.0f} MB")
+    print(f"   {repeats} kaynaktan to_dict() sonrası tabloda kalan: {to_dict_kept / 1024:,.1f} KB")
+    print(f"   vektörel tarama: seviye>=2 {high:,} hasta, ortalama risk {mean_risk:.1f} ({scan_ms:.1f} ms)")
+
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kural motoru doğruluk + verim (throughput) benchmark'ı
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_rules.py --rows 100000
+
+Her hastalık için önce vektörel motorun risk_score/severity değerlerinin satır bazlı
+referans if zinciriyle birebir aynı olduğu doğrulanır, sonra satır/saniye ölçülür.
+"""
+
+import argparse
+import sys
+import time
+
+import common  # noqa: F401  (backend dizinini sys.path'e ekler)
+from common import field_bounds, random_matrix
+from reference_rules import REFERENCE_SCORERS
+
+import main
+
+
+def check_identical(model_id: str, schema, n_rows: int) -> int:
+    """Vektörel motor ile referans arasındaki uyuşmazlık sayısını döndür"""
+    names = [name for name, _, _, _ in field_bounds(schema)]
+    X = random_matrix(schema, n_rows, seed=1)
+    order = [names.index(f) for f in main.FEATURE_ORDERS[model_id]]
+    risk_scores, severities = main.SCORERS[model_id].score(X[:, order])
+
+    reference = REFERENCE_SCORERS[model_id]
+    mismatches = 0
+    for row, risk_score, severity in zip(X.tolist(), risk_scores.tolist(), severities.tolist()):
+        if reference(dict(zip(names, row))) != (risk_score, severity):
+            mismatches += 1
+    return mismatches
+
+
+def throughput(model_id: str, schema, n_rows: int) -> tuple:
+    """(referans satır/sn, vektörel satır/sn)"""
+    names = [name for name, _, _, _ in field_bounds(schema)]
+    X = random_matrix(schema, n_rows, seed=2)
+    rows = [dict(zip(names, row)) for row in X.tolist()]
+    order = [names.index(f) for f in main.FEATURE_ORDERS[model_id]]
+    X_ordered = X[:, order]
+
+    reference = REFERENCE_SCORERS[model_id]
+    start = time.perf_counter()
+    for row in rows:
+        reference(row)
+    ref_rate = n_rows / (time.perf_counter() - start)
+
+    scorer = main.SCORERS[model_id]
+    scorer.score(X_ordered[:10])  # ısınma
+    start = time.perf_counter()
+    scorer.score(X_ordered)
+    vec_rate = n_rows / (time.perf_counter() - start)
+    return ref_rate, vec_rate
+
+
+SCHEMAS = {
+    "asthma": main.AsthmaInput,
+    "diabetes": main.DiabetesInput,
+    "hypertension": main.HypertensionInput,
+    "parkinson": main.ParkinsonInput,
+    "animal_bite": main.AnimalBiteInput,
+}
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Kural motoru benchmark")
+    parser.add_argument("--rows", type=int, default=100000, help="Hastalık başına satır sayısı")
+    parser.add_argument("--check-rows", type=int, default=200000, help="Doğrulama satır sayısı")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'model':<14}{'uyuşmazlık':>12}{'referans/sn':>16}{'vektörel/sn':>16}{'hızlanma':>10}")
+    for model_id, schema in SCHEMAS.items():
+        mismatches = check_identical(model_id, schema, args.check_rows)
+        ref_rate, vec_rate = throughput(model_id, schema, args.rows)
+        failed |= mismatches > 0
+        print(f"{model_id:<14}{mismatches:>12}{ref_rate:>16,.0f}{vec_rate:>16,.0f}{vec_rate / ref_rate:>9.1f}x")
+
+    if failed:
+        print("❌ Vektörel motor referans if zinciriyle uyuşmuyor")
+        sys.exit(1)
+    print("✅ Tüm satırlar referansla birebir aynı")
+
+
+if __name__ == "__main__":
+    main_cli()
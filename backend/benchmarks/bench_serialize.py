@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Önceden kodlanmış öneri baytları ve yanıt birleştirme doğrulaması + benchmark'ı
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_serialize.py --rows 1000
+
+  1. Her (severity) / (severity, animal_type) için RECOMMENDATION_BYTES, orijinal
+     get_*_recommendations çıktısının FastAPI kodlamasıyla bayt bayt aynı olmalıdır
+  2. Tekli ve batch endpoint gövdeleri orijinal yanıt sözlüğünün kodlanmış hâliyle aynı olmalıdır
+  3. Öneri tabloları değiştirilemez olmalıdır
+Ardından batch yanıtı için sözlük + jsonable_encoder + JSONResponse yolu ile bayt birleştirme yolu karşılaştırılır.
+"""
+
+import argparse
+import sys
+import warnings
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from common import percentiles, random_rows, time_calls
+from reference_recommendations import REFERENCE_RECOMMENDATIONS
+
+import main
+
+warnings.simplefilter("ignore")
+
+SCHEMAS = {
+    "asthma": main.AsthmaInput,
+    "diabetes": main.DiabetesInput,
+    "hypertension": main.HypertensionInput,
+    "parkinson": main.ParkinsonInput,
+    "animal_bite": main.AnimalBiteInput,
+}
+
+
+def reference_recommendation(model_id: str, severity: int, row: dict) -> dict:
+    if model_id == "animal_bite":
+        return REFERENCE_RECOMMENDATIONS[model_id](severity, row["Animal_Type"])
+    return REFERENCE_RECOMMENDATIONS[model_id](severity)
+
+
+def check_bytes() -> int:
+    mismatches = 0
+    for model_id, table in main.RECOMMENDATION_BYTES.items():
+        for key, encoded in table.items():
+            args = key if isinstance(key, tuple) else (key,)
+            mismatches += encoded != main.encode_json(REFERENCE_RECOMMENDATIONS[model_id](*args))
+    return mismatches
+
+
+def check_bodies(client, model_id: str, rows: list) -> int:
+    features = main.FEATURE_ORDERS[model_id]
+    schema = SCHEMAS[model_id]
+    predictions = main.score_rows(model_id, main.rows_to_matrix([schema(**r) for r in rows], features))
+    mismatches = 0
+    batch = client.post(f"/api/predict/{model_id}/batch", json=rows)
+    ensembles = [result["ensemble"] for result in batch.json()["results"]]
+    expected_batch = {"success": True, "count": len(rows), "results": []}
+    for row, prediction, ensemble in zip(rows, predictions, ensembles):
+        recommendation = reference_recommendation(model_id, prediction["severity"], row)
+        single = client.post(f"/api/predict/{model_id}", json=row)
+        mismatches += single.content != main.encode_json({
+            "success": True, "prediction": prediction, "recommendations": recommendation,
+            "ensemble": single.json()["ensemble"]
+        })
+        expected_batch["results"].append(
+            {"prediction": prediction, "recommendations": recommendation, "ensemble": ensemble}
+        )
+    mismatches += batch.content != main.encode_json(expected_batch)
+    return mismatches
+
+
+def check_frozen() -> bool:
+    rec = main.get_asthma_recommendations(2)
+    for mutate in (lambda: rec.__setitem__("doctor", "x"), lambda: rec["lifestyle"].append("x")):
+        try:
+            mutate()
+        except (TypeError, AttributeError):
+            continue
+        return False
+    return True
+
+
+def bench(model_id: str, n_rows: int):
+    schema = SCHEMAS[model_id]
+    X = main.rows_to_matrix([schema(**r) for r in random_rows(schema, n_rows, seed=13)], main.FEATURE_ORDERS[model_id])
+    predictions = main.score_rows(model_id, X)
+    ensembles = [None] * n_rows
+    response = main.Response()
+    table = main.RECOMMENDATION_BYTES[model_id]
+    reference = REFERENCE_RECOMMENDATIONS[model_id]
+
+    def dict_path():
+        content = {
+            "success": True, "count": n_rows,
+            "results": [
+                {"prediction": p, "recommendations": reference(p["severity"]), "ensemble": e}
+                for p, e in zip(predictions, ensembles)
+            ]
+        }
+        return JSONResponse(jsonable_encoder(content)).body
+
+    def bytes_path():
+        return main.batch_response(response, predictions, [table[p["severity"]] for p in predictions], ensembles).body
+
+    assert dict_path() == bytes_path()
+    old = percentiles(time_calls(dict_path, 30))
+    new = percentiles(time_calls(bytes_path, 30))
+    print(f"   {n_rows} satırlık batch yanıtı: sözlük yolu p50 {old['p50_us'] / 1000:.2f} ms, "
+          f"bayt birleştirme p50 {new['p50_us'] / 1000:.2f} ms ({old['p50_us'] / new['p50_us']:.1f}x)")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Öneri baytları doğrulama ve benchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+
+    client = TestClient(main.app)
+    checks = {"öneri baytları": check_bytes() == 0, "değiştirilemezlik": check_frozen()}
+    for model_id, schema in SCHEMAS.items():
+        checks[f"{model_id} gövdeleri"] = check_bodies(client, model_id, random_rows(schema, 60, seed=14)) == 0
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    bench("parkinson", args.rows)
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Aşama süresi metrikleri: döküm, /api/metrics doğrulaması ve örnekleme maliyeti
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_stages.py --repeat 300
+
+  1. Örnekleme açıkken (oran 1) her tahmin endpoint'i ve model/*/assessment.py sınıfı çağrılır;
+     model/rota başına aşama süreleri (ortalama ms) yazdırılır
+  2. /api/metrics Prometheus metin biçiminde olmalı: her seri için kümülatif bucket'lar,
+     +Inf bucket'ı == _count
+  3. Örnekleme kapalıyken ölçüm noktası başına maliyet (lap / timer / stage_timer, ns) ve
+     kapalı-açık tek satır endpoint gecikmesi (p50) karşılaştırılır
+"""
+
+import argparse
+import os
+import sys
+import timeit
+import warnings
+from collections import defaultdict
+
+os.environ.setdefault("HEALTHAI_CACHE_MB", "0")
+
+from fastapi.testclient import TestClient
+
+from common import percentiles, random_rows, time_calls
+
+import main
+import metrics
+from bench_assessment import patient_frame
+from bench_bulk import load_assessment_class
+from bench_suite import has_model_files, quiet
+from model.batch_assessment import install_stage_timer, stage_timer
+from registry import MODEL_DIRS
+
+warnings.simplefilter("ignore")
+
+
+def parse_metrics(text: str) -> dict:
+    """healthai_stage_seconds serileri: etiketler -> {"buckets": [(le, n)], "count": n}"""
+    series = defaultdict(lambda: {"buckets": [], "count": None})
+    for line in text.splitlines():
+        if not line.startswith("healthai_stage_seconds"):
+            continue
+        name_labels, value = line.rsplit(" ", 1)
+        name, _, labels = name_labels.partition("{")
+        labels = labels.rstrip("}")
+        if name.endswith("_bucket"):
+            labels, _, le = labels.rpartition(',le="')
+            series[labels]["buckets"].append((le.rstrip('"'), int(value)))
+        elif name.endswith("_count"):
+            series[labels]["count"] = int(value)
+    return series
+
+
+def valid_series(series: dict) -> bool:
+    counts = [n for _, n in series["buckets"]]
+    return (
+        bool(counts) and series["buckets"][-1][0] == "+Inf" and counts[-1] == series["count"]
+        and counts == sorted(counts)
+    )
+
+
+def run_api(client: TestClient, repeat: int) -> dict:
+    """Model başına tek satır p50 (µs)"""
+    p50 = {}
+    for model_id, schema in main.INPUT_SCHEMAS.items():
+        url = f"/api/predict/{model_id}"
+        bodies = iter(random_rows(schema, repeat, seed=22))
+        p50[model_id] = percentiles(time_calls(lambda: client.post(url, json=next(bodies)), repeat))["p50_us"]
+        client.post(f"{url}/batch", json=random_rows(schema, 200, seed=23))
+    return p50
+
+
+def run_assessments(repeat: int):
+    for model_id in MODEL_DIRS:
+        if not has_model_files(model_id):
+            continue
+        assessment = quiet(load_assessment_class, model_id)
+        df = patient_frame(model_id, repeat, seed=24)
+        for row in df.head(50).to_dict("records"):
+            assessment.assess_risk(row)
+        assessment.assess_batch(df)
+
+
+def off_cost_ns(n: int = 1_000_000) -> dict:
+    """Örnekleme kapalıyken ölçüm noktası başına süre (ns)"""
+    calls = {
+        "lap()": lambda: metrics.lap("rules"),
+        "timer()": lambda: metrics.timer("parkinson", "predict"),
+        "stage_timer().lap()": lambda: stage_timer("parkinson", "assess_risk").lap("scaler"),
+    }
+    empty = min(timeit.repeat(lambda: None, number=n, repeat=3))
+    return {name: (min(timeit.repeat(call, number=n, repeat=3)) - empty) / n * 1e9 for name, call in calls.items()}
+
+
+def print_summary():
+    summary = metrics.STAGES.summary()
+    print(f"   {'model':<13} {'rota':<14} {'aşama':<18} {'sayı':>6} {'ort. ms':>9}")
+    for (model, route, stage), (count, mean_ms) in sorted(summary.items()):
+        print(f"   {model:<13} {route:<14} {stage:<18} {count:>6} {mean_ms:>9.3f}")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Aşama süresi metrikleri benchmark")
+    parser.add_argument("--repeat", type=int, default=300)
+    args = parser.parse_args()
+
+    checks = {}
+    with TestClient(main.app) as client:
+        metrics.set_sample_rate(0)
+        install_stage_timer(metrics.timer)
+        cost = off_cost_ns()
+        run_api(client, 20)  # ısınma
+        off = run_api(client, args.repeat)
+        checks["kapalıyken kayıt yok"] = not metrics.STAGES.summary()
+
+        metrics.set_sample_rate(1)
+        on = run_api(client, args.repeat)
+        run_assessments(args.repeat)
+        print_summary()
+
+        response = client.get("/api/metrics")
+        series = parse_metrics(response.text)
+        checks["/api/metrics text/plain"] = response.headers["content-type"].startswith("text/plain")
+        checks["/api/metrics serileri geçerli"] = bool(series) and all(map(valid_series, series.values()))
+        checks["her endpoint için total"] = all(
+            f'model="{model_id}",route="{route}",stage="total"' in series
+            for model_id in main.INPUT_SCHEMAS for route in ("single", "batch")
+        )
+        metrics.set_sample_rate(0)
+        install_stage_timer(None)
+
+    for name, ns in cost.items():
+        print(f"   kapalıyken {name:<20} {ns:>6.0f} ns")
+    print(f"   {'model':<13} {'kapalı p50':>11} {'açık p50':>11}")
+    for model_id in off:
+        print(f"   {model_id:<13} {off[model_id]:>9.0f}µs {on[model_id]:>9.0f}µs "
+              f"({(on[model_id] / off[model_id] - 1) * 100:+.1f}%)")
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
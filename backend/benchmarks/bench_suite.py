@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gecikme benchmark paketi: soğuk başlangıç, model yükleme, tek satır gecikmesi ve batch verimi
+
+Kullanım:
+    cd backend
+    python benchmarks/bench_suite.py                              # ölç, baseline ile karşılaştır
+    python benchmarks/bench_suite.py --out sonuc.json             # sonuçları JSON olarak da yaz
+    python benchmarks/bench_suite.py --save-baseline              # baseline.json'u güncelle
+
+Ölçülenler (hepsi süreç içinde, ağ yok; tahmin önbelleği kapalı):
+  - cold_start.*      : "import main" ve uygulama açılışı + ilk tahmin yanıtı (ayrı süreçte; pickle ve
+                        model_store.py ile dönüştürülmüşse mmap biçimi)
+  - import_time.*     : "python -X importtime -c 'import main'" toplamı ve en pahalı üst düzey paketler;
+                        NumPy hızlı yolunda pandas/sklearn/scipy yüklenmemiş olmalı
+  - model_load.*      : BaseRiskAssessment ve model/<hastalık>/assessment.py sınıfının yüklenmesi
+                        (ısınmış süreçte; sklearn import süresi cold_start.first_response_ms içinde)
+  - assess_risk.*     : her *RiskAssessment.assess_risk için tek hasta p50/p95/p99
+  - assess_batch.*    : assess_batch satır/sn
+  - api.*             : her POST /api/predict/<model> için tek hasta p50/p95/p99 (ASGI istemcisi)
+  - api_batch.*       : her POST /api/predict/<model>/batch için satır/sn
+
+Soğuk başlangıç metrikleri COLD_START_TARGETS hedefleriyle de karşılaştırılır; hedef aşılırsa veya
+"import main" ağır bir paketi yüklerse çıkış kodu 1 olur (--no-targets ile kapatılır).
+
+Süreç içi ölçümler --rounds kez tekrarlanır ve her metriğin en iyi değeri alınır (gürültüyü azaltır).
+Sonuçlar {"meta": ..., "metrics": {ad: {"value", "unit", "better"}}} biçimindedir. Baseline'daki
+bir metrik --tolerance oranından (p95/p99 için --tail-tolerance) fazla kötüleşmişse regresyon olarak
+işaretlenir ve çıkış kodu 1 olur. Baseline makineye özgüdür; farklı donanımda önce --save-baseline
+ile yeniden üretin. Ölçüm parametreleri (RUN_PARAMS) meta'ya yazılır; baseline'dan farklı
+parametrelerle yapılan çalıştırma karşılaştırılmaz (verim --batch-rows ile %50'den fazla değişir).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import warnings
+
+os.environ.setdefault("HEALTHAI_CACHE_MB", "0")
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from common import BACKEND_DIR, percentiles, random_rows, time_calls
+
+import main
+from bench_assessment import patient_frame
+from bench_bulk import load_assessment_class
+from registry import MODEL_DIRS, model_path
+
+warnings.simplefilter("ignore")
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+FIRST_RESPONSE = (
+    "import json, sys\n"
+    "from fastapi.testclient import TestClient\n"
+    "import main\n"
+    "with TestClient(main.app) as client:\n"
+    "    assert client.post('/api/predict/parkinson', json=json.loads(sys.argv[1])).status_code == 200\n"
+)
+
+# Ayrı süreçte çalıştırılan soğuk başlangıç senaryoları (cwd: backend/): ad -> (kod, ortam değişkenleri)
+COLD_START = {
+    "import_main_ms": ("import main", {}),
+    "first_response_ms": (FIRST_RESPONSE, {}),
+    "first_response_mmap_ms": (FIRST_RESPONSE, {"HEALTHAI_MODEL_FORMAT": "mmap"}),
+}
+
+# Soğuk başlangıç hedefleri, ms (1 CPU referans makinesi). Pickle biçiminde sklearn importu
+# (~1.3 sn, pandas'ı da yükler) ilk model yüklenirken ödenir; mmap biçiminde hiç ödenmez.
+# Ölçülen değerler (6 çalıştırma): import 0.8-1.1 sn, ilk yanıt 2.2-2.8 sn (pickle) ve 1.0-1.3 sn
+# (mmap); süreç başlatma gürültüsüne karşı hedefler tipik değerin ~%40 üstündedir. import_main
+# hedefi, ertelenmiş importlar öncesindeki değerdir (~1.5 sn): pandas/sklearn yeniden üst düzeye
+# taşınırsa aşılır.
+COLD_START_TARGETS = {
+    "cold_start.import_main_ms": 1400,
+    "cold_start.first_response_ms": 3800,
+    "cold_start.first_response_mmap_ms": 1700,
+}
+
+# "import main" sonrasında yüklenmemesi gereken paketler
+HEAVY_MODULES = ("pandas", "sklearn", "scipy")
+IMPORT_REPORT_TOP = 8
+
+# Sonuçları etkileyen ve baseline ile aynı olması gereken argümanlar
+RUN_PARAMS = ("repeat", "batch_rows", "rounds", "cold_runs")
+
+
+class Results:
+    def __init__(self):
+        self.metrics = {}
+        self.skipped = []
+
+    def add(self, name: str, value: float, unit: str, better: str = "lower"):
+        self.metrics[name] = {"value": round(float(value), 2), "unit": unit, "better": better}
+
+    def add_percentiles(self, prefix: str, samples: list):
+        for key, value in percentiles(samples).items():
+            self.add(f"{prefix}.{key}", value, "us")
+
+    def keep_best(self, other: "Results"):
+        """Turlar arasında her metriğin en iyisini tut"""
+        for name, metric in other.metrics.items():
+            mine = self.metrics.get(name)
+            if mine is None:
+                self.metrics[name] = metric
+                continue
+            pick = min if metric["better"] == "lower" else max
+            mine["value"] = pick(mine["value"], metric["value"])
+        self.skipped = other.skipped
+
+    def to_json(self, params: dict) -> dict:
+        return {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "params": params,
+                "skipped": self.skipped,
+            },
+            "metrics": self.metrics,
+        }
+
+
+def has_model_files(model_id: str) -> bool:
+    return all(os.path.exists(os.path.join(model_path(model_id), f"m{i}.pkl")) for i in (1, 2, 3))
+
+
+def quiet(fn, *args):
+    """Yükleme mesajlarını (print) bastırarak çağır"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args)
+
+
+def timed(fn, *args) -> tuple:
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def has_flat_files(model_id: str) -> bool:
+    return os.path.exists(os.path.join(model_path(model_id), "flat", "meta.json"))
+
+
+def measure_cold_start(results: Results, runs: int):
+    row = json.dumps(random_rows(main.ParkinsonInput, 1, seed=1)[0])
+    for name, (code, env) in COLD_START.items():
+        if env.get("HEALTHAI_MODEL_FORMAT") == "mmap" and not has_flat_files("parkinson"):
+            results.skipped.append(f"cold_start.{name}: düz model yok (python model_store.py)")
+            continue
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code, row], cwd=BACKEND_DIR, check=True,
+                           env=dict(os.environ, **env), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            samples.append((time.perf_counter() - started) * 1000)
+        results.add(f"cold_start.{name}", np.median(samples), "ms")
+
+
+def import_report(runs: int) -> tuple:
+    """-X importtime ile "import main": (toplam ms, kök paket -> kümülatif ms, yüklenen ağır paketler)
+
+    Bir kök paketin (fastapi, numpy, ...) süresi en dıştaki import satırının kümülatif süresidir;
+    iç içe paketler üst paketin süresinde de sayılır. Her değer için en hızlı çalıştırma alınır.
+    """
+    code = f"import main, sys; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    total, packages, heavy = None, {}, set()
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=BACKEND_DIR, check=True,
+                              capture_output=True, text=True)
+        heavy.update(filter(None, proc.stdout.strip().split(",")))
+        run_total, roots = 0.0, {}
+        for line in proc.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if not cumulative.strip().isdigit():  # başlık satırı
+                continue
+            ms = int(cumulative) / 1000
+            root = name.strip().partition(".")[0]
+            if not name.startswith("   "):  # üst düzey import
+                run_total += ms
+            if root != "main":
+                roots[root] = max(roots.get(root, 0.0), ms)
+        total = run_total if total is None else min(total, run_total)
+        for root, ms in roots.items():
+            packages[root] = min(packages.get(root, ms), ms)
+    return total, packages, sorted(heavy)
+
+
+def measure_import_time(results: Results, runs: int) -> list:
+    total, packages, heavy = import_report(runs)
+    results.add("import_time.total_ms", total, "ms")
+    print(f"   {'paket':<24} {'kümülatif ms':>12}   (python -X importtime -c 'import main')")
+    for package, ms in sorted(packages.items(), key=lambda item: -item[1])[:IMPORT_REPORT_TOP]:
+        print(f"   {package:<24} {ms:>12,.1f}")
+    return heavy
+
+
+def check_targets(current: dict, heavy: list) -> list:
+    """Hedefi aşan soğuk başlangıç metrikleri ve "import main" ile yüklenen ağır paketler"""
+    failures = []
+    for name, target in COLD_START_TARGETS.items():
+        metric = current["metrics"].get(name)
+        if metric is not None and metric["value"] > target:
+            failures.append(f"{name} {metric['value']:,.0f} ms > hedef {target:,} ms")
+    if heavy:
+        failures.append(f"'import main' ağır paket yükledi: {', '.join(heavy)}")
+    return failures
+
+
+def measure_assessments(results: Results, repeat: int, batch_rows: int):
+    for model_id in MODEL_DIRS:
+        if not has_model_files(model_id):
+            results.skipped.append(f"{model_id}: model dosyaları yok (model_load, assess_risk, assess_batch)")
+            continue
+        quiet(main.load_assessment, model_id)  # sklearn importu cold_start'a ait, burada ölçülmez
+        _, ms = timed(quiet, main.load_assessment, model_id)
+        results.add(f"model_load.{model_id}.backend_ms", ms, "ms")
+        assessment, ms = timed(quiet, load_assessment_class, model_id)
+        results.add(f"model_load.{model_id}.assessment_ms", ms, "ms")
+
+        df = patient_frame(model_id, max(repeat, batch_rows), seed=21)
+        rows = iter(df.head(repeat).to_dict("records"))
+        results.add_percentiles(f"assess_risk.{model_id}",
+                                time_calls(lambda: assessment.assess_risk(next(rows)), repeat))
+        samples = time_calls(lambda: assessment.assess_batch(df.head(batch_rows)), 3)
+        results.add(f"assess_batch.{model_id}.rows_per_s", batch_rows / min(samples), "rows/s", "higher")
+
+
+def measure_api(results: Results, repeat: int, batch_rows: int):
+    with TestClient(main.app) as client:
+        for model_id, schema in main.INPUT_SCHEMAS.items():
+            url = f"/api/predict/{model_id}"
+            rows = random_rows(schema, repeat + 20, seed=22)
+            for row in rows[:20]:  # ısınma
+                client.post(url, json=row)
+            bodies = iter(rows[20:])
+            results.add_percentiles(f"api.{model_id}", time_calls(lambda: client.post(url, json=next(bodies)), repeat))
+
+            body = json.dumps(random_rows(schema, batch_rows, seed=23)).encode()
+            headers = {"Content-Type": "application/json"}
+            samples = time_calls(lambda: client.post(f"{url}/batch", content=body, headers=headers), 5)
+            results.add(f"api_batch.{model_id}.rows_per_s", batch_rows / min(samples), "rows/s", "higher")
+
+
+def is_tail(name: str) -> bool:
+    return name.endswith((".p95_us", ".p99_us"))
+
+
+def compare(current: dict, baseline: dict, tolerance: float, tail_tolerance: float) -> list:
+    """Baseline'a göre izin verilenden fazla kötüleşen metrikler: (ad, baseline, şimdi, değişim)"""
+    regressions = []
+    for name, base in baseline["metrics"].items():
+        now = current["metrics"].get(name)
+        if now is None or not base["value"]:
+            continue
+        change = now["value"] / base["value"] - 1
+        limit = tail_tolerance if is_tail(name) else tolerance
+        worse = change > limit if base["better"] == "lower" else change < -limit
+        if worse:
+            regressions.append((name, base["value"], now["value"], change))
+    return regressions
+
+
+def param_mismatch(current: dict, baseline: dict) -> list:
+    """Baseline'dan farklı ölçüm parametreleri: "ad: baseline -> şimdi" (eski baseline'da hepsi)"""
+    base = baseline["meta"].get("params") or {}
+    now = current["meta"]["params"]
+    return [f"{name}: {base.get(name, '?')} -> {now[name]}" for name in RUN_PARAMS if base.get(name) != now[name]]
+
+
+def print_results(current: dict, baseline: dict):
+    base_metrics = baseline["metrics"] if baseline else {}
+    print(f"   {'metrik':<44} {'değer':>12} {'birim':<7} {'baseline':>12} {'değişim':>8}")
+    for name, metric in current["metrics"].items():
+        base = base_metrics.get(name)
+        change = f"{(metric['value'] / base['value'] - 1) * 100:+.0f}%" if base and base["value"] else ""
+        base_value = f"{base['value']:,.2f}" if base else "-"
+        print(f"   {name:<44} {metric['value']:>12,.2f} {metric['unit']:<7} {base_value:>12} {change:>8}")
+    for note in current["meta"]["skipped"]:
+        print(f"   ⚠️ atlandı: {note}")
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="HealthAI gecikme benchmark paketi")
+    parser.add_argument("--repeat", type=int, default=200, help="Tek satır ölçüm sayısı")
+    parser.add_argument("--batch-rows", type=int, default=1000)
+    parser.add_argument("--cold-runs", type=int, default=3, help="Soğuk başlangıç tekrar sayısı (medyan)")
+    parser.add_argument("--rounds", type=int, default=3, help="Süreç içi ölçüm turu (en iyi değer alınır)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="İzin verilen kötüleşme oranı")
+    parser.add_argument("--tail-tolerance", type=float, default=1.0, help="p95/p99 için izin verilen kötüleşme")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--out", help="Sonuç JSON dosyası")
+    parser.add_argument("--save-baseline", action="store_true", help="Sonuçları baseline olarak kaydet")
+    parser.add_argument("--no-targets", action="store_true", help="Soğuk başlangıç hedeflerini kontrol etme")
+    args = parser.parse_args()
+
+    results = Results()
+    print("🔄 Soğuk başlangıç...")
+    measure_cold_start(results, args.cold_runs)
+    heavy = measure_import_time(results, args.cold_runs)
+    for round_no in range(1, args.rounds + 1):
+        print(f"🔄 Tur {round_no}/{args.rounds}: model yükleme, assess_risk / assess_batch, API endpoint'leri...")
+        round_results = Results()
+        measure_assessments(round_results, args.repeat, args.batch_rows)
+        quiet(measure_api, round_results, args.repeat, args.batch_rows)
+        results.keep_best(round_results)
+    current = results.to_json({name: getattr(args, name) for name in RUN_PARAMS})
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_results(current, baseline)
+
+    failures = [] if args.no_targets else check_targets(current, heavy)
+    for failure in failures:
+        print(f"❌ Soğuk başlangıç hedefi: {failure}")
+    if not failures and not args.no_targets:
+        print("✅ Soğuk başlangıç hedefleri karşılandı")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+        print(f"📦 Sonuçlar yazıldı: {args.out}")
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2, ensure_ascii=False)
+        print(f"📦 Baseline güncellendi: {args.baseline}")
+        sys.exit(1 if failures else 0)
+    if baseline is None:
+        print("⚠️ Baseline yok: --save-baseline ile oluşturun")
+        sys.exit(1 if failures else 0)
+
+    mismatch = param_mismatch(current, baseline)
+    if mismatch:
+        print(f"❌ Baseline farklı parametrelerle ölçülmüş, karşılaştırılmadı ({', '.join(mismatch)}); "
+              f"aynı parametrelerle çalıştırın veya --save-baseline ile yeniden üretin")
+        sys.exit(1)
+
+    regressions = compare(current, baseline, args.tolerance, args.tail_tolerance)
+    for name, base, now, change in regressions:
+        print(f"❌ Regresyon: {name} {base:,.2f} -> {now:,.2f} ({change * 100:+.0f}%)")
+    if regressions or failures:
+        sys.exit(1)
+    print(f"✅ Baseline'a göre regresyon yok (tolerans %{args.tolerance * 100:.0f}, "
+          f"p95/p99 %{args.tail_tolerance * 100:.0f})")
+
+
+if __name__ == "__main__":
+    main_cli()
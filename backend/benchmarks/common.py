@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark yardımcıları
+Pydantic şemalarındaki ge/le sınırlarından rastgele (sınır değerleri de içeren) hasta verisi üretir.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# model paketi (model.batch_assessment, model.<hastalık>.assessment) depo kökünden içe aktarılır
+REPO_DIR = os.path.dirname(BACKEND_DIR)
+if REPO_DIR not in sys.path:
+    sys.path.append(REPO_DIR)
+
+
+def field_bounds(schema) -> list:
+    """Şema alanlarını (ad, alt sınır, üst sınır, tamsayı mı) listesi olarak döndür"""
+    bounds = []
+    for name, field in schema.model_fields.items():
+        lo = hi = None
+        for constraint in field.metadata:
+            if getattr(constraint, "ge", None) is not None:
+                lo = constraint.ge
+            if getattr(constraint, "le", None) is not None:
+                hi = constraint.le
+        bounds.append((name, lo, hi, field.annotation is int))
+    return bounds
+
+
+def random_matrix(schema, n_rows: int, seed: int = 0) -> np.ndarray:
+    """Şema sırasına göre rastgele hasta matrisi üret
+
+    Ondalık alanların yarısı 0.5 adımlarına yuvarlanır; böylece kural eşikleri
+    (örn. BMI=30, FEV1=2.5) tam olarak da örneklenir.
+    """
+    rng = np.random.default_rng(seed)
+    columns = []
+    for _, lo, hi, is_int in field_bounds(schema):
+        if is_int:
+            col = rng.integers(int(lo), int(hi) + 1, size=n_rows).astype(np.float64)
+        else:
+            col = rng.uniform(lo, hi, size=n_rows)
+            snap = rng.random(n_rows) < 0.5
+            col[snap] = np.clip(np.round(col[snap] * 2) / 2, lo, hi)
+        columns.append(col)
+    return np.column_stack(columns)
+
+
+def random_rows(schema, n_rows: int, seed: int = 0) -> list:
+    """random_matrix çıktısını JSON'a uygun sözlük listesine çevir"""
+    bounds = field_bounds(schema)
+    X = random_matrix(schema, n_rows, seed)
+    return [
+        {name: (int(v) if is_int else float(v)) for (name, _, _, is_int), v in zip(bounds, row)}
+        for row in X.tolist()
+    ]
+
+
+def percentiles(samples: list) -> dict:
+    """Süre örneklerinden (saniye) p50/p95/p99 değerlerini mikrosaniye olarak hesapla"""
+    arr = np.asarray(samples) * 1e6
+    return {
+        "p50_us": round(float(np.percentile(arr, 50)), 2),
+        "p95_us": round(float(np.percentile(arr, 95)), 2),
+        "p99_us": round(float(np.percentile(arr, 99)), 2),
+    }
+
+
+def time_calls(fn, repeat: int) -> list:
+    """fn() çağrısını repeat kez ölç, her çağrının süresini saniye olarak döndür"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
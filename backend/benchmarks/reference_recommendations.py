@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Referans öneri fonksiyonları
+Her çağrıda sözlüğü yeniden kuran orijinal get_*_recommendations fonksiyonlarının birebir
+kopyası; önceden serileştirilmiş öneri baytlarının aynı JSON'u ürettiğini doğrulamak için kullanılır.
+"""
+
+
+def get_asthma_recommendations(severity: int) -> dict:
+    recommendations = {
+        0: {
+            "doctor": "Yıllık kontrol yeterli",
+            "treatment": "Önleyici tedbirler",
+            "lifestyle": ["Düzenli egzersiz", "Tetikleyicilerden kaçının", "Dengeli beslenme"],
+            "urgency": "Düşük"
+        },
+        1: {
+            "doctor": "6 ay içinde kontrol",
+            "treatment": "Takip ve önleyici tedbirler",
+            "lifestyle": ["Peak flow takibi", "Acil durum planı hazırlayın", "Düzenli kontrol"],
+            "urgency": "Orta"
+        },
+        2: {
+            "doctor": "3 ay içinde göğüs hastalıkları uzmanı",
+            "treatment": "İnhaler kortikosteroid tedavisi",
+            "lifestyle": ["İlaç tedavisi", "Tetikleyicilerden MUTLAKA kaçının", "Günlük semptom takibi"],
+            "urgency": "Yüksek"
+        },
+        3: {
+            "doctor": "HEMEN göğüs hastalıkları uzmanına başvurun",
+            "treatment": "Yoğun ilaç tedavisi + Acil eylem planı",
+            "lifestyle": ["Acil eylem planı EDİNİN", "Günlük peak flow takibi", "Kurtarıcı ilaç yanınızda"],
+            "urgency": "ÇOK YÜKSEK - ACİL"
+        }
+    }
+    return recommendations.get(severity, recommendations[0])
+
+
+def get_diabetes_recommendations(severity: int) -> dict:
+    recommendations = {
+        0: {
+            "doctor": "Yıllık check-up",
+            "treatment": "Sağlıklı yaşam tarzı",
+            "lifestyle": ["Dengeli beslenme", "Düzenli egzersiz", "Yılda bir açlık kan şekeri"],
+            "urgency": "Düşük"
+        },
+        1: {
+            "doctor": "6 ay içinde check-up",
+            "treatment": "Yaşam tarzı değişiklikleri",
+            "lifestyle": ["%5-7 kilo verme", "Günde 30 dk yürüyüş", "Şekerli içeceklerden kaçının"],
+            "urgency": "Orta"
+        },
+        2: {
+            "doctor": "1-2 ay içinde endokrinoloji",
+            "treatment": "Metformin + Yaşam tarzı değişikliği",
+            "lifestyle": ["HbA1c takibi", "Diyetisyen danışmanlığı", "Evde kan şekeri ölçümü"],
+            "urgency": "Yüksek"
+        },
+        3: {
+            "doctor": "HEMEN endokrinoloji uzmanına",
+            "treatment": "Yoğun ilaç tedavisi + İnsülin değerlendirmesi",
+            "lifestyle": ["Günde 2-3 kez kan şekeri ölçümü", "Diyabet diyeti BAŞLAYIN", "Komplikasyon taraması"],
+            "urgency": "ÇOK YÜKSEK"
+        }
+    }
+    return recommendations.get(severity, recommendations[0])
+
+
+def get_hypertension_recommendations(severity: int) -> dict:
+    recommendations = {
+        0: {
+            "doctor": "Yıllık tansiyon kontrolü",
+            "treatment": "Önleyici yaşam tarzı",
+            "lifestyle": ["Düşük tuzlu beslenme", "Düzenli egzersiz", "Stres yönetimi"],
+            "urgency": "Düşük"
+        },
+        1: {
+            "doctor": "3-6 ay içinde kardiyoloji",
+            "treatment": "DASH diyeti + Yaşam tarzı değişikliği",
+            "lifestyle": ["Günlük tuz <6g", "Evde tansiyon takibi", "%5-10 kilo verme"],
+            "urgency": "Orta"
+        },
+        2: {
+            "doctor": "1-2 ay içinde kardiyoloji",
+            "treatment": "Antihipertansif ilaç tedavisi",
+            "lifestyle": ["Günlük tuz <5g", "Günde 2 kez tansiyon ölçümü", "Sigarayı BIRAKIN"],
+            "urgency": "Yüksek"
+        },
+        3: {
+            "doctor": "HEMEN kardiyoloji uzmanına",
+            "treatment": "Kombine antihipertansif + Hedef organ koruması",
+            "lifestyle": ["Acil ilaç optimizasyonu", "Hedef organ hasarı taraması", "Haftalık kontrol"],
+            "urgency": "ÇOK YÜKSEK - ACİL"
+        }
+    }
+    return recommendations.get(severity, recommendations[0])
+
+
+def get_parkinson_recommendations(severity: int) -> dict:
+    recommendations = {
+        0: {
+            "doctor": "Yıllık nöroloji kontrolü",
+            "treatment": "Önleyici yaşam tarzı",
+            "lifestyle": ["Düzenli egzersiz", "Zihinsel aktiviteler", "Dengeli beslenme"],
+            "urgency": "Düşük"
+        },
+        1: {
+            "doctor": "1-2 ay içinde nöroloji",
+            "treatment": "Levodopa/Dopamin agonistleri değerlendirmesi",
+            "lifestyle": ["Fizik tedavi başlatın", "Denge egzersizleri", "3 ayda bir kontrol"],
+            "urgency": "Orta"
+        },
+        2: {
+            "doctor": "1-2 hafta içinde ACİL nöroloji",
+            "treatment": "Kombine ilaç tedavisi + Yoğun rehabilitasyon",
+            "lifestyle": ["Aylık kontrol ZORUNLU", "Konuşma terapisi", "Ergoterapi"],
+            "urgency": "Yüksek"
+        },
+        3: {
+            "doctor": "HEMEN hareket bozuklukları merkezi",
+            "treatment": "DBS cerrahisi değerlendirmesi + Maksimum ilaç",
+            "lifestyle": ["Haftalık kontrol", "Evde bakım hizmetleri", "Bakıcı eğitimi"],
+            "urgency": "ÇOK YÜKSEK - ACİL"
+        }
+    }
+    return recommendations.get(severity, recommendations[0])
+
+
+def get_animal_bite_recommendations(severity: int, animal_type: int) -> dict:
+    animal_names = {0: "Yılan", 1: "Köpek", 2: "Arı", 3: "Akrep", 4: "Kedi"}
+    animal = animal_names.get(animal_type, "Bilinmeyen")
+    
+    base_recommendations = {
+        0: {
+            "doctor": "24 saat içinde kontrol",
+            "treatment": "Evde gözlem + İlk yardım",
+            "lifestyle": ["Yarayı temiz tutun", "Enfeksiyon belirtilerini izleyin", "Tetanos kontrolü"],
+            "urgency": "Düşük"
+        },
+        1: {
+            "doctor": "12 saat içinde sağlık kuruluşuna",
+            "treatment": "Antibiyotik + Aşı değerlendirmesi",
+            "lifestyle": ["Yarayı sabunlu suyla yıkayın", "Hareket etmeyin", "Bölgeyi yüksekte tutun"],
+            "urgency": "Orta"
+        },
+        2: {
+            "doctor": "HEMEN acil servise",
+            "treatment": "Antivenom/Antiserum değerlendirmesi",
+            "lifestyle": ["112'yi arayın", "Hareket etmeyin", "Isırılan bölgeyi kalp altında tutun"],
+            "urgency": "Yüksek"
+        },
+        3: {
+            "doctor": "112 ARAYIN - ACİL",
+            "treatment": "Acil antivenom + Yoğun bakım",
+            "lifestyle": ["Kesinlikle hareket etmeyin", "Turnike YAPMAYIN", "Zehir emmeye ÇALIŞMAYIN"],
+            "urgency": "ACİL - HAYAT TEHLİKESİ"
+        }
+    }
+    
+    rec = base_recommendations.get(severity, base_recommendations[0])
+    rec["animal"] = animal
+    
+    # Animal-specific additions
+    if animal_type == 0:  # Snake
+        rec["special"] = "Antivenom ilk 4-6 saatte kritik!"
+    elif animal_type == 1:  # Dog
+        rec["special"] = "Kuduz aşısı değerlendirmesi gerekli"
+    elif animal_type == 2:  # Bee
+        rec["special"] = "Anafilaksi riski - EpiPen hazır tutun"
+    elif animal_type == 3:  # Scorpion
+        rec["special"] = "Çocuklarda çok tehlikeli!"
+    elif animal_type == 4:  # Cat
+        rec["special"] = "Enfeksiyon riski %30-50"
+    
+    return rec
+
+
+REFERENCE_RECOMMENDATIONS = {
+    "asthma": get_asthma_recommendations,
+    "diabetes": get_diabetes_recommendations,
+    "hypertension": get_hypertension_recommendations,
+    "parkinson": get_parkinson_recommendations,
+    "animal_bite": get_animal_bite_recommendations,
+}
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Referans kural skorlayıcıları
+Tahmin endpoint'lerinin satır bazlı if zincirlerinin birebir kopyası; vektörel
+motorun (rules.py) aynı risk_score/severity değerlerini ürettiğini doğrulamak için kullanılır.
+"""
+
+
+def asthma(d: dict) -> tuple:
+    risk_score = 0
+    if d['Smoking'] == 1: risk_score += 15
+    if d['FamilyHistoryAsthma'] == 1: risk_score += 12
+    if d['HistoryOfAllergies'] == 1: risk_score += 10
+    if d['Wheezing'] == 1: risk_score += 18
+    if d['ShortnessOfBreath'] == 1: risk_score += 15
+    if d['DustExposure'] > 6: risk_score += 10
+    if d['PollenExposure'] > 6: risk_score += 8
+    if d['LungFunctionFEV1'] < 2.5: risk_score += 12
+    risk_score = min(risk_score, 100)
+
+    if risk_score < 20: severity = 0
+    elif risk_score < 40: severity = 1
+    elif risk_score < 65: severity = 2
+    else: severity = 3
+    return risk_score, severity
+
+
+def diabetes(d: dict) -> tuple:
+    risk_score = 0
+    if d['HighBP'] == 1: risk_score += 15
+    if d['HighChol'] == 1: risk_score += 12
+    if d['BMI'] > 30: risk_score += 20
+    elif d['BMI'] > 25: risk_score += 10
+    if d['Smoker'] == 1: risk_score += 8
+    if d['HeartDiseaseorAttack'] == 1: risk_score += 15
+    if d['PhysActivity'] == 0: risk_score += 10
+    if d['GenHlth'] >= 4: risk_score += 10
+    if d['Age'] >= 9: risk_score += 10
+    risk_score = min(risk_score, 100)
+
+    if risk_score < 25: severity = 0
+    elif risk_score < 50: severity = 1
+    elif risk_score < 75: severity = 2
+    else: severity = 3
+    return risk_score, severity
+
+
+def hypertension(d: dict) -> tuple:
+    risk_score = 0
+    if d['Age'] > 60: risk_score += 15
+    elif d['Age'] > 45: risk_score += 8
+    if d['Salt_Intake'] > 8: risk_score += 18
+    elif d['Salt_Intake'] > 6: risk_score += 10
+    if d['Stress_Score'] > 7: risk_score += 12
+    if d['Sleep_Duration'] < 6: risk_score += 8
+    if d['BMI'] > 30: risk_score += 15
+    elif d['BMI'] > 25: risk_score += 8
+    if d['BP_History_Encoded'] == 2: risk_score += 20
+    elif d['BP_History_Encoded'] == 1: risk_score += 10
+    if d['Family_History_Encoded'] == 1: risk_score += 10
+    if d['Exercise_Level_Encoded'] == 0: risk_score += 8
+    if d['Smoking_Encoded'] == 1: risk_score += 12
+    risk_score = min(risk_score, 100)
+
+    if risk_score < 25: severity = 0
+    elif risk_score < 50: severity = 1
+    elif risk_score < 75: severity = 2
+    else: severity = 3
+    return risk_score, severity
+
+
+def parkinson(d: dict) -> tuple:
+    risk_score = 0
+    if d['age'] > 70: risk_score += 12
+    if d['tremor_score'] > 3: risk_score += 18
+    elif d['tremor_score'] > 1.5: risk_score += 10
+    if d['rigidity'] > 3: risk_score += 15
+    if d['bradykinesia'] > 3: risk_score += 18
+    if d['postural_instability'] > 2.5: risk_score += 12
+    if d['motor_updrs'] > 50: risk_score += 20
+    elif d['motor_updrs'] > 30: risk_score += 10
+    if d['levodopa_response'] < 50: risk_score += 10
+    if d['disease_duration'] > 5: risk_score += 8
+    risk_score = min(risk_score, 100)
+
+    if risk_score < 25: severity = 0
+    elif risk_score < 50: severity = 1
+    elif risk_score < 75: severity = 2
+    else: severity = 3
+    return risk_score, severity
+
+
+def animal_bite(d: dict) -> tuple:
+    risk_score = 0
+    animal_risks = {0: 25, 1: 15, 2: 18, 3: 22, 4: 10}
+    risk_score += animal_risks.get(d['Animal_Type'], 15)
+    body_risks = {0: 8, 1: 10, 2: 12, 3: 20, 4: 25}
+    risk_score += body_risks.get(d['Body_Part'], 10)
+    if d['Allergy_History'] == 1: risk_score += 20
+    if d['First_Aid_Applied'] == 0: risk_score += 15
+    if d['Hospital_Time_Hours'] > 4: risk_score += 15
+    elif d['Hospital_Time_Hours'] > 2: risk_score += 8
+    if d['Chronic_Disease'] == 1: risk_score += 10
+    if d['Age'] > 65 or d['Age'] < 10: risk_score += 8
+    risk_score = min(risk_score, 100)
+
+    if risk_score < 25: severity = 0
+    elif risk_score < 50: severity = 1
+    elif risk_score < 75: severity = 2
+    else: severity = 3
+    return risk_score, severity
+
+
+def diabetes_prediction(d: dict) -> dict:
+    """Orijinal predict_diabetes endpoint'inin 'prediction' alanı"""
+    risk_score, severity = diabetes(d)
+    risk_level = ("Minimal", "Düşük", "Orta (Prediyabet)", "Yüksek (Diyabet)")[severity]
+    return {
+        "risk_level": risk_level,
+        "severity": severity,
+        "risk_score": risk_score,
+        "probabilities": {
+            "minimal": max(0, 100 - risk_score),
+            "low": 20 if severity >= 1 else 5,
+            "prediabetes": 30 if severity >= 2 else 5,
+            "diabetes": risk_score if severity == 3 else 5
+        }
+    }
+
+
+REFERENCE_SCORERS = {
+    "asthma": asthma,
+    "diabetes": diabetes,
+    "hypertension": hypertension,
+    "parkinson": parkinson,
+    "animal_bite": animal_bite,
+}
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ölçekleyici katlama (HEALTHAI_FOLD_SCALER) eşdeğerlik kontrolü
+
+Kullanım:
+    cd backend
+    python benchmarks/verify_folding.py
+
+Yüklü her model için katlanmamış ve katlanmış BaseRiskAssessment örnekleri karşılaştırılır
+(katlanmış örnekte tüm satırlar katlanmış eşiklerle, düz değerlendiricide hesaplanır):
+  1. Her bölünme eşiğinin kendisi ve float32 komşuları (tüm dallar iki yönden)
+  2. Şema sınırlarından üretilmiş gerçekçi hasta satırları
+  3. float32'de temsil edilemeyen, tam hassasiyetli float64 gürültülü satırlar
+Üç durumda da her ağaçta aynı dal seçilmelidir: olasılıklar yalnızca toplama sırası farkı kadar
+(~1e-15, bench_flat.py ile aynı) ayrışabilir; TOLERANCE'ı aşan fark farklı bir yaprak demektir.
+"""
+
+import sys
+import warnings
+
+import numpy as np
+
+from common import percentiles, random_matrix, time_calls
+
+import main
+
+warnings.simplefilter("ignore")
+
+TOLERANCE = 1e-9
+
+SCHEMAS = {
+    "asthma": main.AsthmaInput,
+    "diabetes": main.DiabetesInput,
+    "hypertension": main.HypertensionInput,
+    "parkinson": main.ParkinsonInput,
+    "animal_bite": main.AnimalBiteInput,
+}
+
+
+def boundary_rows(folded, base_row: np.ndarray) -> np.ndarray:
+    """Düz değerlendiricinin ham uzaya katlanmış her eşiği için eşik ve float32 komşularını içeren satırlar"""
+    flat = folded.flat
+    internal = np.isfinite(flat.threshold)  # yapraklarda eşik +inf
+    rows = []
+    for feature, threshold in zip(flat.feature[internal], flat.threshold[internal]):
+        t32 = np.float32(threshold)
+        for value in (t32, np.nextafter(t32, np.float32(np.inf)),
+                      np.nextafter(t32, np.float32(-np.inf))):
+            row = base_row.copy()
+            row[feature] = value
+            rows.append(row)
+    return np.array(rows)
+
+
+def proba(model, X: np.ndarray) -> np.ndarray:
+    return np.array([r["probabilities"] for r in model.predict_batch(X, main.FEATURE_ORDERS[model.model_prefix])])
+
+
+def verify(model_id: str) -> bool:
+    plain = main.BaseRiskAssessment(model_id, fold=False)
+    if not plain.is_loaded:
+        return None
+    folded = main.BaseRiskAssessment(model_id, fold=True)
+    # Katlanmış eşikler yalnızca flat_max_rows'a kadar kullanılır; burada tüm satırlar onlarla hesaplanır
+    folded.flat_max_rows = float("inf")
+
+    realistic = random_matrix(SCHEMAS[model_id], 20000, seed=4)
+    noise = realistic + np.random.default_rng(5).normal(0, 1e-3, realistic.shape) * plain.scaler.scale_
+    boundaries = boundary_rows(folded, plain.scaler.mean_.copy())
+
+    ok = True
+    for name, X in (("eşik komşuları", boundaries), ("gerçekçi girdi", realistic), ("float64 gürültü", noise)):
+        diff = np.abs(proba(plain, X) - proba(folded, X)).max(axis=1)
+        n_diff = int((diff > TOLERANCE).sum())
+        print(f"   {name:<16} {len(X):>7} satır, farklı: {n_diff}, en büyük fark: {diff.max():.2e}")
+        ok &= n_diff == 0
+
+    row = dict(zip(main.FEATURE_ORDERS[model_id], realistic[0].tolist()))
+    for label, model in (("ölçekli", plain), ("katlanmış", folded)):
+        r = percentiles(time_calls(lambda: model.predict(row, main.FEATURE_ORDERS[model_id]), 500))
+        print(f"   predict {label:<10} p50 {r['p50_us']} µs  p99 {r['p99_us']} µs")
+    return ok
+
+
+def main_cli():
+    failed = False
+    for model_id in SCHEMAS:
+        print(f"🔬 {model_id}")
+        ok = verify(model_id)
+        if ok is None:
+            print("   (model dosyaları yok, atlandı)")
+        failed |= ok is False
+    if failed:
+        print("❌ Katlanmış modeller orijinalden farklı sonuç veriyor")
+        sys.exit(1)
+    print(f"✅ Katlanmış modeller orijinalle aynı dalları seçiyor (olasılık farkı <= {TOLERANCE:g})")
+
+
+if __name__ == "__main__":
+    main_cli()
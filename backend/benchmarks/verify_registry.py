@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Model kayıt defteri: tembel yükleme ve boşta kalan modellerin atılması
+
+Kullanım:
+    cd backend
+    python benchmarks/verify_registry.py
+
+  1. Aynı anda gelen ilk istekler tek bir yüklemeyi bekler (loads == 1)
+  2. HEALTHAI_MODEL_TTL süresini aşan model atılır, sonraki istekte yeniden yüklenir
+  3. HEALTHAI_MEMORY_BUDGET_MB aşılınca en uzun süredir kullanılmayan model atılır
+"""
+
+import sys
+import threading
+import time
+import warnings
+
+import common  # noqa: F401  (backend/ dizinini sys.path'e ekler)
+import main
+from registry import MODEL_DIRS, ModelRegistry
+
+warnings.simplefilter("ignore")
+
+THREADS = 16
+
+
+def concurrent_first_requests(model_id: str) -> bool:
+    registry = ModelRegistry(main.load_assessment, MODEL_DIRS)
+    barrier = threading.Barrier(THREADS)
+    models = []
+
+    def request():
+        barrier.wait()
+        models.append(registry.get(model_id))
+
+    threads = [threading.Thread(target=request) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    entry = registry.entries[model_id]
+    ok = entry.loads == 1 and all(model is models[0] for model in models) and models[0] is not None
+    print(f"   {THREADS} eş zamanlı ilk istek -> {entry.loads} yükleme ({entry.status()['load_ms']} ms)")
+    return ok
+
+
+def idle_eviction(model_id: str) -> bool:
+    registry = ModelRegistry(main.load_assessment, MODEL_DIRS, ttl=30)
+    first = registry.get(model_id)
+    registry.evict_idle(now=time.monotonic() + 10)
+    kept = registry.entries[model_id].state == "ready"
+    registry.evict_idle(now=time.monotonic() + 31)
+    evicted = registry.entries[model_id].state == "pending" and registry.entries[model_id].model is None
+    second = registry.get(model_id)
+    status = registry.entries[model_id].status()
+    print(f"   TTL: 10 sn sonra tutuldu={kept}, 31 sn sonra atıldı={evicted}, "
+          f"yeniden yükleme={status['loads']}, atılma={status['evictions']}")
+    return kept and evicted and second is not None and second is not first
+
+
+def memory_budget(model_ids: list) -> bool:
+    probe = ModelRegistry(main.load_assessment, MODEL_DIRS)
+    sizes = {model_id: probe.entries[model_id].memory_bytes for model_id in model_ids if probe.get(model_id)}
+    # Yalnızca en büyük model sığacak kadar bütçe: ikinci model yüklenince ilki atılmalı
+    registry = ModelRegistry(main.load_assessment, MODEL_DIRS, memory_budget_mb=max(sizes.values()) / 2**20)
+    for model_id in model_ids:
+        registry.get(model_id)
+    states = {model_id: registry.entries[model_id].state for model_id in model_ids}
+    print(f"   bütçe {registry.memory_budget / 2**20:.2f} MB -> {states}")
+    return list(states.values()) == ["pending"] * (len(model_ids) - 1) + ["ready"]
+
+
+def main_cli():
+    loaded = [model_id for model_id in MODEL_DIRS if main.registry.get(model_id) is not None]
+    if len(loaded) < 2:
+        print("   (en az iki yüklü model gerekli, atlandı)")
+        return
+    checks = {
+        "eş zamanlı yükleme": concurrent_first_requests(loaded[0]),
+        "boşta atılma": idle_eviction(loaded[0]),
+        "bellek bütçesi": memory_budget(loaded),
+    }
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Diyabet kural tablosu (RuleTable) doğrulaması
+
+Kullanım:
+    cd backend
+    python benchmarks/verify_rule_table.py
+
+  1. Tablodaki her hücre için o hücreye düşen bir hasta satırı kurulur; tablonun
+     'prediction' sözlüğü orijinal if zincirinin ürettiğiyle aynı olmalıdır
+  2. Aynı satır endpoint'e gönderilir; önceden serileştirilmiş gövde, orijinal yanıt
+     sözlüğünün FastAPI ile kodlanmış hâliyle bayt bayt aynı olmalıdır
+  3. Rastgele satırlarda tablo anahtarı vektörel skorlayıcıyla aynı sonucu vermelidir
+"""
+
+import itertools
+import sys
+import warnings
+
+from fastapi.testclient import TestClient
+
+from common import field_bounds, percentiles, random_matrix, time_calls
+from reference_rules import diabetes_prediction
+
+import main
+
+warnings.simplefilter("ignore")
+
+MODEL_ID = "diabetes"
+
+
+def outcome_values(schema, feature: str, group_rules: list) -> list:
+    """Gruptaki her sonuç için (0: eşleşme yok, k: k. kural) o sonucu veren bir değer"""
+    _, lo, hi, is_int = next(b for b in field_bounds(schema) if b[0] == feature)
+    candidates = {lo, hi}
+    for _, threshold, _ in group_rules:
+        candidates.update(threshold + delta for delta in (-1, -0.5, 0, 0.5, 1))
+    candidates = sorted(c for c in candidates if lo <= c <= hi and (not is_int or c == int(c)))
+
+    table = main.DIABETES_TABLE
+    index = main.DIABETES_FEATURES.index(feature)
+    group = next(g for g in table.groups if g[0] == index)
+    group_mask = (1 << len(group_rules).bit_length()) - 1
+    by_outcome = {}
+    for value in candidates:
+        row = [0.0] * len(main.DIABETES_FEATURES)
+        row[index] = value
+        by_outcome.setdefault((table.key(row) >> group[2]) & group_mask, int(value) if is_int else value)
+    return [by_outcome[outcome] for outcome in range(len(group_rules) + 1)]
+
+
+def base_row(schema) -> dict:
+    return {name: (int(lo) if is_int else lo) for name, lo, _, is_int in field_bounds(schema)}
+
+
+def main_cli():
+    schema = main.DiabetesInput
+    table = main.DIABETES_TABLE
+    rules = main.RULES[MODEL_ID]
+    choices = [outcome_values(schema, feature, group_rules) for feature, group_rules in rules]
+
+    client = TestClient(main.app)
+    cells, mismatches, body_mismatches = set(), 0, 0
+    for values in itertools.product(*choices):
+        row = base_row(schema)
+        row.update({feature: value for (feature, _), value in zip(rules, values)})
+        key = table.key([row[f] for f in main.DIABETES_FEATURES])
+        cells.add(key)
+        expected = diabetes_prediction(row)
+        mismatches += table.predictions[key] != expected
+
+        response = client.post(f"/api/predict/{MODEL_ID}", json=row)
+        ensemble = response.json()["ensemble"]
+        original = main.encode_json({
+            "success": True,
+            "prediction": expected,
+            "recommendations": main.get_diabetes_recommendations(expected["severity"]),
+            "ensemble": ensemble
+        })
+        body_mismatches += response.content != original
+
+    X = random_matrix(schema, 50000, seed=12)
+    names = [name for name, _, _, _ in field_bounds(schema)]
+    X = X[:, [names.index(f) for f in main.DIABETES_FEATURES]]
+    risk_scores, severities = main.SCORERS[MODEL_ID].score(X)
+    keys = [table.key(row) for row in X.tolist()]
+    key_mismatches = int(
+        (table.risk_scores[keys] != risk_scores).sum() + (table.severities[keys] != severities).sum()
+    )
+
+    print(f"🔢 {len(cells)}/{len(table.cells)} hücre kapsandı ({table.bits} bit anahtar)")
+    print(f"   prediction uyuşmazlığı: {mismatches}, gövde bayt uyuşmazlığı: {body_mismatches}")
+    print(f"   rastgele {len(X)} satırda skorlayıcı uyuşmazlığı: {key_mismatches}")
+
+    row = X[0]
+    lookup = percentiles(time_calls(lambda: table.lookup(row.tolist()), 20000))
+    scored = percentiles(time_calls(lambda: main.score_rows(MODEL_ID, row[None, :]), 20000))
+    print(f"   tablo araması p50 {lookup['p50_us']} µs, vektörel skorlayıcı p50 {scored['p50_us']} µs")
+
+    if len(cells) != len(table.cells) or mismatches or body_mismatches or key_mismatches:
+        print("❌ Kural tablosu orijinal mantıkla uyuşmuyor")
+        sys.exit(1)
+    print("✅ Kural tablosu her hücrede orijinal mantıkla aynı")
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vektörel doğrulama (HEALTHAI_VALIDATION=vector) doğrulaması + benchmark'ı
+
+Kullanım:
+    cd backend
+    python benchmarks/verify_validation.py --rows 10000
+
+  1. Geçerli gövdelerde SchemaValidator matrisi, Pydantic nesnelerinden kurulan matrisle aynı olmalıdır
+  2. Geçersiz gövdelerde (eksik alan, yanlış tür, sınır dışı, NaN, liste olmayan gövde, bozuk JSON...)
+     durum kodu ve 422 hata gövdesi List[şema] doğrulayan FastAPI endpoint'iyle birebir aynı olmalıdır
+Ardından batch doğrulama + matris kurma süresi iki mod için karşılaştırılır.
+"""
+
+import argparse
+import json
+import os
+import sys
+import warnings
+from typing import List
+
+os.environ["HEALTHAI_VALIDATION"] = "vector"
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+
+from common import percentiles, random_rows, time_calls
+
+import main
+
+warnings.simplefilter("ignore")
+
+
+def reference_app() -> FastAPI:
+    """Her şema için gövdeyi List[şema] ile doğrulayan endpoint'ler"""
+    app = FastAPI()
+    for model_id, schema in main.INPUT_SCHEMAS.items():
+        async def endpoint(data: List[schema]):
+            main.check_batch_size(data)
+            return {"count": len(data)}
+        app.post(f"/api/predict/{model_id}/batch")(endpoint)
+    return app
+
+
+def invalid_bodies(model_id: str, valid: list) -> dict:
+    """Ad -> istek gövdesi (bayt)"""
+    schema = main.INPUT_SCHEMAS[model_id]
+    fields = list(schema.model_fields)
+    required = [name for name, field in schema.model_fields.items() if field.is_required()]
+    int_field = next((name for name, field in schema.model_fields.items() if field.annotation is int), None)
+    float_field = next((name for name, field in schema.model_fields.items() if field.annotation is float), int_field)
+
+    def patched(changes: dict):
+        """{satır: (alan, değer)}; değer KeyError ise alan silinir"""
+        rows = [dict(row) for row in valid]
+        for i, (name, value) in changes.items():
+            if value is KeyError:
+                rows[i].pop(name, None)
+            else:
+                rows[i][name] = value
+        return rows
+
+    def bounds(name):
+        field = schema.model_fields[name]
+        ge = next(c.ge for c in field.metadata if getattr(c, "ge", None) is not None)
+        le = next(c.le for c in field.metadata if getattr(c, "le", None) is not None)
+        return ge, le
+
+    lo, hi = bounds(float_field)
+    cases = {
+        "eksik zorunlu alan": patched({1: (required[0], KeyError)}),
+        "sınır altı": patched({0: (float_field, lo - 1)}),
+        "sınır üstü + başka satırda eksik alan": patched({2: (float_field, hi + 0.5), 4: (required[-1], KeyError)}),
+        "sayısal metin": patched({1: (float_field, str(lo))}),
+        "geçersiz metin": patched({1: (float_field, "abc")}),
+        "bool": patched({2: (int_field or float_field, True)}),
+        "null": patched({0: (fields[0], None)}),
+        "fazla alan": patched({0: ("extra", 1)}),
+        "boş liste": [],
+        "nesne olmayan satır": valid[:2] + [5, [1, 2], None],
+        "liste olmayan gövde": {"rows": valid[:2]},
+        "sayı gövde": 5,
+    }
+    if int_field is not None:
+        cases["ondalıklı tamsayı"] = patched({3: (int_field, bounds(int_field)[0] + 0.5)})
+        cases["tamsayı yerine 1.0"] = patched({3: (int_field, float(bounds(int_field)[0]))})
+    if "Ethnicity" in schema.model_fields:
+        cases["varsayılanlı alan eksik"] = patched({0: ("Ethnicity", KeyError), 1: ("EducationLevel", KeyError)})
+    bodies = {name: json.dumps(body).encode() for name, body in cases.items()}
+    # json.dumps'ın üretemediği gövdeler
+    good = json.dumps(valid[0])
+    bodies["NaN"] = ("[" + good[:-1] + f', "{float_field}": NaN' + "}]").encode()
+    bodies["çok büyük tamsayı"] = ("[" + good[:-1] + f', "{int_field or float_field}": 1' + "0" * 400 + "}]").encode()
+    bodies["bozuk JSON"] = b'[{"a": 1,'
+    bodies["boş gövde"] = b""
+    return bodies
+
+
+def check_matrices(model_id: str, rows: list) -> bool:
+    schema = main.INPUT_SCHEMAS[model_id]
+    expected = main.rows_to_matrix([schema(**row) for row in rows], main.FEATURE_ORDERS[model_id])
+    return bool((main.VALIDATORS[model_id].matrix(rows) == expected).all())
+
+
+def check_errors(client, reference, model_id: str, valid: list) -> int:
+    url = f"/api/predict/{model_id}/batch"
+    mismatches = 0
+    for name, body in invalid_bodies(model_id, valid).items():
+        headers = {"Content-Type": "application/json"}
+        got = client.post(url, content=body, headers=headers)
+        want = reference.post(url, content=body, headers=headers)
+        if got.status_code != want.status_code or (want.status_code == 422 and got.json() != want.json()):
+            print(f"   ❌ {model_id} / {name}: {got.status_code} {got.text[:200]} != {want.status_code} {want.text[:200]}")
+            mismatches += 1
+    return mismatches
+
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Vektörel doğrulama kontrolü ve benchmark")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    checks = {}
+    # NaN gibi JSON'a yazılamayan girdiler her iki uygulamada da 500 üretir
+    with TestClient(main.app, raise_server_exceptions=False) as client, \
+            TestClient(reference_app(), raise_server_exceptions=False) as reference:
+        for model_id, schema in main.INPUT_SCHEMAS.items():
+            rows = random_rows(schema, 500, seed=7)
+            checks[f"{model_id}: matris"] = check_matrices(model_id, rows)
+            checks[f"{model_id}: hata gövdeleri"] = check_errors(client, reference, model_id, rows[:6]) == 0
+
+    print(f"{'model':<14} {'pydantic p50':>14} {'vector p50':>14} {'hız':>7}   ({args.rows} satır)")
+    for model_id, schema in main.INPUT_SCHEMAS.items():
+        rows = random_rows(schema, args.rows, seed=8)
+        adapter = TypeAdapter(List[schema])
+        features = main.FEATURE_ORDERS[model_id]
+        slow = percentiles(time_calls(lambda: main.rows_to_matrix(adapter.validate_python(rows), features), args.repeat))
+        fast = percentiles(time_calls(lambda: main.VALIDATORS[model_id].matrix(rows), args.repeat))
+        print(f"{model_id:<14} {slow['p50_us'] / 1000:>11.2f} ms {fast['p50_us'] / 1000:>11.2f} ms "
+              f"{slow['p50_us'] / fast['p50_us']:>6.1f}x")
+
+    for name, ok in checks.items():
+        print(f"{'✅' if ok else '❌'} {name}")
+    if not all(checks.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_cli()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İçerik Adresli Tahmin Önbelleği
+Anahtar: (model kimliği, model sürümü, normalize özellik vektörü) üzerinden blake2b özeti.
+Sürüm model dosyalarından türetildiği için dosyalar değişince eski kayıtlar kendiliğinden
+geçersiz kalır (yeniden kullanılmaz, LRU/TTL ile temizlenir).
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from registry import estimate_nbytes
+
+# Önbellek bellek sınırı, MB (0: kapalı)
+CACHE_MB = float(os.environ.get("HEALTHAI_CACHE_MB", "16"))
+# Kayıt ömrü, saniye (0: süresiz)
+CACHE_TTL = float(os.environ.get("HEALTHAI_CACHE_TTL", "3600"))
+
+# OrderedDict kaydı + anahtar baytları için yaklaşık sabit ek yük
+_ENTRY_OVERHEAD = 200
+
+
+def cache_key(model_id: str, version: str, row: np.ndarray) -> bytes:
+    """Özellik satırının kanonik özeti
+
+    Satır float64'e çevrilir ve -0.0 -> 0.0 normalize edilir; böylece 1, 1.0 ve -0.0/0.0
+    gibi JSON'da farklı yazılmış ama modele aynı giden girdiler aynı anahtarı üretir.
+    """
+    row = np.ascontiguousarray(row, dtype=np.float64) + 0.0
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(model_id.encode())
+    digest.update(b"\0")
+    digest.update(version.encode())
+    digest.update(b"\0")
+    digest.update(row.tobytes())
+    return digest.digest()
+
+
+class PredictionCache:
+    """LRU + TTL + bellek sınırlı önbellek
+
+    Olay döngüsü thread'inden kullanılır; değerler paylaşıldığı için değiştirilmemelidir.
+    """
+
+    def __init__(self, max_mb: float = CACHE_MB, ttl: float = CACHE_TTL):
+        self.max_bytes = max_mb * 2**20
+        self.ttl = ttl
+        # anahtar -> (değer, son geçerlilik zamanı, bayt)
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: bytes):
+        """Kayıt varsa (True, değer), yoksa (False, None)"""
+        item = self.entries.get(key)
+        if item is None:
+            self.misses += 1
+            return False, None
+        value, expires, size = item
+        if expires is not None and time.monotonic() > expires:
+            del self.entries[key]
+            self.nbytes -= size
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return True, value
+
+    def put(self, key: bytes, value):
+        size = estimate_nbytes(value) + _ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= old[2]
+        expires = time.monotonic() + self.ttl if self.ttl else None
+        self.entries[key] = (value, expires, size)
+        self.nbytes += size
+        while self.nbytes > self.max_bytes:
+            _, (_, _, evicted) = self.entries.popitem(last=False)
+            self.nbytes -= evicted
+            self.evictions += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+    def status(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self.entries),
+            "memory_mb": round(self.nbytes / 2**20, 3),
+            "max_mb": round(self.max_bytes / 2**20, 3),
+            "ttl_s": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+HealthAI komut satırı araçları
+
+Kullanım:
+    cd backend
+    python cli.py score --model parkinson kayitlar.csv sonuc.csv
+    python cli.py score --model parkinson kayitlar.csv sonuc.csv --workers 0   # tüm çekirdekler
+    python cli.py score --model asthma kayitlar.parquet sonuc.parquet --chunk-rows 100000 \\
+        --map hasta_yasi=Age --keep hasta_id
+"""
+
+import argparse
+import os
+
+from registry import MODEL_DIRS
+
+
+def parse_column_map(pairs: list) -> dict:
+    column_map = {}
+    for pair in pairs:
+        source, sep, feature = pair.partition("=")
+        if not sep or not source or not feature:
+            raise SystemExit(f"❌ Geçersiz --map değeri: {pair} (beklenen: dosyadaki_ad=özellik)")
+        column_map[source] = feature
+    return column_map
+
+
+def non_negative_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"0 veya pozitif tam sayı olmalı: {value}")
+    return number
+
+
+def positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"pozitif tam sayı olmalı: {value}")
+    return number
+
+
+def print_worker_stats(stats: dict):
+    print(f"   {'worker':<10} {'parça':>6} {'satır':>12} {'meşgul sn':>10} {'satır/sn':>10}")
+    for pid, (shards, rows, busy) in sorted(stats.items()):
+        print(f"   {pid:<10} {shards:>6} {rows:>12,} {busy:>10.2f} {rows / busy if busy else 0:>10,.0f}")
+
+
+def cmd_score(args):
+    # scoring (pandas) yalnızca komut çalışırken yüklenir; --help ve hatalı argümanlar anında döner
+    from scoring import CHUNK_ROWS, score_file, score_file_parallel
+
+    if args.chunk_rows is None:
+        args.chunk_rows = CHUNK_ROWS
+    workers = args.workers or os.cpu_count() or 1
+    print(f"🔄 {args.input} -> {args.output} ({args.model}, {args.chunk_rows:,} satırlık parçalar, "
+          f"{workers} worker)")
+    options = dict(chunk_rows=args.chunk_rows, column_map=parse_column_map(args.map), keep=args.keep)
+    if workers == 1:
+        progress = score_file(args.model, args.input, args.output, **options)
+    else:
+        progress, stats = score_file_parallel(args.model, args.input, args.output, workers, **options)
+        print_worker_stats(stats)
+    print(f"✅ {progress.rows:,} satır skorlandı ({progress.rate:,.0f} satır/sn)")
+    if progress.skipped:
+        print(f"⚠️ {progress.skipped:,} satırda eksik veya sayısal olmayan özellik vardı, skorlanmadı (seviye=-1)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HealthAI komut satırı araçları")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    score = commands.add_parser("score", help="CSV/Parquet hasta dosyasını toplu skorla")
+    score.add_argument("input", help="Girdi dosyası (.csv veya .parquet)")
+    score.add_argument("output", help="Sonuç dosyası (.csv veya .parquet)")
+    score.add_argument("--model", required=True, choices=list(MODEL_DIRS))
+    score.add_argument("--chunk-rows", type=positive_int, help="Parça başına satır (varsayılan: scoring.CHUNK_ROWS)")
+    score.add_argument("--workers", type=non_negative_int, default=1,
+                       help="Skorlama süreci sayısı (0: CPU sayısı); parçalar girdi sırasıyla birleştirilir")
+    score.add_argument("--map", action="append", default=[], metavar="SÜTUN=ÖZELLİK",
+                       help="Dosyadaki sütunu model özelliğine eşle (tekrarlanabilir)")
+    score.add_argument("--keep", action="append", default=[], metavar="SÜTUN",
+                       help="Sonuca aynen kopyalanacak sütun, örn. hasta kimliği (tekrarlanabilir)")
+    score.set_defaults(func=cmd_score)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
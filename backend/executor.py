@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Çıkarım Yürütücüsü (Executor)
+CPU yoğun model çağrılarını uvicorn olay döngüsünün dışında, sınırlı kuyruk derinliğiyle
+bir thread veya process havuzunda çalıştırır.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Yürütücü türü: "thread" (GIL'i bırakan sklearn/NumPy yolları), "process" (modelleri önceden
+# yükleyen worker süreçleri) veya "inline" (olay döngüsünde, eski davranış)
+EXECUTOR_KIND = os.environ.get("HEALTHAI_EXECUTOR", "thread")
+EXECUTOR_WORKERS = int(os.environ.get("HEALTHAI_EXECUTOR_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Kuyrukta bekleyen + çalışan en fazla iş; aşılınca istek 429 ile reddedilir
+MAX_PENDING = int(os.environ.get("HEALTHAI_MAX_PENDING", "64"))
+
+
+class QueueFull(Exception):
+    """Kuyruk derinliği sınırına ulaşıldı (HTTP 429)"""
+
+
+class ExecutorUnavailable(Exception):
+    """Process havuzunun worker süreçleri çöktü (HTTP 503)"""
+
+
+def _timed(fn, submitted: float, *args):
+    """Worker tarafında çalışır: (sonuç, kuyrukta bekleme saniyesi)"""
+    # time.time() süreçler arasında karşılaştırılabilir
+    waited = time.time() - submitted
+    return fn(*args), waited
+
+
+class InferenceExecutor:
+    """Sınırlı kuyruklu thread/process havuzu
+
+    run() olay döngüsünden çağrılır; sayaçlar yalnızca o thread'den güncellenir.
+    """
+
+    def __init__(self, kind: str = EXECUTOR_KIND, workers: int = EXECUTOR_WORKERS,
+                 max_pending: int = MAX_PENDING, initializer=None):
+        if kind not in ("thread", "process", "inline"):
+            raise ValueError(f"Bilinmeyen yürütücü türü: {kind}")
+        self.kind = kind
+        self.workers = workers
+        self.max_pending = max_pending
+        # Yalnızca process havuzunda her worker başlarken çağrılır (örn. model ön yükleme)
+        self.initializer = initializer
+        self.pool = None
+        self.in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.queue_wait_total = 0.0
+
+    def start(self):
+        if self.pool is not None or self.kind == "inline":
+            return
+        if self.kind == "thread":
+            self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="inference")
+        else:
+            # fork, uvicorn'un thread'leri varken güvenli değildir
+            self.pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=self.initializer
+            )
+
+    def shutdown(self):
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
+
+    async def run(self, fn, *args) -> tuple:
+        """fn(*args) sonucunu ve kuyrukta bekleme süresini (ms) döndür"""
+        if self.in_flight >= self.max_pending:
+            self.rejected += 1
+            raise QueueFull(f"Çıkarım kuyruğu dolu ({self.max_pending} iş)")
+        if self.kind == "inline":
+            result, waited = fn(*args), 0.0
+        else:
+            self.start()
+            self.in_flight += 1
+            try:
+                loop = asyncio.get_running_loop()
+                result, waited = await loop.run_in_executor(self.pool, _timed, fn, time.time(), *args)
+            except BrokenProcessPool as e:
+                # Çöken havuz bir sonraki istekte yeniden kurulur
+                self.pool = None
+                raise ExecutorUnavailable(str(e)) from e
+            finally:
+                self.in_flight -= 1
+        waited = max(waited, 0.0)
+        self.completed += 1
+        self.queue_wait_total += waited
+        return result, waited * 1000
+
+    def status(self) -> dict:
+        return {
+            "kind": self.kind,
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_queue_wait_ms": round(self.queue_wait_total / self.completed * 1000, 3) if self.completed else None,
+        }
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Düz Dizi Tabanlı Ensemble Değerlendirici
+RandomForest (m1) ve GradientBoosting (m2) ağaçlarını tek bir bitişik düğüm dizisine
+düzleştirir; tüm ağaçlar N hasta için tek vektörel geçişte dolaşılır.
+"""
+
+import json
+import os
+
+import numpy as np
+
+from folding import iter_trees, raw_thresholds
+
+# Büyük batch'lerde (N x ağaç x sınıf) ara dizileri sınırlamak için satır parçası
+CHUNK_ROWS = 1024
+
+
+class FlatEnsemble:
+    """RF + GB ensemble'ının düz NumPy temsili
+
+    Düğüm dizileri (tüm ağaçlar art arda, ağaçlar derinliğe göre azalan sırada):
+        feature, threshold : bölünme bilgisi
+        children           : (düğüm, 2) sol/sağ çocuk; yapraklar kendilerini gösterir
+        value              : (düğüm, sınıf) yaprak katkısı
+        roots, depths      : her ağacın kök indeksi ve derinliği
+        rf_trees, gb_trees : sıralı ağaç listesindeki RF ve GB ağaçlarının konumları
+    RF yapraklarında katkı = sınıf oranı / ağaç sayısı, GB yapraklarında
+    katkı = learning_rate * yaprak değeri (ilgili sınıf sütununda).
+    """
+
+    ARRAYS = ("feature", "threshold", "children", "value", "roots", "depths",
+              "rf_trees", "gb_trees", "gb_init")
+    FORMAT_VERSION = 1
+
+    def __init__(self, feature, threshold, children, value, roots, depths, rf_trees, gb_trees,
+                 gb_init, cast_float32: bool):
+        self.feature = feature
+        self.threshold = threshold
+        self.children = children
+        self.value = value
+        self.roots = roots
+        self.depths = depths
+        self.rf_trees = rf_trees
+        self.gb_trees = gb_trees
+        self.gb_init = gb_init
+        # True: sklearn gibi girdi float32'ye çevrilip karşılaştırılır (ölçekli uzay eşikleri)
+        # False: eşikler ham uzaya katlanmıştır, karşılaştırma tam float64'tür
+        self.cast_float32 = bool(cast_float32)
+        self.n_classes = value.shape[1]
+        # d. adımda hâlâ yaprağa ulaşmamış ağaç sayısı (ağaçlar derinliğe göre sıralı)
+        self.active_trees = [int((depths > d).sum()) for d in range(int(depths.max(initial=0)))]
+
+    @classmethod
+    def from_estimators(cls, rf_model, gb_model, scaler=None):
+        """Eğitilmiş sklearn modellerini düzleştir
+
+        scaler verilirse ölçekleme eşiklere katlanır ve değerlendirici ham girdiyi alır.
+        """
+        n_classes = len(rf_model.classes_)
+        gb_binary = gb_model.estimators_.shape[1] == 1
+        n_features = rf_model.n_features_in_
+
+        if scaler is not None:
+            mean = scaler.mean_ if scaler.with_mean else np.zeros(n_features)
+            scale = scaler.scale_ if scaler.with_std else np.ones(n_features)
+
+        rf_trees = iter_trees(rf_model)
+        # GB: estimators_[aşama, sınıf]; ravel sırası sınıfı (k) döngüsel verir
+        gb_trees = iter_trees(gb_model)
+        gb_classes = [0] * len(gb_trees) if gb_binary else \
+            [k for _ in range(gb_model.estimators_.shape[0]) for k in range(n_classes)]
+
+        trees = [(tree, "rf", 0) for tree in rf_trees] + \
+                [(tree, "gb", k) for tree, k in zip(gb_trees, gb_classes)]
+        # Derin ağaçlar önde: her adımda aktif ağaçlar bir önek (slice) oluşturur
+        trees.sort(key=lambda item: -item[0].tree_.max_depth)
+
+        features, thresholds, children, values, roots, depths = [], [], [], [], [], []
+        offset = 0
+        for tree, kind, k in trees:
+            t = tree.tree_
+            n = t.node_count
+            is_leaf = t.children_left < 0
+            node_ids = np.arange(n)
+
+            feature = np.where(is_leaf, 0, t.feature)
+            threshold = t.threshold.astype(np.float64)
+            if scaler is not None:
+                internal = ~is_leaf
+                with np.errstate(over="ignore", invalid="ignore"):
+                    threshold[internal] = raw_thresholds(
+                        threshold[internal], mean[feature[internal]], scale[feature[internal]]
+                    )
+            threshold[is_leaf] = np.inf
+
+            value = np.zeros((n, n_classes))
+            if kind == "rf":
+                proba = t.value[:, 0, :]
+                value[:] = proba / proba.sum(axis=1, keepdims=True) / len(rf_trees)
+            else:
+                value[:, k] = gb_model.learning_rate * t.value[:, 0, 0]
+
+            features.append(feature)
+            thresholds.append(threshold)
+            children.append(np.column_stack([
+                np.where(is_leaf, node_ids, t.children_left),
+                np.where(is_leaf, node_ids, t.children_right),
+            ]) + offset)
+            values.append(value)
+            roots.append(offset)
+            depths.append(t.max_depth)
+            offset += n
+
+        kinds = np.array([kind for _, kind, _ in trees])
+        gb_init = gb_model._raw_predict_init(np.zeros((1, n_features), dtype=np.float32))[0]
+        return cls(
+            feature=np.ascontiguousarray(np.concatenate(features), dtype=np.intp),
+            threshold=np.ascontiguousarray(np.concatenate(thresholds)),
+            children=np.ascontiguousarray(np.concatenate(children), dtype=np.intp),
+            value=np.ascontiguousarray(np.concatenate(values)),
+            roots=np.asarray(roots, dtype=np.intp),
+            depths=np.asarray(depths, dtype=np.intp),
+            rf_trees=np.flatnonzero(kinds == "rf"),
+            gb_trees=np.flatnonzero(kinds == "gb"),
+            gb_init=np.asarray(gb_init, dtype=np.float64),
+            cast_float32=scaler is None,
+        )
+
+    def save(self, directory: str, **meta):
+        """Her diziyi ayrı bir .npy dosyasına, üst bilgiyi meta.json'a yaz
+
+        .npy dosyaları np.load(mmap_mode="r") ile açılabilir; böylece aynı modeli
+        kullanan tüm worker süreçleri işletim sisteminin tek sayfa önbelleğini paylaşır.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in self.ARRAYS:
+            np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(getattr(self, name)))
+        meta = dict(meta, format_version=self.FORMAT_VERSION, cast_float32=self.cast_float32)
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: str = "r"):
+        """save() ile yazılmış diziyi aç; (FlatEnsemble, meta) döndürür"""
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format_version") != cls.FORMAT_VERSION:
+            raise ValueError(f"Desteklenmeyen düz model sürümü: {meta.get('format_version')}")
+        arrays = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode, allow_pickle=False)
+            for name in cls.ARRAYS
+        }
+        return cls(cast_float32=meta["cast_float32"], **arrays), meta
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in self.ARRAYS)
+
+    def _leaves(self, X: np.ndarray) -> np.ndarray:
+        """(N, ağaç) yaprak indeksleri; tüm ağaçlar derinlik adımlarıyla birlikte ilerler"""
+        node = np.broadcast_to(self.roots, (X.shape[0], len(self.roots))).copy()
+        X_flat = X.ravel()
+        row_offsets = (np.arange(X.shape[0]) * X.shape[1])[:, np.newaxis]
+        children = self.children.ravel()
+        for k in self.active_trees:
+            active = node[:, :k]
+            go_right = X_flat[row_offsets + self.feature[active]] > self.threshold[active]
+            node[:, :k] = children[2 * active + go_right]
+        return node
+
+    def predict_components(self, X: np.ndarray) -> tuple:
+        """(rf_proba, gb_proba) dizilerini döndür"""
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        if self.cast_float32:
+            X = X.astype(np.float32).astype(np.float64)
+
+        rf_proba = np.empty((X.shape[0], self.n_classes))
+        gb_proba = np.empty((X.shape[0], self.n_classes))
+        for start in range(0, X.shape[0], CHUNK_ROWS):
+            chunk = slice(start, start + CHUNK_ROWS)
+            leaves = self._leaves(np.ascontiguousarray(X[chunk]))
+            rf_proba[chunk] = self.value[leaves[:, self.rf_trees]].sum(axis=1)
+            gb_proba[chunk] = self._link(self.gb_init + self.value[leaves[:, self.gb_trees]].sum(axis=1))
+        return rf_proba, gb_proba
+
+    def _link(self, raw: np.ndarray) -> np.ndarray:
+        """GB ham skorlarından olasılık (ikili: sigmoid, çok sınıflı: softmax)"""
+        if len(self.gb_init) == 1:
+            p = 1.0 / (1.0 + np.exp(-raw[:, 0]))
+            return np.column_stack([1.0 - p, p])
+        raw = raw - raw.max(axis=1, keepdims=True)
+        exp = np.exp(raw)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """RF ve GB olasılıklarının ortalaması (ensemble_proba)"""
+        rf_proba, gb_proba = self.predict_components(X)
+        return (rf_proba + gb_proba) / 2
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+StandardScaler -> Ağaç Eşiği Katlama
+Ağaç bölünmeleri her özellikte monoton olduğundan ölçekleme (m3.pkl) yükleme anında
+m1/m2 ağaçlarının eşiklerine katlanabilir; böylece istek başına transform gerekmez.
+"""
+
+import numpy as np
+
+_SIGN = np.uint64(1 << 63)
+
+
+def _to_ordered(x: np.ndarray) -> np.ndarray:
+    """float64 -> sıralamayı koruyan uint64 anahtar"""
+    bits = x.view(np.uint64)
+    return np.where(bits & _SIGN, ~bits, bits | _SIGN)
+
+
+def _from_ordered(keys: np.ndarray) -> np.ndarray:
+    bits = np.where(keys & _SIGN, keys ^ _SIGN, ~keys)
+    return bits.view(np.float64)
+
+
+def _goes_left(raw: np.ndarray, mean: np.ndarray, scale: np.ndarray, threshold: np.ndarray) -> np.ndarray:
+    """Orijinal yol: ölçekle, sklearn gibi float32'ye çevir, eşikle karşılaştır"""
+    scaled = (raw - mean) / scale
+    return scaled.astype(np.float32).astype(np.float64) <= threshold
+
+
+def raw_thresholds(threshold: np.ndarray, mean: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Ölçekli uzaydaki eşikleri ham uzaya taşı
+
+    Her düğüm için float32(((x - mean) / scale)) <= threshold koşulunu sağlayan en büyük
+    float64 x ikili arama ile bulunur (64 adım, tüm düğümler birlikte). scale > 0 olduğu
+    için koşul x'te monotondur; float32'de temsil edilebilen her ham girdi için katlanmış
+    ağaç orijinaliyle aynı dalı seçer.
+    """
+    threshold = np.asarray(threshold, dtype=np.float64)
+    finite = np.finfo(np.float64).max
+    lo = _to_ordered(np.full(threshold.shape, -finite))
+    hi = _to_ordered(np.full(threshold.shape, finite))
+    # Değişmez: lo koşulu sağlar, hi sağlamaz
+    for _ in range(64):
+        active = hi - lo > 1
+        if not active.any():
+            break
+        mid = lo + (hi - lo) // np.uint64(2)
+        left = _goes_left(_from_ordered(mid), mean, scale, threshold)
+        lo = np.where(active & left, mid, lo)
+        hi = np.where(active & ~left, mid, hi)
+    return _from_ordered(lo)
+
+
+def iter_trees(estimator):
+    """RandomForest / GradientBoosting içindeki tüm karar ağaçları"""
+    estimators = estimator.estimators_
+    if isinstance(estimators, np.ndarray):
+        return list(estimators.ravel())
+    return list(estimators)
+
@@ -5,19 +5,68 @@ HealthAI - Sağlık Tahmin Platformu Backend API
 FastAPI ile geliştirilmiş çoklu hastalık risk değerlendirme sistemi
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Mapping
+from types import MappingProxyType
+from contextlib import asynccontextmanager
+import asyncio
 import pickle
+import operator
+import threading
 import numpy as np
-import pandas as pd
 import os
+import time
+
+from rules import RULES, RESPONSE_SPECS, RuleScorer, RuleTable, build_predictions
+from registry import MODEL_DIRS, ModelRegistry, model_path
+from flat_ensemble import FlatEnsemble
+import model_store
+from executor import InferenceExecutor, QueueFull, ExecutorUnavailable
+from batcher import MICROBATCH, MicroBatcher
+from cache import PredictionCache, cache_key
+from serialization import encode_json, encode_ensemble
+from validation import VALIDATION, SchemaValidator, batch_body
+from metrics import STAGES, StageMetricsMiddleware, lap, timer
+from stats import TOP_FEATURES, ModelSummaries, RequestStats, RequestStatsMiddleware
+from profiler import PROFILE_TOKEN, ProfilerMiddleware, SamplingProfiler, is_admin
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # HEALTHAI_PRELOAD'daki modeller istek kabul edilmeden önce yüklenir, diğerleri ilk istekte.
+    # Process havuzunda çıkarım yalnızca worker'larda yapılır; modelleri ve boşta atmayı worker'lar
+    # kendi kayıt defterlerinde yönetir (preload_worker), ana süreç model tutmaz.
+    serving = executor.kind != "process"
+    if serving:
+        registry.preload()
+    executor.start()
+    sweeper = asyncio.create_task(evict_idle_models()) if serving and registry.ttl else None
+    yield
+    if sweeper is not None:
+        sweeper.cancel()
+    executor.shutdown()
+
+def idle_sweep_interval() -> float:
+    return min(max(registry.ttl / 2, 1.0), 60.0)
+
+async def evict_idle_models():
+    """HEALTHAI_MODEL_TTL'den uzun süre kullanılmayan modelleri periyodik olarak at"""
+    while True:
+        await asyncio.sleep(idle_sweep_interval())
+        registry.evict_idle()
+
+def sweep_idle_models():
+    """evict_idle_models'ın process worker'larındaki karşılığı (olay döngüsü yok, thread'de çalışır)"""
+    while True:
+        time.sleep(idle_sweep_interval())
+        registry.evict_idle()
 
 app = FastAPI(
     title="HealthAI API",
     description="Yapay Zeka Destekli Sağlık Risk Değerlendirme Platformu",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS ayarları
@@ -29,52 +78,219 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Model dizini
-MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+# Örneklenen tahmin isteklerinin aşama süreleri (HEALTHAI_METRICS_SAMPLE; kapalıyken doğrudan geçer)
+app.add_middleware(StageMetricsMiddleware, models=frozenset(MODEL_DIRS))
+
+# Tüm tahmin isteklerinin sayısı, hızı ve gecikmesi (/api/statistics)
+request_stats = RequestStats()
+app.add_middleware(RequestStatsMiddleware, stats=request_stats, models=frozenset(MODEL_DIRS))
+
+# İstatistiksel profil çıkarıcı; yalnızca HEALTHAI_PROFILE_TOKEN tanımlıysa eklenir (kapalıyken maliyetsiz)
+profiler = SamplingProfiler() if PROFILE_TOKEN else None
+if profiler is not None:
+    app.add_middleware(ProfilerMiddleware, profiler=profiler)
+
+# DataFrame'siz NumPy hızlı yolu (HEALTHAI_FAST_PATH=0 ile pandas yoluna dönülür)
+FAST_PATH = os.environ.get("HEALTHAI_FAST_PATH", "1") == "1"
+
+# m3 ölçekleyicisini yükleme anında m1/m2 ağaç eşiklerine katla (HEALTHAI_FOLD_SCALER=1); katlanmış
+# eşikler düz değerlendiricide float64 karşılaştırılır, sonuçlar katlanmamış modelle birebir aynıdır.
+# Katlama yalnızca isteği FlatEnsemble karşıladığında (<= HEALTHAI_FLAT_MAX_ROWS satır) uygulanır;
+# daha büyük batch'ler sklearn yolunda scaler.transform + predict_proba ile aynen hesaplanır
+FOLD_SCALER = os.environ.get("HEALTHAI_FOLD_SCALER", "0") == "1"
+
+# Tahmin motoru: "sklearn" (predict_proba) veya "flat" (düz dizi değerlendirici)
+ENGINE = os.environ.get("HEALTHAI_ENGINE", "sklearn")
+# Flat motor bu satır sayısına kadar kullanılır; daha büyük batch'ler sklearn'e gider
+FLAT_MAX_ROWS = int(os.environ.get("HEALTHAI_FLAT_MAX_ROWS", "128"))
+# Model dosya biçimi: "pickle" (m1/m2/m3.pkl) veya "mmap" (model_store.py ile dönüştürülmüş
+# model/<hastalık>/flat/*.npy; worker'lar arasında paylaşılan sayfa önbelleği)
+MODEL_FORMAT = os.environ.get("HEALTHAI_MODEL_FORMAT", "pickle")
 
 # ============== MODEL CLASSES ==============
 
+def _pandas():
+    """pandas yalnızca pandas yolunda (HEALTHAI_FAST_PATH=0) ilk kullanımda yüklenir (~0.3 sn import)"""
+    import pandas
+    return pandas
+
+
 class BaseRiskAssessment:
     """Temel risk değerlendirme sınıfı"""
     
-    def __init__(self, model_prefix: str):
+    def __init__(self, model_prefix: str, fold: Optional[bool] = None, engine: Optional[str] = None,
+                 model_format: Optional[str] = None):
         self.model_prefix = model_prefix
         self.rf_model = None
         self.gb_model = None
         self.scaler = None
+        self.flat = None
+        self.load_error = None
+        self.fold = FOLD_SCALER if fold is None else fold
+        self.engine = ENGINE if engine is None else engine
+        self.flat_max_rows = FLAT_MAX_ROWS
+        self.model_format = MODEL_FORMAT if model_format is None else model_format
+        # True ise ağaç eşikleri ham özellik uzayındadır, istekte ölçekleme yapılmaz
+        self.scaler_folded = False
+        # Çalışma anında değiştirilebilir; False ise pandas yolu kullanılır
+        self.fast_path = FAST_PATH
+        self._getters = {}
+        self._local = threading.local()
         self.load_models()
     
     def load_models(self):
+        if self.model_format == "mmap":
+            try:
+                # Ağaçlar ve katlanmış ölçekleme düz dizilerde; pickle/sklearn gerekmez
+                self.flat = model_store.load(self.model_prefix)
+                self.scaler_folded = True
+                print(f"✅ {self.model_prefix} modelleri yüklendi (mmap)")
+                return
+            except Exception as e:
+                print(f"⚠️ {self.model_prefix} mmap modeli açılamadı, pickle kullanılacak: {e}")
         try:
-            model_path = os.path.join(MODEL_DIR, "models", self.model_prefix)
-            with open(os.path.join(model_path, "m1.pkl"), "rb") as f:
+            path = model_path(self.model_prefix)
+            with open(os.path.join(path, "m1.pkl"), "rb") as f:
                 self.rf_model = pickle.load(f)
-            with open(os.path.join(model_path, "m2.pkl"), "rb") as f:
+            with open(os.path.join(path, "m2.pkl"), "rb") as f:
                 self.gb_model = pickle.load(f)
-            with open(os.path.join(model_path, "m3.pkl"), "rb") as f:
+            with open(os.path.join(path, "m3.pkl"), "rb") as f:
                 self.scaler = pickle.load(f)
+            if self.engine == "flat" or self.fold:
+                # Düz değerlendirici ölçeklemeyi her zaman kendi eşiklerine katlar (ham girdi alır).
+                # Katlama sklearn ağaçlarına uygulanmaz: sklearn girdiyi float32'ye çevirdiğinden
+                # float32'de temsil edilemeyen ham değerlerde farklı dal seçebilir. flat_max_rows'tan
+                # büyük batch'ler katlanmamış ağaçlara ölçeklenerek gider (ölçekleme orada ihmal edilir).
+                self.flat = FlatEnsemble.from_estimators(self.rf_model, self.gb_model, self.scaler)
             print(f"✅ {self.model_prefix} modelleri yüklendi")
         except Exception as e:
+            self.load_error = str(e)
             print(f"⚠️ {self.model_prefix} modelleri yüklenemedi: {e}")
     
-    def predict(self, data: dict, feature_order: list) -> dict:
-        if not self.rf_model or not self.gb_model or not self.scaler:
+    @property
+    def is_loaded(self) -> bool:
+        if self.flat is not None:
+            return True
+        return self.rf_model is not None and self.gb_model is not None and self.scaler is not None
+    
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        """StandardScaler.transform ile aynı aritmetik, X üzerinde yerinde uygulanır"""
+        if self.scaler_folded:
+            return X
+        if self.scaler.with_mean:
+            X -= self.scaler.mean_
+        if self.scaler.with_std:
+            X /= self.scaler.scale_
+        return X
+    
+    def _pack_row(self, data, feature_order: list) -> np.ndarray:
+        """Alanları iş parçacığına özel, önceden ayrılmış (1, n) float64 satıra yaz"""
+        key = tuple(feature_order)
+        getters = self._getters.get(key)
+        if getters is None:
+            getters = self._getters[key] = (operator.attrgetter(*key), operator.itemgetter(*key))
+        row = getattr(self._local, "row", None)
+        if row is None or row.shape[1] != len(key):
+            row = self._local.row = np.empty((1, len(key)), dtype=np.float64)
+        row[0] = getters[1](data) if isinstance(data, dict) else getters[0](data)
+        return row
+    
+    def _components(self, X, t=None) -> tuple:
+        """Ham özelliklerden (rf_proba, gb_proba)
+
+        X: DataFrame (pandas yolu) veya üzerine yazılabilir float64 ndarray.
+        t: örneklenen çağrının StageTimer'ı (metrics.timer) veya None.
+        """
+        if self.flat is not None and (self.rf_model is None or len(X) <= self.flat_max_rows):
+            components = self.flat.predict_components(np.asarray(X, dtype=np.float64))
+            if t is not None:
+                t.lap("flat_predict")
+            return components
+        if isinstance(X, np.ndarray):
+            X_scaled = self._scale(X)
+        else:
+            X_scaled = X.to_numpy(dtype=np.float64) if self.scaler_folded else self.scaler.transform(X)
+        if t is not None:
+            t.lap("scaler")
+        rf_proba = self.rf_model.predict_proba(X_scaled)
+        if t is not None:
+            t.lap("rf_predict_proba")
+        gb_proba = self.gb_model.predict_proba(X_scaled)
+        if t is not None:
+            t.lap("gb_predict_proba")
+        return rf_proba, gb_proba
+    
+    def predict(self, data, feature_order: list) -> dict:
+        """data: doğrulanmış Pydantic nesnesi veya sözlük"""
+        if not self.is_loaded:
             raise HTTPException(status_code=503, detail="Model yüklenemedi")
         
-        df = pd.DataFrame([data])
-        df = df[feature_order]
-        X_scaled = self.scaler.transform(df)
+        t = timer(self.model_prefix, "predict")
+        if self.fast_path:
+            X = self._pack_row(data, feature_order)
+        else:
+            if isinstance(data, BaseModel):
+                data = data.model_dump()
+            df = _pandas().DataFrame([data])
+            X = df[feature_order]
+        if t is not None:
+            t.lap("pack" if self.fast_path else "dataframe")
         
-        rf_proba = self.rf_model.predict_proba(X_scaled)[0]
-        gb_proba = self.gb_model.predict_proba(X_scaled)[0]
+        rf_proba, gb_proba = self._components(X, t)
+        rf_proba, gb_proba = rf_proba[0], gb_proba[0]
         ensemble_proba = (rf_proba + gb_proba) / 2
         
-        return {
+        result = {
             "predicted_class": int(np.argmax(ensemble_proba)),
             "probabilities": ensemble_proba.tolist(),
             "rf_proba": rf_proba.tolist(),
             "gb_proba": gb_proba.tolist()
         }
+        if t is not None:
+            t.lap("output")
+        return result
+    
+    def predict_arrays(self, X: np.ndarray, feature_order: list, t=None) -> tuple:
+        """N satır için (ensemble_proba, rf_proba, gb_proba) dizileri; X değiştirilmez"""
+        if self.fast_path:
+            X = np.array(X, dtype=np.float64)
+        else:
+            X = _pandas().DataFrame(X, columns=feature_order)
+        if t is not None:
+            t.lap("pack" if self.fast_path else "dataframe")
+        rf_proba, gb_proba = self._components(X, t)
+        return (rf_proba + gb_proba) / 2, rf_proba, gb_proba
+    
+    def predict_batch(self, X: np.ndarray, feature_order: list) -> list:
+        """N satırlık matrisi tek scaler + predict_proba çağrısıyla değerlendir"""
+        if not self.is_loaded:
+            raise HTTPException(status_code=503, detail="Model yüklenemedi")
+        
+        t = timer(self.model_prefix, "predict_batch")
+        ensemble_proba, rf_proba, gb_proba = self.predict_arrays(X, feature_order, t)
+        
+        results = [
+            {
+                "predicted_class": predicted_class,
+                "probabilities": probabilities,
+                "rf_proba": rf,
+                "gb_proba": gb
+            }
+            for predicted_class, probabilities, rf, gb in zip(
+                np.argmax(ensemble_proba, axis=1).tolist(), ensemble_proba.tolist(),
+                rf_proba.tolist(), gb_proba.tolist()
+            )
+        ]
+        if t is not None:
+            t.lap("output")
+        return results
+
+def load_assessment(model_id: str) -> BaseRiskAssessment:
+    """Registry fabrikası: dosyaları eksik modeller için hata fırlatır"""
+    model = BaseRiskAssessment(model_id)
+    if not model.is_loaded:
+        raise RuntimeError(model.load_error)
+    return model
 
 # ============== PYDANTIC MODELS ==============
 
@@ -171,14 +387,91 @@ class AnimalBiteInput(BaseModel):
     Hospital_Time_Hours: float = Field(..., ge=0.25, le=24, description="Hastane Süresi (saat)")
     Chronic_Disease: int = Field(..., ge=0, le=1, description="Kronik Hastalık")
 
+# Yanıt şemaları yalnızca OpenAPI belgesi içindir; endpoint'ler gövdeyi önceden kodlanmış
+# baytlarla döndürdüğü için çalışma zamanında doğrulama/serileştirme yapılmaz
+
+class EnsembleOutput(BaseModel):
+    predicted_class: int
+    probabilities: List[float]
+    rf_proba: List[float]
+    gb_proba: List[float]
+
+class RulePrediction(BaseModel):
+    risk_level: str
+    severity: int
+    risk_score: int
+    probabilities: Dict[str, int]
+
+class Recommendations(BaseModel):
+    doctor: str
+    treatment: str
+    lifestyle: List[str]
+    urgency: str
+    animal: Optional[str] = Field(None, description="Yalnızca hayvan ısırığı")
+    special: Optional[str] = Field(None, description="Yalnızca hayvan ısırığı")
+
+class PredictionResult(BaseModel):
+    prediction: RulePrediction
+    recommendations: Recommendations
+    ensemble: Optional[EnsembleOutput]
+
+class PredictionResponse(PredictionResult):
+    success: bool
+
+class BatchPredictionResponse(BaseModel):
+    success: bool
+    count: int
+    results: List[PredictionResult]
+
+PREDICTION_RESPONSES = {200: {"model": PredictionResponse}}
+BATCH_RESPONSES = {200: {"model": BatchPredictionResponse}}
+
 # ============== RISK ASSESSMENT INSTANCES ==============
 
-# Model instances (lazy loading)
-asthma_model = None
-diabetes_model = None
-hypertension_model = None
-parkinson_model = None
-animal_bite_model = None
+# Süreç genelinde paylaşılan model örnekleri (ilk istekte yüklenir, boşta kalınca atılır)
+registry = ModelRegistry(load_assessment, MODEL_DIRS)
+
+def preload_worker():
+    """Process havuzundaki her worker kendi kayıt defterini önceden yükler ve boştaki modelleri atar"""
+    registry.preload()
+    if registry.ttl:
+        threading.Thread(target=sweep_idle_models, name="model-sweeper", daemon=True).start()
+
+def worker_status(estimators: bool = False) -> dict:
+    """Çağrıyı alan process worker'ının kayıt defteri durumu
+
+    estimators=True ise yüklü modellerin özellik sayıları ve önemleri de döner (model_id -> özet veya None).
+    """
+    status = {"pid": os.getpid(), "models": registry.status()}
+    if estimators:
+        status["estimators"] = {model_id: model_summaries.estimator(model_id) for model_id in registry.entries}
+    return status
+
+# Ensemble çıkarımı olay döngüsünü bloklamasın diye havuzda çalışır (HEALTHAI_EXECUTOR)
+executor = InferenceExecutor(initializer=preload_worker)
+
+async def run_ensemble_batch(model_id: str, X: np.ndarray) -> tuple:
+    return await executor.run(ensemble_predictions, model_id, X)
+
+# Eş zamanlı tek hasta isteklerini hastalık başına birleştirir (HEALTHAI_MICROBATCH=1)
+batcher = MicroBatcher(run_ensemble_batch) if MICROBATCH else None
+
+# Tekrarlanan girdiler için ensemble sonuç önbelleği (HEALTHAI_CACHE_MB=0 ile kapanır)
+prediction_cache = PredictionCache()
+
+# Model adları ve açıklamaları (/api/models); diğer alanlar registry'den hesaplanır
+MODEL_DESCRIPTIONS = {
+    "asthma": ("Astım Risk Değerlendirme",
+               "Akciğer fonksiyonları ve çevresel faktörlere dayalı astım riski tahmini"),
+    "diabetes": ("Diyabet Risk Değerlendirme",
+                 "Yaşam tarzı ve sağlık faktörlerine dayalı diyabet riski tahmini"),
+    "hypertension": ("Hipertansiyon Risk Değerlendirme",
+                     "Kardiyovasküler faktörlere dayalı yüksek tansiyon riski tahmini"),
+    "parkinson": ("Parkinson Risk Değerlendirme",
+                  "Motor ve ses özelliklerine dayalı Parkinson riski tahmini"),
+    "animal_bite": ("Hayvan Isırığı Risk Değerlendirme",
+                    "Akdeniz bölgesi hayvan ısırığı/sokması aciliyet tahmini"),
+}
 
 # Feature orders
 ASTHMA_FEATURES = [
@@ -215,6 +508,206 @@ ANIMAL_BITE_FEATURES = [
     'First_Aid_Applied', 'Hospital_Time_Hours', 'Chronic_Disease'
 ]
 
+# Tek istekte kabul edilen en fazla satır sayısı
+MAX_BATCH_SIZE = 10000
+
+# ============== RULE SCORING ==============
+
+FEATURE_ORDERS = {
+    "asthma": ASTHMA_FEATURES,
+    "diabetes": DIABETES_FEATURES,
+    "hypertension": HYPERTENSION_FEATURES,
+    "parkinson": PARKINSON_FEATURES,
+    "animal_bite": ANIMAL_BITE_FEATURES,
+}
+
+# Dosya özetleri ve özellik önemleri; model sürümü değişene kadar önbellekte
+model_summaries = ModelSummaries(registry, FEATURE_ORDERS)
+
+INPUT_SCHEMAS = {
+    "asthma": AsthmaInput,
+    "diabetes": DiabetesInput,
+    "hypertension": HypertensionInput,
+    "parkinson": ParkinsonInput,
+    "animal_bite": AnimalBiteInput,
+}
+
+# HEALTHAI_VALIDATION=vector: batch gövdeleri Pydantic nesnesi kurulmadan doğrulanır
+VALIDATORS = {
+    model_id: SchemaValidator(schema, FEATURE_ORDERS[model_id])
+    for model_id, schema in INPUT_SCHEMAS.items()
+}
+
+# Kural tabloları import sırasında bir kez derlenir
+SCORERS = {
+    model_id: RuleScorer(RULES[model_id], features, RESPONSE_SPECS[model_id]["cuts"])
+    for model_id, features in FEATURE_ORDERS.items()
+}
+
+def rows_to_matrix(rows: list, feature_order: list) -> np.ndarray:
+    """Pydantic satırlarını özellik sırasına göre float64 matrise dönüştür"""
+    X = np.empty((len(rows), len(feature_order)), dtype=np.float64)
+    for i, row in enumerate(rows):
+        X[i] = [getattr(row, f) for f in feature_order]
+    return X
+
+def score_rows(model_id: str, X: np.ndarray) -> list:
+    """Satırları tek vektörel geçişte skorla ve 'prediction' sözlüklerini döndür"""
+    risk_scores, severities = SCORERS[model_id].score(X)
+    return build_predictions(RESPONSE_SPECS[model_id], risk_scores, severities)
+
+def ensemble_prediction(model_id: str, data: BaseModel) -> Optional[dict]:
+    """Tek hasta için ML ensemble tahmini; modeli bulunmayan hastalıklar için None"""
+    model = registry.get(model_id)
+    if model is None:
+        return None
+    return model.predict(data, FEATURE_ORDERS[model_id])
+
+def ensemble_predictions(model_id: str, X: np.ndarray) -> list:
+    model = registry.get(model_id)
+    if model is None:
+        return [None] * len(X)
+    return model.predict_batch(X, FEATURE_ORDERS[model_id])
+
+async def dispatch(response: Response, job) -> Any:
+    """(sonuç, bekleme ms) döndüren işi bekle; kuyrukta bekleme süresini başlığa yaz"""
+    try:
+        result, wait_ms = await job
+    except QueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "1"})
+    except ExecutorUnavailable as e:
+        raise HTTPException(status_code=503, detail=f"Çıkarım havuzu kullanılamıyor: {e}")
+    response.headers["X-Queue-Wait-Ms"] = f"{wait_ms:.3f}"
+    return result
+
+async def run_inference(response: Response, fn, *args):
+    """fn(*args)'ı yürütücüde çalıştır"""
+    return await dispatch(response, executor.run(fn, *args))
+
+async def serving_status(response: Response, estimators: bool = False) -> dict:
+    """Tahminleri sunan kayıt defterinin model durumları ve süreci (worker_status biçiminde)
+
+    Process havuzunda ana sürecin kayıt defteri hiç yüklenmez; durum havuzdaki bir worker'dan
+    (pid ile belirtilir) alınır. Worker'lar aynı HEALTHAI_PRELOAD ile başladığından durumları
+    ancak ilk istekte yüklenen veya boşta atılan modellerde farklılaşır.
+    """
+    if executor.kind != "process":
+        return dict(worker_status(estimators), pid=None)
+    return await run_inference(response, worker_status, estimators)
+
+async def serving_summaries(response: Response) -> dict:
+    """model_id -> model_summaries.model; durum ve yüklü model özeti tahminleri sunan süreçten alınır"""
+    status = await serving_status(response, estimators=True)
+    return {
+        entry["id"]: model_summaries.model(entry["id"], entry["state"], status["estimators"][entry["id"]])
+        for entry in status["models"]
+    }
+
+async def infer_one(response: Response, model_id: str, data: BaseModel, X: np.ndarray) -> Optional[dict]:
+    """Tek hasta ensemble tahmini; önbellekte yoksa (mikro-batch açıksa birleştirilerek) hesaplanır"""
+    lap("rules")
+    key = None
+    if prediction_cache.enabled:
+        key = cache_key(model_id, registry.version(model_id), X[0])
+        hit, result = prediction_cache.get(key)
+        response.headers["X-Cache"] = "hit" if hit else "miss"
+        if hit:
+            lap("ensemble")
+            return result
+    if batcher is not None and registry.entries[model_id].state != "failed":
+        result = await dispatch(response, batcher.submit(model_id, X[0]))
+    else:
+        result = await run_inference(response, ensemble_prediction, model_id, data)
+    if key is not None:
+        prediction_cache.put(key, result)
+    lap("ensemble")
+    return result
+
+async def infer_batch(response: Response, model_id: str, X: np.ndarray) -> list:
+    """Batch ensemble tahmini; yalnızca önbellekte olmayan satırlar hesaplanır"""
+    lap("rules")
+    if not prediction_cache.enabled:
+        results = await run_inference(response, ensemble_predictions, model_id, X)
+        lap("ensemble")
+        return results
+    version = registry.version(model_id)
+    keys = [cache_key(model_id, version, row) for row in X]
+    results, missing = [], []
+    for i, key in enumerate(keys):
+        hit, result = prediction_cache.get(key)
+        results.append(result)
+        if not hit:
+            missing.append(i)
+    response.headers["X-Cache-Hits"] = str(len(keys) - len(missing))
+    if missing:
+        computed = await run_inference(response, ensemble_predictions, model_id, X[missing])
+        for i, result in zip(missing, computed):
+            results[i] = result
+            prediction_cache.put(keys[i], result)
+    lap("ensemble")
+    return results
+
+def batch_matrix(model_id: str, rows: list) -> np.ndarray:
+    """Batch gövdesini (vector modunda burada doğrulanarak) özellik matrisine dönüştür"""
+    if VALIDATION == "vector":
+        # Boyut, satırlar doğrulanmadan önce kontrol edilir; liste olmayan gövdeye matrix() 422 verir
+        if type(rows) is list:
+            check_batch_size(rows)
+        X = VALIDATORS[model_id].matrix(rows)
+    else:
+        check_batch_size(rows)
+        X = rows_to_matrix(rows, FEATURE_ORDERS[model_id])
+    lap("validation")
+    return X
+
+def check_batch_size(rows: list):
+    if not rows:
+        raise HTTPException(status_code=422, detail="Boş liste gönderildi")
+    if len(rows) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Tek istekte en fazla {MAX_BATCH_SIZE} satır gönderilebilir"
+        )
+
+def result_prefix(prediction: dict, recommendations: bytes) -> bytes:
+    """'"prediction":...,"recommendations":...,"ensemble":' alanları (süslü parantezsiz)"""
+    return (
+        b'"prediction":' + encode_json(prediction)
+        + b',"recommendations":' + recommendations + b',"ensemble":'
+    )
+
+def body_prefix(prediction: dict, recommendations: bytes) -> bytes:
+    """Yanıt gövdesinin '"ensemble":' alanına kadar olan kısmı"""
+    return b'{"success":true,' + result_prefix(prediction, recommendations)
+
+def x_headers(response: Response) -> dict:
+    """Endpoint'in Response parametresine yazılan X-* başlıkları"""
+    return {name: value for name, value in response.headers.items() if name.startswith("x-")}
+
+def spliced_response(response: Response, prefix: bytes, ensemble: Optional[dict]) -> Response:
+    """Önceden serileştirilmiş gövdeye ensemble sonucunu ekle; X-* başlıkları korunur"""
+    body = prefix + encode_ensemble(ensemble) + b"}"
+    lap("response")
+    return Response(body, media_type="application/json", headers=x_headers(response))
+
+def prediction_response(response: Response, prediction: dict, recommendations: bytes,
+                        ensemble: Optional[dict]) -> Response:
+    return spliced_response(response, body_prefix(prediction, recommendations), ensemble)
+
+def batch_response(response: Response, predictions: list, recommendations: list, ensembles: list) -> Response:
+    """recommendations: her satırın önceden kodlanmış öneri baytları"""
+    results = b",".join(
+        b"{" + result_prefix(prediction, recommendation) + encode_ensemble(ensemble) + b"}"
+        for prediction, recommendation, ensemble in zip(predictions, recommendations, ensembles)
+    )
+    body = b'{"success":true,"count":%d,"results":[' % len(predictions) + results + b"]}"
+    lap("response")
+    return Response(body, media_type="application/json", headers=x_headers(response))
+
+def json_response(content) -> Response:
+    """JSONResponse ile aynı gövde; HEALTHAI_JSON=orjson ise orjson ile kodlanır"""
+    return Response(encode_json(content), media_type="application/json")
+
 # ============== API ENDPOINTS ==============
 
 @app.get("/")
@@ -227,470 +720,405 @@ async def root():
     }
 
 @app.get("/api/health")
-async def health_check():
-    return {"status": "healthy", "models_loaded": True}
-
-@app.get("/api/models")
-async def get_models_info():
+async def health_check(response: Response):
+    """Registry'deki gerçek yükleme durumu; yüklenemeyen modellerde tahminler yalnızca kurallarla verilir"""
+    status = await serving_status(response)
+    states = {entry["id"]: entry["state"] for entry in status["models"]}
     return {
-        "models": [
-            {
-                "id": "asthma",
-                "name": "Astım Risk Değerlendirme",
-                "accuracy": 94.8,
-                "features": 26,
-                "description": "Akciğer fonksiyonları ve çevresel faktörlere dayalı astım riski tahmini"
-            },
-            {
-                "id": "diabetes",
-                "name": "Diyabet Risk Değerlendirme",
-                "accuracy": 92.5,
-                "features": 21,
-                "description": "Yaşam tarzı ve sağlık faktörlerine dayalı diyabet riski tahmini"
-            },
-            {
-                "id": "hypertension",
-                "name": "Hipertansiyon Risk Değerlendirme",
-                "accuracy": 89.3,
-                "features": 10,
-                "description": "Kardiyovasküler faktörlere dayalı yüksek tansiyon riski tahmini"
-            },
-            {
-                "id": "parkinson",
-                "name": "Parkinson Risk Değerlendirme",
-                "accuracy": 85.0,
-                "features": 13,
-                "description": "Motor ve ses özelliklerine dayalı Parkinson riski tahmini"
-            },
-            {
-                "id": "animal_bite",
-                "name": "Hayvan Isırığı Risk Değerlendirme",
-                "accuracy": 87.5,
-                "features": 13,
-                "description": "Akdeniz bölgesi hayvan ısırığı/sokması aciliyet tahmini"
-            }
-        ]
+        "status": "degraded" if "failed" in states.values() else "healthy",
+        "models_loaded": all(state == "ready" for state in states.values()),
+        "models": states,
+        "worker_pid": status["pid"],
+        "uptime_s": round(time.time() - request_stats.started, 1),
     }
 
+@app.get("/api/models")
+async def get_models_info(response: Response):
+    """Model başına durum, sürüm, dosya özetleri ve yüklü modelden okunan özellik sayısı"""
+    summaries = await serving_summaries(response)
+    models = []
+    for model_id, (name, description) in MODEL_DESCRIPTIONS.items():
+        summary = summaries[model_id]
+        models.append({
+            "id": model_id,
+            "name": name,
+            "description": description,
+            **{key: value for key, value in summary.items() if key != "feature_importance"},
+        })
+    return json_response({"models": models})
+
+@app.get("/api/models/status")
+async def get_models_status(response: Response):
+    """Registry'deki her modelin yükleme durumu, süresi, bellek kullanımı, yürütücü kuyruğu, mikro-batch ve önbellek sayaçları"""
+    status = await serving_status(response)
+    return json_response({
+        "models": status["models"],
+        "worker_pid": status["pid"],
+        "executor": executor.status(),
+        "microbatch": batcher.status() if batcher is not None else None,
+        "cache": prediction_cache.status()
+    })
+
+@app.get("/api/metrics")
+async def get_metrics():
+    """Örneklenen isteklerin model/rota/aşama başına süre histogramları (Prometheus metin biçimi)"""
+    return Response(STAGES.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+def require_profiler(token: Optional[str]) -> SamplingProfiler:
+    if profiler is None:
+        raise HTTPException(status_code=404, detail="Profil modu kapalı (HEALTHAI_PROFILE_TOKEN)")
+    if not is_admin(token):
+        raise HTTPException(status_code=403, detail="Geçersiz X-HealthAI-Profile başlığı")
+    return profiler
+
+@app.get("/api/profile")
+async def get_profile(reset: bool = False, x_healthai_profile: Optional[str] = Header(None)):
+    """Profillenen isteklerde toplanan katlanmış yığınlar (flamegraph.pl / speedscope girdisi)"""
+    active = require_profiler(x_healthai_profile)
+    status = active.status()
+    headers = {f"X-Profile-{key.replace('_', '-').title()}": str(value) for key, value in status.items()}
+    return Response(active.collapsed(reset=reset), media_type="text/plain; charset=utf-8", headers=headers)
+
+@app.put("/api/profile")
+async def set_profile(sample: float, x_healthai_profile: Optional[str] = Header(None)):
+    """Profillenecek tahmin isteklerinin oranını yeniden başlatmadan değiştir (0: yalnızca başlıkla)"""
+    active = require_profiler(x_healthai_profile)
+    active.set_sample_rate(sample)
+    return json_response(active.status())
+
 @app.get("/api/statistics")
-async def get_statistics():
-    return {
-        "total_models": 5,
-        "avg_accuracy": 89.8,
-        "total_features": 83,
+async def get_statistics(response: Response):
+    """Yüklü modellerin özellik sayıları ve önemleri, kayıtlı doğruluklar, canlı istek hızı ve gecikmeleri"""
+    summaries = await serving_summaries(response)
+    accuracies = [summary["accuracy"] for summary in summaries.values() if summary["accuracy"] is not None]
+    return json_response({
+        "total_models": len(summaries),
+        "models_ready": sum(summary["state"] == "ready" for summary in summaries.values()),
+        "avg_accuracy": round(sum(accuracies) / len(accuracies), 1) if accuracies else None,
+        "total_features": sum(summary["features"] or 0 for summary in summaries.values()),
         "diseases_covered": ["Astım", "Diyabet", "Hipertansiyon", "Parkinson", "Hayvan Isırıkları"],
         "model_performance": {
-            "asthma": {"accuracy": 94.8, "precision": 0.93, "recall": 0.95, "f1": 0.94},
-            "diabetes": {"accuracy": 92.5, "precision": 0.91, "recall": 0.93, "f1": 0.92},
-            "hypertension": {"accuracy": 89.3, "precision": 0.88, "recall": 0.90, "f1": 0.89},
-            "parkinson": {"accuracy": 85.0, "precision": 0.83, "recall": 0.86, "f1": 0.84},
-            "animal_bite": {"accuracy": 87.5, "precision": 0.86, "recall": 0.88, "f1": 0.87}
+            model_id: {"accuracy": summary["accuracy"], "features": summary["features"]}
+            for model_id, summary in summaries.items()
         },
         "feature_importance": {
-            "asthma": [
-                {"feature": "Toz Maruziyeti", "importance": 8.97},
-                {"feature": "FVC", "importance": 8.49},
-                {"feature": "Polen Maruziyeti", "importance": 8.46},
-                {"feature": "BMI", "importance": 8.44},
-                {"feature": "FEV1", "importance": 8.35}
-            ],
-            "parkinson": [
-                {"feature": "Jitter", "importance": 19.9},
-                {"feature": "Bradikinezi", "importance": 11.6},
-                {"feature": "Tremor", "importance": 11.5},
-                {"feature": "Rijidite", "importance": 11.4},
-                {"feature": "Shimmer", "importance": 10.0}
-            ]
-        }
-    }
-
-# Prediction endpoints (simplified for demo - returns mock data)
-@app.post("/api/predict/asthma")
-async def predict_asthma(data: AsthmaInput):
-    input_dict = data.model_dump()
-    
-    # Risk calculation based on key factors
-    risk_score = 0
-    if input_dict['Smoking'] == 1: risk_score += 15
-    if input_dict['FamilyHistoryAsthma'] == 1: risk_score += 12
-    if input_dict['HistoryOfAllergies'] == 1: risk_score += 10
-    if input_dict['Wheezing'] == 1: risk_score += 18
-    if input_dict['ShortnessOfBreath'] == 1: risk_score += 15
-    if input_dict['DustExposure'] > 6: risk_score += 10
-    if input_dict['PollenExposure'] > 6: risk_score += 8
-    if input_dict['LungFunctionFEV1'] < 2.5: risk_score += 12
-    
-    risk_score = min(risk_score, 100)
-    
-    if risk_score < 20:
-        risk_level, severity = "Çok Düşük", 0
-    elif risk_score < 40:
-        risk_level, severity = "Düşük", 1
-    elif risk_score < 65:
-        risk_level, severity = "Orta", 2
-    else:
-        risk_level, severity = "Yüksek", 3
-    
-    return {
-        "success": True,
-        "prediction": {
-            "risk_level": risk_level,
-            "severity": severity,
-            "risk_score": risk_score,
-            "probabilities": {
-                "no_risk": max(0, 100 - risk_score - 10),
-                "low": 15 if severity >= 1 else 5,
-                "medium": 25 if severity >= 2 else 5,
-                "high": risk_score if severity == 3 else 5
-            }
+            model_id: summary["feature_importance"][:TOP_FEATURES]
+            for model_id, summary in summaries.items() if summary["feature_importance"]
         },
-        "recommendations": get_asthma_recommendations(severity)
-    }
+        "requests": request_stats.summary(),
+        "uptime_s": round(time.time() - request_stats.started, 1),
+    })
 
-@app.post("/api/predict/diabetes")
-async def predict_diabetes(data: DiabetesInput):
-    input_dict = data.model_dump()
-    
-    risk_score = 0
-    if input_dict['HighBP'] == 1: risk_score += 15
-    if input_dict['HighChol'] == 1: risk_score += 12
-    if input_dict['BMI'] > 30: risk_score += 20
-    elif input_dict['BMI'] > 25: risk_score += 10
-    if input_dict['Smoker'] == 1: risk_score += 8
-    if input_dict['HeartDiseaseorAttack'] == 1: risk_score += 15
-    if input_dict['PhysActivity'] == 0: risk_score += 10
-    if input_dict['GenHlth'] >= 4: risk_score += 10
-    if input_dict['Age'] >= 9: risk_score += 10
-    
-    risk_score = min(risk_score, 100)
-    
-    if risk_score < 25:
-        risk_level, severity = "Minimal", 0
-    elif risk_score < 50:
-        risk_level, severity = "Düşük", 1
-    elif risk_score < 75:
-        risk_level, severity = "Orta (Prediyabet)", 2
-    else:
-        risk_level, severity = "Yüksek (Diyabet)", 3
-    
-    return {
-        "success": True,
-        "prediction": {
-            "risk_level": risk_level,
-            "severity": severity,
-            "risk_score": risk_score,
-            "probabilities": {
-                "minimal": max(0, 100 - risk_score),
-                "low": 20 if severity >= 1 else 5,
-                "prediabetes": 30 if severity >= 2 else 5,
-                "diabetes": risk_score if severity == 3 else 5
-            }
-        },
-        "recommendations": get_diabetes_recommendations(severity)
-    }
+# Tahmin endpoint'leri: kural tabanlı skor + öneriler ve registry'deki modelden ensemble çıktısı
+@app.post("/api/predict/asthma", responses=PREDICTION_RESPONSES)
+async def predict_asthma(data: AsthmaInput, response: Response):
+    lap("validation")
+    X = rows_to_matrix([data], ASTHMA_FEATURES)
+    prediction = score_rows("asthma", X)[0]
+    ensemble = await infer_one(response, "asthma", data, X)
+    return prediction_response(
+        response, prediction, RECOMMENDATION_BYTES["asthma"][prediction["severity"]], ensemble
+    )
 
-@app.post("/api/predict/hypertension")
-async def predict_hypertension(data: HypertensionInput):
-    input_dict = data.model_dump()
-    
-    risk_score = 0
-    if input_dict['Age'] > 60: risk_score += 15
-    elif input_dict['Age'] > 45: risk_score += 8
-    if input_dict['Salt_Intake'] > 8: risk_score += 18
-    elif input_dict['Salt_Intake'] > 6: risk_score += 10
-    if input_dict['Stress_Score'] > 7: risk_score += 12
-    if input_dict['Sleep_Duration'] < 6: risk_score += 8
-    if input_dict['BMI'] > 30: risk_score += 15
-    elif input_dict['BMI'] > 25: risk_score += 8
-    if input_dict['BP_History_Encoded'] == 2: risk_score += 20
-    elif input_dict['BP_History_Encoded'] == 1: risk_score += 10
-    if input_dict['Family_History_Encoded'] == 1: risk_score += 10
-    if input_dict['Exercise_Level_Encoded'] == 0: risk_score += 8
-    if input_dict['Smoking_Encoded'] == 1: risk_score += 12
-    
-    risk_score = min(risk_score, 100)
-    
-    if risk_score < 25:
-        risk_level, severity = "Minimal", 0
-    elif risk_score < 50:
-        risk_level, severity = "Prehipertansiyon", 1
-    elif risk_score < 75:
-        risk_level, severity = "Hipertansiyon", 2
-    else:
-        risk_level, severity = "İleri Hipertansiyon", 3
-    
-    return {
-        "success": True,
-        "prediction": {
-            "risk_level": risk_level,
-            "severity": severity,
-            "risk_score": risk_score,
-            "probabilities": {
-                "normal": max(0, 100 - risk_score),
-                "prehypertension": 25 if severity >= 1 else 5,
-                "hypertension": 35 if severity >= 2 else 5,
-                "severe": risk_score if severity == 3 else 5
-            }
-        },
-        "recommendations": get_hypertension_recommendations(severity)
-    }
+@app.post("/api/predict/diabetes", responses=PREDICTION_RESPONSES)
+async def predict_diabetes(data: DiabetesInput, response: Response):
+    lap("validation")
+    X = rows_to_matrix([data], DIABETES_FEATURES)
+    # Kural sonucu 384 hücrelik tablodan; gövde önceden serileştirilmiş
+    prefix = DIABETES_BODIES[DIABETES_TABLE.key(X[0].tolist())]
+    return spliced_response(response, prefix, await infer_one(response, "diabetes", data, X))
 
-@app.post("/api/predict/parkinson")
-async def predict_parkinson(data: ParkinsonInput):
-    input_dict = data.model_dump()
-    
-    risk_score = 0
-    if input_dict['age'] > 70: risk_score += 12
-    if input_dict['tremor_score'] > 3: risk_score += 18
-    elif input_dict['tremor_score'] > 1.5: risk_score += 10
-    if input_dict['rigidity'] > 3: risk_score += 15
-    if input_dict['bradykinesia'] > 3: risk_score += 18
-    if input_dict['postural_instability'] > 2.5: risk_score += 12
-    if input_dict['motor_updrs'] > 50: risk_score += 20
-    elif input_dict['motor_updrs'] > 30: risk_score += 10
-    if input_dict['levodopa_response'] < 50: risk_score += 10
-    if input_dict['disease_duration'] > 5: risk_score += 8
-    
-    risk_score = min(risk_score, 100)
-    
-    if risk_score < 25:
-        risk_level, severity = "Minimal", 0
-    elif risk_score < 50:
-        risk_level, severity = "Hafif", 1
-    elif risk_score < 75:
-        risk_level, severity = "Orta", 2
-    else:
-        risk_level, severity = "İleri", 3
-    
-    return {
-        "success": True,
-        "prediction": {
-            "risk_level": risk_level,
-            "severity": severity,
-            "risk_score": risk_score,
-            "probabilities": {
-                "no_risk": max(0, 100 - risk_score),
-                "mild": 25 if severity >= 1 else 5,
-                "moderate": 35 if severity >= 2 else 5,
-                "severe": risk_score if severity == 3 else 5
-            }
-        },
-        "recommendations": get_parkinson_recommendations(severity)
-    }
+@app.post("/api/predict/hypertension", responses=PREDICTION_RESPONSES)
+async def predict_hypertension(data: HypertensionInput, response: Response):
+    lap("validation")
+    X = rows_to_matrix([data], HYPERTENSION_FEATURES)
+    prediction = score_rows("hypertension", X)[0]
+    ensemble = await infer_one(response, "hypertension", data, X)
+    return prediction_response(
+        response, prediction, RECOMMENDATION_BYTES["hypertension"][prediction["severity"]], ensemble
+    )
 
-@app.post("/api/predict/animal_bite")
-async def predict_animal_bite(data: AnimalBiteInput):
-    input_dict = data.model_dump()
-    
-    risk_score = 0
-    # Animal type risk
-    animal_risks = {0: 25, 1: 15, 2: 18, 3: 22, 4: 10}  # Snake, Dog, Bee, Scorpion, Cat
-    risk_score += animal_risks.get(input_dict['Animal_Type'], 15)
-    
-    # Body part risk
-    body_risks = {0: 8, 1: 10, 2: 12, 3: 20, 4: 25}  # Lower ext, Upper ext, Hand, Face, Neck
-    risk_score += body_risks.get(input_dict['Body_Part'], 10)
-    
-    if input_dict['Allergy_History'] == 1: risk_score += 20
-    if input_dict['First_Aid_Applied'] == 0: risk_score += 15
-    if input_dict['Hospital_Time_Hours'] > 4: risk_score += 15
-    elif input_dict['Hospital_Time_Hours'] > 2: risk_score += 8
-    if input_dict['Chronic_Disease'] == 1: risk_score += 10
-    if input_dict['Age'] > 65 or input_dict['Age'] < 10: risk_score += 8
-    
-    risk_score = min(risk_score, 100)
-    
-    if risk_score < 25:
-        risk_level, severity = "Minimal", 0
-    elif risk_score < 50:
-        risk_level, severity = "Düşük", 1
-    elif risk_score < 75:
-        risk_level, severity = "Orta", 2
-    else:
-        risk_level, severity = "Yüksek - ACİL", 3
-    
-    return {
-        "success": True,
-        "prediction": {
-            "risk_level": risk_level,
-            "severity": severity,
-            "risk_score": risk_score,
-            "probabilities": {
-                "minimal": max(0, 100 - risk_score),
-                "low": 20 if severity >= 1 else 5,
-                "moderate": 30 if severity >= 2 else 5,
-                "emergency": risk_score if severity == 3 else 5
-            }
-        },
-        "recommendations": get_animal_bite_recommendations(severity, input_dict['Animal_Type'])
-    }
+@app.post("/api/predict/parkinson", responses=PREDICTION_RESPONSES)
+async def predict_parkinson(data: ParkinsonInput, response: Response):
+    lap("validation")
+    X = rows_to_matrix([data], PARKINSON_FEATURES)
+    prediction = score_rows("parkinson", X)[0]
+    ensemble = await infer_one(response, "parkinson", data, X)
+    return prediction_response(
+        response, prediction, RECOMMENDATION_BYTES["parkinson"][prediction["severity"]], ensemble
+    )
+
+@app.post("/api/predict/animal_bite", responses=PREDICTION_RESPONSES)
+async def predict_animal_bite(data: AnimalBiteInput, response: Response):
+    lap("validation")
+    X = rows_to_matrix([data], ANIMAL_BITE_FEATURES)
+    prediction = score_rows("animal_bite", X)[0]
+    ensemble = await infer_one(response, "animal_bite", data, X)
+    return prediction_response(
+        response, prediction,
+        RECOMMENDATION_BYTES["animal_bite"][prediction["severity"], data.Animal_Type], ensemble
+    )
+
+# Batch prediction endpoints - tüm liste tek vektörel geçişte skorlanır
+@app.post("/api/predict/asthma/batch", responses=BATCH_RESPONSES)
+async def predict_asthma_batch(data: batch_body(AsthmaInput), response: Response):
+    X = batch_matrix("asthma", data)
+    predictions = score_rows("asthma", X)
+    ensembles = await infer_batch(response, "asthma", X)
+    recommendations = RECOMMENDATION_BYTES["asthma"]
+    return batch_response(
+        response, predictions, [recommendations[p["severity"]] for p in predictions], ensembles
+    )
+
+@app.post("/api/predict/diabetes/batch", responses=BATCH_RESPONSES)
+async def predict_diabetes_batch(data: batch_body(DiabetesInput), response: Response):
+    X = batch_matrix("diabetes", data)
+    predictions = score_rows("diabetes", X)
+    ensembles = await infer_batch(response, "diabetes", X)
+    recommendations = RECOMMENDATION_BYTES["diabetes"]
+    return batch_response(
+        response, predictions, [recommendations[p["severity"]] for p in predictions], ensembles
+    )
+
+@app.post("/api/predict/hypertension/batch", responses=BATCH_RESPONSES)
+async def predict_hypertension_batch(data: batch_body(HypertensionInput), response: Response):
+    X = batch_matrix("hypertension", data)
+    predictions = score_rows("hypertension", X)
+    ensembles = await infer_batch(response, "hypertension", X)
+    recommendations = RECOMMENDATION_BYTES["hypertension"]
+    return batch_response(
+        response, predictions, [recommendations[p["severity"]] for p in predictions], ensembles
+    )
+
+@app.post("/api/predict/parkinson/batch", responses=BATCH_RESPONSES)
+async def predict_parkinson_batch(data: batch_body(ParkinsonInput), response: Response):
+    X = batch_matrix("parkinson", data)
+    predictions = score_rows("parkinson", X)
+    ensembles = await infer_batch(response, "parkinson", X)
+    recommendations = RECOMMENDATION_BYTES["parkinson"]
+    return batch_response(
+        response, predictions, [recommendations[p["severity"]] for p in predictions], ensembles
+    )
+
+@app.post("/api/predict/animal_bite/batch", responses=BATCH_RESPONSES)
+async def predict_animal_bite_batch(data: batch_body(AnimalBiteInput), response: Response):
+    X = batch_matrix("animal_bite", data)
+    predictions = score_rows("animal_bite", X)
+    ensembles = await infer_batch(response, "animal_bite", X)
+    recommendations = RECOMMENDATION_BYTES["animal_bite"]
+    animal_types = X[:, ANIMAL_BITE_FEATURES.index("Animal_Type")].astype(int).tolist()
+    return batch_response(
+        response, predictions,
+        [recommendations[p["severity"], animal] for p, animal in zip(predictions, animal_types)],
+        ensembles
+    )
 
 # ============== RECOMMENDATION FUNCTIONS ==============
 
-def get_asthma_recommendations(severity: int) -> dict:
-    recommendations = {
-        0: {
-            "doctor": "Yıllık kontrol yeterli",
-            "treatment": "Önleyici tedbirler",
-            "lifestyle": ["Düzenli egzersiz", "Tetikleyicilerden kaçının", "Dengeli beslenme"],
-            "urgency": "Düşük"
-        },
-        1: {
-            "doctor": "6 ay içinde kontrol",
-            "treatment": "Takip ve önleyici tedbirler",
-            "lifestyle": ["Peak flow takibi", "Acil durum planı hazırlayın", "Düzenli kontrol"],
-            "urgency": "Orta"
-        },
-        2: {
-            "doctor": "3 ay içinde göğüs hastalıkları uzmanı",
-            "treatment": "İnhaler kortikosteroid tedavisi",
-            "lifestyle": ["İlaç tedavisi", "Tetikleyicilerden MUTLAKA kaçının", "Günlük semptom takibi"],
-            "urgency": "Yüksek"
-        },
-        3: {
-            "doctor": "HEMEN göğüs hastalıkları uzmanına başvurun",
-            "treatment": "Yoğun ilaç tedavisi + Acil eylem planı",
-            "lifestyle": ["Acil eylem planı EDİNİN", "Günlük peak flow takibi", "Kurtarıcı ilaç yanınızda"],
-            "urgency": "ÇOK YÜKSEK - ACİL"
-        }
+def freeze(value):
+    """İç içe dict/list yapısını salt okunur hâle getir (MappingProxyType / tuple)"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+# Öneri tabloları import sırasında bir kez kurulur; paylaşıldıkları için değiştirilemezler
+ASTHMA_RECOMMENDATIONS = freeze({
+    0: {
+        "doctor": "Yıllık kontrol yeterli",
+        "treatment": "Önleyici tedbirler",
+        "lifestyle": ["Düzenli egzersiz", "Tetikleyicilerden kaçının", "Dengeli beslenme"],
+        "urgency": "Düşük"
+    },
+    1: {
+        "doctor": "6 ay içinde kontrol",
+        "treatment": "Takip ve önleyici tedbirler",
+        "lifestyle": ["Peak flow takibi", "Acil durum planı hazırlayın", "Düzenli kontrol"],
+        "urgency": "Orta"
+    },
+    2: {
+        "doctor": "3 ay içinde göğüs hastalıkları uzmanı",
+        "treatment": "İnhaler kortikosteroid tedavisi",
+        "lifestyle": ["İlaç tedavisi", "Tetikleyicilerden MUTLAKA kaçının", "Günlük semptom takibi"],
+        "urgency": "Yüksek"
+    },
+    3: {
+        "doctor": "HEMEN göğüs hastalıkları uzmanına başvurun",
+        "treatment": "Yoğun ilaç tedavisi + Acil eylem planı",
+        "lifestyle": ["Acil eylem planı EDİNİN", "Günlük peak flow takibi", "Kurtarıcı ilaç yanınızda"],
+        "urgency": "ÇOK YÜKSEK - ACİL"
     }
-    return recommendations.get(severity, recommendations[0])
-
-def get_diabetes_recommendations(severity: int) -> dict:
-    recommendations = {
-        0: {
-            "doctor": "Yıllık check-up",
-            "treatment": "Sağlıklı yaşam tarzı",
-            "lifestyle": ["Dengeli beslenme", "Düzenli egzersiz", "Yılda bir açlık kan şekeri"],
-            "urgency": "Düşük"
-        },
-        1: {
-            "doctor": "6 ay içinde check-up",
-            "treatment": "Yaşam tarzı değişiklikleri",
-            "lifestyle": ["%5-7 kilo verme", "Günde 30 dk yürüyüş", "Şekerli içeceklerden kaçının"],
-            "urgency": "Orta"
-        },
-        2: {
-            "doctor": "1-2 ay içinde endokrinoloji",
-            "treatment": "Metformin + Yaşam tarzı değişikliği",
-            "lifestyle": ["HbA1c takibi", "Diyetisyen danışmanlığı", "Evde kan şekeri ölçümü"],
-            "urgency": "Yüksek"
-        },
-        3: {
-            "doctor": "HEMEN endokrinoloji uzmanına",
-            "treatment": "Yoğun ilaç tedavisi + İnsülin değerlendirmesi",
-            "lifestyle": ["Günde 2-3 kez kan şekeri ölçümü", "Diyabet diyeti BAŞLAYIN", "Komplikasyon taraması"],
-            "urgency": "ÇOK YÜKSEK"
-        }
+})
+
+DIABETES_RECOMMENDATIONS = freeze({
+    0: {
+        "doctor": "Yıllık check-up",
+        "treatment": "Sağlıklı yaşam tarzı",
+        "lifestyle": ["Dengeli beslenme", "Düzenli egzersiz", "Yılda bir açlık kan şekeri"],
+        "urgency": "Düşük"
+    },
+    1: {
+        "doctor": "6 ay içinde check-up",
+        "treatment": "Yaşam tarzı değişiklikleri",
+        "lifestyle": ["%5-7 kilo verme", "Günde 30 dk yürüyüş", "Şekerli içeceklerden kaçının"],
+        "urgency": "Orta"
+    },
+    2: {
+        "doctor": "1-2 ay içinde endokrinoloji",
+        "treatment": "Metformin + Yaşam tarzı değişikliği",
+        "lifestyle": ["HbA1c takibi", "Diyetisyen danışmanlığı", "Evde kan şekeri ölçümü"],
+        "urgency": "Yüksek"
+    },
+    3: {
+        "doctor": "HEMEN endokrinoloji uzmanına",
+        "treatment": "Yoğun ilaç tedavisi + İnsülin değerlendirmesi",
+        "lifestyle": ["Günde 2-3 kez kan şekeri ölçümü", "Diyabet diyeti BAŞLAYIN", "Komplikasyon taraması"],
+        "urgency": "ÇOK YÜKSEK"
     }
-    return recommendations.get(severity, recommendations[0])
-
-def get_hypertension_recommendations(severity: int) -> dict:
-    recommendations = {
-        0: {
-            "doctor": "Yıllık tansiyon kontrolü",
-            "treatment": "Önleyici yaşam tarzı",
-            "lifestyle": ["Düşük tuzlu beslenme", "Düzenli egzersiz", "Stres yönetimi"],
-            "urgency": "Düşük"
-        },
-        1: {
-            "doctor": "3-6 ay içinde kardiyoloji",
-            "treatment": "DASH diyeti + Yaşam tarzı değişikliği",
-            "lifestyle": ["Günlük tuz <6g", "Evde tansiyon takibi", "%5-10 kilo verme"],
-            "urgency": "Orta"
-        },
-        2: {
-            "doctor": "1-2 ay içinde kardiyoloji",
-            "treatment": "Antihipertansif ilaç tedavisi",
-            "lifestyle": ["Günlük tuz <5g", "Günde 2 kez tansiyon ölçümü", "Sigarayı BIRAKIN"],
-            "urgency": "Yüksek"
-        },
-        3: {
-            "doctor": "HEMEN kardiyoloji uzmanına",
-            "treatment": "Kombine antihipertansif + Hedef organ koruması",
-            "lifestyle": ["Acil ilaç optimizasyonu", "Hedef organ hasarı taraması", "Haftalık kontrol"],
-            "urgency": "ÇOK YÜKSEK - ACİL"
-        }
+})
+
+HYPERTENSION_RECOMMENDATIONS = freeze({
+    0: {
+        "doctor": "Yıllık tansiyon kontrolü",
+        "treatment": "Önleyici yaşam tarzı",
+        "lifestyle": ["Düşük tuzlu beslenme", "Düzenli egzersiz", "Stres yönetimi"],
+        "urgency": "Düşük"
+    },
+    1: {
+        "doctor": "3-6 ay içinde kardiyoloji",
+        "treatment": "DASH diyeti + Yaşam tarzı değişikliği",
+        "lifestyle": ["Günlük tuz <6g", "Evde tansiyon takibi", "%5-10 kilo verme"],
+        "urgency": "Orta"
+    },
+    2: {
+        "doctor": "1-2 ay içinde kardiyoloji",
+        "treatment": "Antihipertansif ilaç tedavisi",
+        "lifestyle": ["Günlük tuz <5g", "Günde 2 kez tansiyon ölçümü", "Sigarayı BIRAKIN"],
+        "urgency": "Yüksek"
+    },
+    3: {
+        "doctor": "HEMEN kardiyoloji uzmanına",
+        "treatment": "Kombine antihipertansif + Hedef organ koruması",
+        "lifestyle": ["Acil ilaç optimizasyonu", "Hedef organ hasarı taraması", "Haftalık kontrol"],
+        "urgency": "ÇOK YÜKSEK - ACİL"
     }
-    return recommendations.get(severity, recommendations[0])
-
-def get_parkinson_recommendations(severity: int) -> dict:
-    recommendations = {
-        0: {
-            "doctor": "Yıllık nöroloji kontrolü",
-            "treatment": "Önleyici yaşam tarzı",
-            "lifestyle": ["Düzenli egzersiz", "Zihinsel aktiviteler", "Dengeli beslenme"],
-            "urgency": "Düşük"
-        },
-        1: {
-            "doctor": "1-2 ay içinde nöroloji",
-            "treatment": "Levodopa/Dopamin agonistleri değerlendirmesi",
-            "lifestyle": ["Fizik tedavi başlatın", "Denge egzersizleri", "3 ayda bir kontrol"],
-            "urgency": "Orta"
-        },
-        2: {
-            "doctor": "1-2 hafta içinde ACİL nöroloji",
-            "treatment": "Kombine ilaç tedavisi + Yoğun rehabilitasyon",
-            "lifestyle": ["Aylık kontrol ZORUNLU", "Konuşma terapisi", "Ergoterapi"],
-            "urgency": "Yüksek"
-        },
-        3: {
-            "doctor": "HEMEN hareket bozuklukları merkezi",
-            "treatment": "DBS cerrahisi değerlendirmesi + Maksimum ilaç",
-            "lifestyle": ["Haftalık kontrol", "Evde bakım hizmetleri", "Bakıcı eğitimi"],
-            "urgency": "ÇOK YÜKSEK - ACİL"
-        }
+})
+
+PARKINSON_RECOMMENDATIONS = freeze({
+    0: {
+        "doctor": "Yıllık nöroloji kontrolü",
+        "treatment": "Önleyici yaşam tarzı",
+        "lifestyle": ["Düzenli egzersiz", "Zihinsel aktiviteler", "Dengeli beslenme"],
+        "urgency": "Düşük"
+    },
+    1: {
+        "doctor": "1-2 ay içinde nöroloji",
+        "treatment": "Levodopa/Dopamin agonistleri değerlendirmesi",
+        "lifestyle": ["Fizik tedavi başlatın", "Denge egzersizleri", "3 ayda bir kontrol"],
+        "urgency": "Orta"
+    },
+    2: {
+        "doctor": "1-2 hafta içinde ACİL nöroloji",
+        "treatment": "Kombine ilaç tedavisi + Yoğun rehabilitasyon",
+        "lifestyle": ["Aylık kontrol ZORUNLU", "Konuşma terapisi", "Ergoterapi"],
+        "urgency": "Yüksek"
+    },
+    3: {
+        "doctor": "HEMEN hareket bozuklukları merkezi",
+        "treatment": "DBS cerrahisi değerlendirmesi + Maksimum ilaç",
+        "lifestyle": ["Haftalık kontrol", "Evde bakım hizmetleri", "Bakıcı eğitimi"],
+        "urgency": "ÇOK YÜKSEK - ACİL"
     }
-    return recommendations.get(severity, recommendations[0])
+})
 
-def get_animal_bite_recommendations(severity: int, animal_type: int) -> dict:
-    animal_names = {0: "Yılan", 1: "Köpek", 2: "Arı", 3: "Akrep", 4: "Kedi"}
-    animal = animal_names.get(animal_type, "Bilinmeyen")
-    
-    base_recommendations = {
-        0: {
-            "doctor": "24 saat içinde kontrol",
-            "treatment": "Evde gözlem + İlk yardım",
-            "lifestyle": ["Yarayı temiz tutun", "Enfeksiyon belirtilerini izleyin", "Tetanos kontrolü"],
-            "urgency": "Düşük"
-        },
-        1: {
-            "doctor": "12 saat içinde sağlık kuruluşuna",
-            "treatment": "Antibiyotik + Aşı değerlendirmesi",
-            "lifestyle": ["Yarayı sabunlu suyla yıkayın", "Hareket etmeyin", "Bölgeyi yüksekte tutun"],
-            "urgency": "Orta"
-        },
-        2: {
-            "doctor": "HEMEN acil servise",
-            "treatment": "Antivenom/Antiserum değerlendirmesi",
-            "lifestyle": ["112'yi arayın", "Hareket etmeyin", "Isırılan bölgeyi kalp altında tutun"],
-            "urgency": "Yüksek"
-        },
-        3: {
-            "doctor": "112 ARAYIN - ACİL",
-            "treatment": "Acil antivenom + Yoğun bakım",
-            "lifestyle": ["Kesinlikle hareket etmeyin", "Turnike YAPMAYIN", "Zehir emmeye ÇALIŞMAYIN"],
-            "urgency": "ACİL - HAYAT TEHLİKESİ"
-        }
+ANIMAL_NAMES = {0: "Yılan", 1: "Köpek", 2: "Arı", 3: "Akrep", 4: "Kedi"}
+
+# Hayvana özel ek uyarılar
+ANIMAL_SPECIALS = {
+    0: "Antivenom ilk 4-6 saatte kritik!",         # Snake
+    1: "Kuduz aşısı değerlendirmesi gerekli",      # Dog
+    2: "Anafilaksi riski - EpiPen hazır tutun",    # Bee
+    3: "Çocuklarda çok tehlikeli!",                # Scorpion
+    4: "Enfeksiyon riski %30-50",                  # Cat
+}
+
+ANIMAL_BITE_BASE_RECOMMENDATIONS = freeze({
+    0: {
+        "doctor": "24 saat içinde kontrol",
+        "treatment": "Evde gözlem + İlk yardım",
+        "lifestyle": ["Yarayı temiz tutun", "Enfeksiyon belirtilerini izleyin", "Tetanos kontrolü"],
+        "urgency": "Düşük"
+    },
+    1: {
+        "doctor": "12 saat içinde sağlık kuruluşuna",
+        "treatment": "Antibiyotik + Aşı değerlendirmesi",
+        "lifestyle": ["Yarayı sabunlu suyla yıkayın", "Hareket etmeyin", "Bölgeyi yüksekte tutun"],
+        "urgency": "Orta"
+    },
+    2: {
+        "doctor": "HEMEN acil servise",
+        "treatment": "Antivenom/Antiserum değerlendirmesi",
+        "lifestyle": ["112'yi arayın", "Hareket etmeyin", "Isırılan bölgeyi kalp altında tutun"],
+        "urgency": "Yüksek"
+    },
+    3: {
+        "doctor": "112 ARAYIN - ACİL",
+        "treatment": "Acil antivenom + Yoğun bakım",
+        "lifestyle": ["Kesinlikle hareket etmeyin", "Turnike YAPMAYIN", "Zehir emmeye ÇALIŞMAYIN"],
+        "urgency": "ACİL - HAYAT TEHLİKESİ"
     }
-    
-    rec = base_recommendations.get(severity, base_recommendations[0])
-    rec["animal"] = animal
-    
-    # Animal-specific additions
-    if animal_type == 0:  # Snake
-        rec["special"] = "Antivenom ilk 4-6 saatte kritik!"
-    elif animal_type == 1:  # Dog
-        rec["special"] = "Kuduz aşısı değerlendirmesi gerekli"
-    elif animal_type == 2:  # Bee
-        rec["special"] = "Anafilaksi riski - EpiPen hazır tutun"
-    elif animal_type == 3:  # Scorpion
-        rec["special"] = "Çocuklarda çok tehlikeli!"
-    elif animal_type == 4:  # Cat
-        rec["special"] = "Enfeksiyon riski %30-50"
-    
+})
+
+def _animal_bite_recommendation(severity: int, animal_type: int) -> dict:
+    rec = dict(ANIMAL_BITE_BASE_RECOMMENDATIONS.get(severity, ANIMAL_BITE_BASE_RECOMMENDATIONS[0]))
+    rec["animal"] = ANIMAL_NAMES.get(animal_type, "Bilinmeyen")
+    if animal_type in ANIMAL_SPECIALS:
+        rec["special"] = ANIMAL_SPECIALS[animal_type]
     return rec
 
+# (severity, animal_type) -> öneri; şemadaki tüm hayvan türleri için
+ANIMAL_BITE_RECOMMENDATIONS = freeze({
+    (severity, animal_type): _animal_bite_recommendation(severity, animal_type)
+    for severity in ANIMAL_BITE_BASE_RECOMMENDATIONS for animal_type in ANIMAL_NAMES
+})
+
+def get_asthma_recommendations(severity: int) -> Mapping:
+    return ASTHMA_RECOMMENDATIONS.get(severity, ASTHMA_RECOMMENDATIONS[0])
+
+def get_diabetes_recommendations(severity: int) -> Mapping:
+    return DIABETES_RECOMMENDATIONS.get(severity, DIABETES_RECOMMENDATIONS[0])
+
+def get_hypertension_recommendations(severity: int) -> Mapping:
+    return HYPERTENSION_RECOMMENDATIONS.get(severity, HYPERTENSION_RECOMMENDATIONS[0])
+
+def get_parkinson_recommendations(severity: int) -> Mapping:
+    return PARKINSON_RECOMMENDATIONS.get(severity, PARKINSON_RECOMMENDATIONS[0])
+
+def get_animal_bite_recommendations(severity: int, animal_type: int) -> Mapping:
+    rec = ANIMAL_BITE_RECOMMENDATIONS.get((severity, animal_type))
+    if rec is None:
+        rec = freeze(_animal_bite_recommendation(severity, animal_type))
+    return rec
+
+# ============== PRECOMPUTED RESPONSES ==============
+
+# Öneri JSON'u her (severity) / (severity, animal_type) için bir kez kodlanır
+RECOMMENDATION_BYTES = {
+    "asthma": {key: encode_json(rec) for key, rec in ASTHMA_RECOMMENDATIONS.items()},
+    "diabetes": {key: encode_json(rec) for key, rec in DIABETES_RECOMMENDATIONS.items()},
+    "hypertension": {key: encode_json(rec) for key, rec in HYPERTENSION_RECOMMENDATIONS.items()},
+    "parkinson": {key: encode_json(rec) for key, rec in PARKINSON_RECOMMENDATIONS.items()},
+    "animal_bite": {key: encode_json(rec) for key, rec in ANIMAL_BITE_RECOMMENDATIONS.items()},
+}
+
+# Diyabet kurallarının tüm sonuç kombinasyonları import sırasında bir kez hesaplanır
+DIABETES_TABLE = RuleTable(RULES["diabetes"], DIABETES_FEATURES, RESPONSE_SPECS["diabetes"])
+DIABETES_BODIES = [
+    body_prefix(prediction, RECOMMENDATION_BYTES["diabetes"][prediction["severity"]]) if prediction else None
+    for prediction in DIABETES_TABLE.predictions
+]
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Aşama Süresi Metrikleri
+Örneklenen tahmin isteklerinde her aşamanın (doğrulama, kural skoru, ölçekleme, RF/GB
+predict_proba, yanıt kodlama...) süresi model ve aşama başına histogramlarda toplanır ve
+/api/metrics üzerinden Prometheus metin biçiminde sunulur.
+
+Örnekleme kapalıyken (HEALTHAI_METRICS_SAMPLE=0, varsayılan) timer() None döndürür ve lap()
+yalnızca bir ContextVar okur; ölçüm noktalarının maliyeti ihmal edilebilir düzeydedir.
+"""
+
+import bisect
+import contextvars
+import os
+import random
+import threading
+import time
+
+# İsteklerin ölçülme olasılığı (0: kapalı, 1: her istek)
+SAMPLE_RATE = float(os.environ.get("HEALTHAI_METRICS_SAMPLE", "0"))
+
+# Histogram üst sınırları, saniye (Prometheus "le" değerleri; +Inf ayrıca eklenir)
+BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+
+PREDICT_PREFIX = "/api/predict/"
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "count")
+
+    def __init__(self):
+        # Son hücre +Inf
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+
+class StageHistograms:
+    """(model, rota, aşama) -> Histogram; olay döngüsü ve çıkarım thread'lerinden güncellenir"""
+
+    def __init__(self):
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, model: str, route: str, stage: str, seconds: float):
+        key = (model, route, stage)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def clear(self):
+        with self._lock:
+            self.histograms.clear()
+
+    def summary(self) -> dict:
+        """(model, rota, aşama) -> (sayı, ortalama ms)"""
+        with self._lock:
+            return {
+                key: (h.count, h.total / h.count * 1000)
+                for key, h in self.histograms.items() if h.count
+            }
+
+    def render(self) -> str:
+        """Prometheus metin biçimi (0.0.4)"""
+        lines = [
+            "# HELP healthai_metrics_sample_rate Aşama süreleri ölçülen isteklerin oranı",
+            "# TYPE healthai_metrics_sample_rate gauge",
+            f"healthai_metrics_sample_rate {SAMPLE_RATE:g}",
+            "# HELP healthai_stage_seconds Tahmin aşamalarının süresi",
+            "# TYPE healthai_stage_seconds histogram",
+        ]
+        with self._lock:
+            items = sorted((key, list(h.counts), h.total, h.count) for key, h in self.histograms.items())
+        for (model, route, stage), counts, total, count in items:
+            labels = f'model="{model}",route="{route}",stage="{stage}"'
+            cumulative = 0
+            for bound, n in zip(BUCKETS, counts):
+                cumulative += n
+                lines.append(f'healthai_stage_seconds_bucket{{{labels},le="{bound:g}"}} {cumulative}')
+            lines.append(f'healthai_stage_seconds_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"healthai_stage_seconds_sum{{{labels}}} {total!r}")
+            lines.append(f"healthai_stage_seconds_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+
+STAGES = StageHistograms()
+
+
+class StageTimer:
+    """Ardışık lap() çağrıları arasındaki süreyi aşama süresi olarak kaydeder"""
+
+    __slots__ = ("model", "route", "last")
+
+    def __init__(self, model: str, route: str):
+        self.model = model
+        self.route = route
+        self.last = time.perf_counter()
+
+    def lap(self, stage: str):
+        now = time.perf_counter()
+        STAGES.observe(self.model, self.route, stage, now - self.last)
+        self.last = now
+
+
+def sampled() -> bool:
+    return SAMPLE_RATE > 0 and (SAMPLE_RATE >= 1 or random.random() < SAMPLE_RATE)
+
+
+def timer(model: str, route: str):
+    """Örneklenen çağrı için StageTimer, aksi halde None"""
+    return StageTimer(model, route) if sampled() else None
+
+
+def set_sample_rate(rate: float):
+    global SAMPLE_RATE
+    SAMPLE_RATE = min(max(float(rate), 0.0), 1.0)
+
+
+# ============== İSTEK AŞAMALARI ==============
+
+# Örneklenen isteğin zamanlayıcısı; middleware kurar, endpoint ve yardımcılar lap() ile kullanır
+_request_timer = contextvars.ContextVar("healthai_request_timer", default=None)
+
+
+def lap(stage: str):
+    """Örneklenen istekte bir önceki noktadan bu yana geçen süreyi stage olarak kaydet"""
+    request_timer = _request_timer.get()
+    if request_timer is not None:
+        request_timer.lap(stage)
+
+
+def route_labels(path: str) -> tuple:
+    """/api/predict/parkinson/batch -> ("parkinson", "batch")"""
+    model, _, rest = path[len(PREDICT_PREFIX):].partition("/")
+    return model, rest or "single"
+
+
+class StageMetricsMiddleware:
+    """Tahmin isteklerini örnekler: istek başından endpoint'e kadar geçen süre "validation"
+    (gövde okuma + JSON + Pydantic), yanıt gönderilene kadarki tüm süre "total" olarak kaydedilir.
+    Ara aşamaları endpoint'ler lap() ile işaretler."""
+
+    def __init__(self, app, models: frozenset):
+        self.app = app
+        # Etiket sayısı sınırlı kalsın diye yalnızca bilinen modeller ölçülür
+        self.models = models
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(PREDICT_PREFIX) or not sampled():
+            return await self.app(scope, receive, send)
+        model, route = route_labels(scope["path"])
+        if model not in self.models or route not in ("single", "batch"):
+            return await self.app(scope, receive, send)
+        request_timer = StageTimer(model, route)
+        started = request_timer.last
+        token = _request_timer.set(request_timer)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_timer.reset(token)
+            STAGES.observe(model, route, "total", time.perf_counter() - started)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bellek Eşlemeli (mmap) Model Deposu
+m1/m2/m3 pickle dosyalarını düz dizi biçimine (model/<hastalık>/flat/*.npy) dönüştürür
+ve bu dizileri mmap_mode="r" ile açar.
+
+Kullanım:
+    cd backend
+    python model_store.py              # tüm modelleri dönüştür
+    python model_store.py parkinson    # yalnızca seçilen modeller
+"""
+
+import os
+import pickle
+import sys
+
+from flat_ensemble import FlatEnsemble
+from registry import MODEL_DIRS, model_path
+
+FLAT_DIRNAME = "flat"
+SOURCE_FILES = ("m1.pkl", "m2.pkl", "m3.pkl")
+
+
+def flat_dir(model_id: str) -> str:
+    return os.path.join(model_path(model_id), FLAT_DIRNAME)
+
+
+def source_signature(model_id: str) -> dict:
+    """Kaynak pickle dosyalarının boyut ve değişiklik zamanı (bayatlık kontrolü için)"""
+    signature = {}
+    for name in SOURCE_FILES:
+        stat = os.stat(os.path.join(model_path(model_id), name))
+        signature[name] = [stat.st_size, stat.st_mtime_ns]
+    return signature
+
+
+def convert(model_id: str) -> str:
+    """Pickle modellerini yükle, ölçeklemeyi eşiklere katla ve düz dizileri yaz"""
+    path = model_path(model_id)
+    models = []
+    for name in SOURCE_FILES:
+        with open(os.path.join(path, name), "rb") as f:
+            models.append(pickle.load(f))
+    rf_model, gb_model, scaler = models
+
+    flat = FlatEnsemble.from_estimators(rf_model, gb_model, scaler)
+    directory = flat_dir(model_id)
+    flat.save(
+        directory,
+        model_id=model_id,
+        classes=rf_model.classes_.tolist(),
+        n_features=int(rf_model.n_features_in_),
+        sources=source_signature(model_id),
+        # /api/statistics için; mmap modunda sklearn nesnesi yüklenmez
+        feature_importances=rf_model.feature_importances_.tolist(),
+    )
+    return directory
+
+
+def load(model_id: str, mmap_mode: str = "r") -> FlatEnsemble:
+    """Dönüştürülmüş modeli aç; dosya yoksa veya pickle'lar değişmişse hata verir"""
+    flat, meta = FlatEnsemble.load(flat_dir(model_id), mmap_mode=mmap_mode)
+    try:
+        current = source_signature(model_id)
+    except FileNotFoundError:
+        # Yalnızca düz dosyalar dağıtılmış; karşılaştırılacak pickle yok
+        current = None
+    if current is not None and meta.get("sources") != current:
+        raise ValueError(f"{model_id} düz modeli bayat; 'python model_store.py {model_id}' ile yeniden dönüştürün")
+    flat.meta = meta
+    return flat
+
+
+def main_cli(model_ids):
+    for model_id in model_ids or MODEL_DIRS:
+        try:
+            directory = convert(model_id)
+        except FileNotFoundError as e:
+            print(f"⚠️ {model_id} atlandı: {e}")
+            continue
+        size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+        print(f"✅ {model_id} -> {directory} ({size / 2**20:.2f} MB)")
+
+
+if __name__ == "__main__":
+    main_cli(sys.argv[1:])
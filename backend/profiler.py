@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+İstatistiksel Profil Çıkarıcı
+Seçilen tahmin istekleri sürerken bir arka plan thread'i belirli aralıklarla tüm thread'lerin
+yığınlarını (sys._current_frames) örnekler ve "katlanmış yığın" (collapsed stack) biçiminde
+sayar. Çıktı /api/profile'dan alınıp flamegraph.pl, speedscope vb. ile alev grafiğine çevrilir.
+
+Bir istek iki yolla profillenir:
+  - X-HealthAI-Profile: <HEALTHAI_PROFILE_TOKEN> başlığı (yönetici)
+  - HEALTHAI_PROFILE_SAMPLE oranındaki rastgele istekler (çalışırken PUT /api/profile ile değişir)
+
+HEALTHAI_PROFILE_TOKEN tanımlı değilse profil modu tamamen kapalıdır: middleware eklenmez,
+örnekleme thread'i başlatılmaz ve istek yolunda hiçbir ek iş yapılmaz.
+
+Örnekleme istek başına değil süreç genelindedir: profillenen bir istek sürerken olay döngüsü ve
+çıkarım thread'lerinde çalışan her şey (eş zamanlı diğer istekler dahil) kaydedilir. Boşta bekleyen
+thread'ler (select, kuyruk/kilit bekleme) atlanır. HEALTHAI_EXECUTOR=process ile model çağrıları
+worker süreçlerinde çalıştığından yalnızca olay döngüsü tarafı görülür.
+"""
+
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+
+from metrics import PREDICT_PREFIX
+
+PROFILE_TOKEN = os.environ.get("HEALTHAI_PROFILE_TOKEN", "")
+# Profillenen tahmin isteklerinin oranı (0: yalnızca başlıkla)
+SAMPLE_RATE = float(os.environ.get("HEALTHAI_PROFILE_SAMPLE", "0"))
+# Yığın örnekleme aralığı; örnekleyici GIL'i ancak sys.getswitchinterval() (5 ms) sınırlarında
+# alabildiğinden daha kısa aralık çözünürlüğü artırmadan maliyeti yükseltir
+INTERVAL_MS = float(os.environ.get("HEALTHAI_PROFILE_INTERVAL_MS", "5"))
+# En fazla bu kadar farklı yığın tutulur; sonrakiler yalnızca "dropped" sayacına eklenir
+MAX_STACKS = int(os.environ.get("HEALTHAI_PROFILE_MAX_STACKS", "20000"))
+
+PROFILE_HEADER = b"x-healthai-profile"
+
+# En içteki çerçevesi bu dosyalarda olan thread'ler boşta sayılır (select, Queue.get, Event.wait)
+IDLE_FILES = ("selectors.py", "threading.py", "queue.py")
+# ThreadPoolExecutor worker'ı iş beklerken C tarafında (SimpleQueue.get) durur; en içteki Python çerçevesi budur
+IDLE_FRAMES = (("thread.py", "_worker"),)
+
+
+def _frame_label(code, labels: dict) -> str:
+    label = labels.get(code)
+    if label is None:
+        label = labels[code] = f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    return label
+
+
+class SamplingProfiler:
+    """Etkin istek varken örnekleyen, yığın -> örnek sayısı tutan profil çıkarıcı
+
+    start_request / end_request olay döngüsünden çağrılır; yığın sayaçları örnekleme
+    thread'inden güncellenir ve kilitle okunur.
+    """
+
+    def __init__(self, interval_ms: float = INTERVAL_MS, max_stacks: int = MAX_STACKS,
+                 sample_rate: float = SAMPLE_RATE):
+        self.interval = interval_ms / 1000
+        self.max_stacks = max_stacks
+        self.sample_rate = sample_rate
+        self.stacks = {}
+        self.samples = 0
+        self.dropped = 0
+        self.requests = 0
+        self.active = 0
+        self._labels = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def set_sample_rate(self, rate: float):
+        self.sample_rate = min(max(float(rate), 0.0), 1.0)
+
+    def start_request(self):
+        self.active += 1
+        self.requests += 1
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="healthai-profiler", daemon=True)
+            self._thread.start()
+        self._wake.set()
+
+    def end_request(self):
+        self.active -= 1
+        if not self.active:
+            self._wake.clear()
+
+    def _run(self):
+        me = threading.get_ident()
+        while True:
+            self._wake.wait()
+            time.sleep(self.interval)
+            if self.active:
+                self.sample(skip=me)
+
+    def sample(self, skip: int = None):
+        """Tüm thread'lerin o anki yığınını bir kez say"""
+        frames = sys._current_frames()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        collapsed = []
+        for ident, frame in frames.items():
+            filename = os.path.basename(frame.f_code.co_filename)
+            if ident == skip or filename in IDLE_FILES or (filename, frame.f_code.co_name) in IDLE_FRAMES:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code, self._labels))
+                frame = frame.f_back
+            stack.append(names.get(ident, str(ident)))
+            collapsed.append(";".join(reversed(stack)))
+        with self._lock:
+            for stack in collapsed:
+                if stack in self.stacks:
+                    self.stacks[stack] += 1
+                elif len(self.stacks) < self.max_stacks:
+                    self.stacks[stack] = 1
+                else:
+                    self.dropped += 1
+            self.samples += 1
+
+    def collapsed(self, reset: bool = False) -> str:
+        """Satır başına "thread;dış;...;iç sayı" (flamegraph.pl / speedscope girdisi)"""
+        with self._lock:
+            stacks = self.stacks
+            if reset:
+                self.stacks = {}
+                self.samples = self.dropped = self.requests = 0
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(stacks.items()))
+
+    def status(self) -> dict:
+        with self._lock:
+            return {
+                "sample_rate": self.sample_rate,
+                "interval_ms": self.interval * 1000,
+                "requests": self.requests,
+                "active": self.active,
+                "samples": self.samples,
+                "stacks": len(self.stacks),
+                "dropped": self.dropped,
+            }
+
+
+def is_admin(token) -> bool:
+    """Başlık değeri HEALTHAI_PROFILE_TOKEN ile eşleşiyor mu (sabit zamanlı karşılaştırma)"""
+    if not PROFILE_TOKEN or token is None:
+        return False
+    if isinstance(token, str):
+        token = token.encode()
+    return hmac.compare_digest(token, PROFILE_TOKEN.encode())
+
+
+class ProfilerMiddleware:
+    """Başlıkla veya örnekleme oranıyla seçilen tahmin isteklerini profiller (yalnızca profil modu açıkken eklenir)"""
+
+    def __init__(self, app, profiler: SamplingProfiler):
+        self.app = app
+        self.profiler = profiler
+
+    def wanted(self, scope) -> bool:
+        rate = self.profiler.sample_rate
+        if rate > 0 and (rate >= 1 or random.random() < rate):
+            return True
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return is_admin(value)
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(PREDICT_PREFIX) or not self.wanted(scope):
+            return await self.app(scope, receive, send)
+        self.profiler.start_request()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.end_request()
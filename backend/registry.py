@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Model Kayıt Defteri (Registry)
+Her hastalığın m1/m2/m3 modellerini süreç başına bir kez yükler ve istekler arasında paylaşır.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Eğitilmiş modellerin kök dizini (model/<hastalık>/m1.pkl, m2.pkl, m3.pkl)
+MODEL_ROOT = os.environ.get("HEALTHAI_MODEL_ROOT", os.path.join(REPO_DIR, "model"))
+
+# API model kimliği -> model/ altındaki dizin adı
+MODEL_DIRS = {
+    "asthma": "astım",
+    "diabetes": "diyabet",
+    "hypertension": "hipertansiyon",
+    "parkinson": "parkinson",
+    "animal_bite": "animal",
+}
+
+# Başlangıçta yüklenecek modeller: "all", "none" veya virgüllü liste (örn. "asthma,diabetes")
+PRELOAD = os.environ.get("HEALTHAI_PRELOAD", "all")
+# Bu kadar saniye kullanılmayan model bellekten atılır (0: kapalı)
+MODEL_TTL = float(os.environ.get("HEALTHAI_MODEL_TTL", "0"))
+# Yüklü modellerin toplam bellek üst sınırı, MB (0: sınırsız); aşılınca en eski kullanılan atılır
+MEMORY_BUDGET_MB = float(os.environ.get("HEALTHAI_MEMORY_BUDGET_MB", "0"))
+# Model dosyalarının değişip değişmediği en fazla bu sıklıkla (sn) kontrol edilir
+VERSION_CHECK_S = float(os.environ.get("HEALTHAI_VERSION_CHECK_S", "2"))
+
+# Sürümü belirleyen dosyalar (model dizinine göre)
+VERSION_FILES = ("m1.pkl", "m2.pkl", "m3.pkl", os.path.join("flat", "meta.json"))
+
+
+def model_path(model_id: str) -> str:
+    return os.path.join(MODEL_ROOT, MODEL_DIRS[model_id])
+
+
+def model_version(model_id: str) -> str:
+    """Model dosyalarının boyut ve değişiklik zamanlarından türetilen kısa sürüm kimliği"""
+    digest = hashlib.blake2b(digest_size=8)
+    for name in VERSION_FILES:
+        try:
+            stat = os.stat(os.path.join(model_path(model_id), name))
+            digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        except FileNotFoundError:
+            digest.update(f"{name}:-;".encode())
+    return digest.hexdigest()
+
+
+def estimate_nbytes(obj) -> int:
+    """Yüklenen bir modelin yaklaşık bellek kullanımı (NumPy dizileri + ağaç düğümleri)"""
+    if isinstance(obj, np.memmap):
+        # Sayfa önbelleğinde worker'lar arasında paylaşılır, sürece özel bellek değildir
+        return 0
+    if isinstance(obj, np.ndarray):
+        if obj.dtype == object:
+            return obj.nbytes + sum(estimate_nbytes(item) for item in obj.flat)
+        return obj.nbytes
+    if type(obj).__name__ == "Tree":
+        # sklearn ağaç düğümleri Cython tarafında tutulur, boyutları durumdan okunur
+        state = obj.__getstate__()
+        return state["nodes"].nbytes + state["values"].nbytes
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(estimate_nbytes(item) for item in obj)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(estimate_nbytes(value) for value in obj.values())
+    if hasattr(obj, "__dict__"):
+        return sys.getsizeof(obj) + estimate_nbytes(vars(obj))
+    return sys.getsizeof(obj)
+
+
+class ModelEntry:
+    """Tek bir hastalık modelinin yükleme durumu"""
+
+    def __init__(self, model_id: str):
+        self.model_id = model_id
+        self.model = None
+        self.state = "pending"  # pending | ready | failed
+        self.load_seconds = None
+        self.memory_bytes = None
+        self.error = None
+        self.last_used = None
+        # Yüklenen modelin ve diskteki dosyaların sürümü
+        self.loaded_version = None
+        self.version = None
+        self.version_checked = 0.0
+        self.loads = 0
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+    def status(self) -> dict:
+        return {
+            "id": self.model_id,
+            "path": model_path(self.model_id),
+            "state": self.state,
+            "load_ms": round(self.load_seconds * 1000, 1) if self.load_seconds is not None else None,
+            "memory_mb": round(self.memory_bytes / 2**20, 2) if self.memory_bytes is not None else None,
+            "error": self.error,
+            "version": self.version,
+            "idle_s": round(time.monotonic() - self.last_used, 1) if self.last_used is not None else None,
+            "loads": self.loads,
+            "evictions": self.evictions,
+        }
+
+
+class ModelRegistry:
+    """Süreç genelinde paylaşılan model kayıt defteri
+
+    factory(model_id) yüklenmiş bir model nesnesi döndürür (örn. BaseRiskAssessment).
+    Modeller ilk istekte yüklenir; aynı anda gelen ilk istekler tek bir yüklemeyi bekler.
+    ttl saniyeden uzun süre kullanılmayan veya memory_budget_mb'yi aşan modeller atılır
+    ve bir sonraki istekte yeniden yüklenir.
+    """
+
+    def __init__(self, factory, model_ids, ttl: float = MODEL_TTL, memory_budget_mb: float = MEMORY_BUDGET_MB,
+                 version_check_s: float = VERSION_CHECK_S):
+        self.factory = factory
+        self.entries = {model_id: ModelEntry(model_id) for model_id in model_ids}
+        self.ttl = ttl
+        self.memory_budget = memory_budget_mb * 2**20
+        self.version_check_s = version_check_s
+
+    def version(self, model_id: str) -> str:
+        """Diskteki model dosyalarının güncel sürümü
+
+        Dosyalar değişmişse yüklü model atılır (bir sonraki get() yeniden yükler) ve daha
+        önce başarısız olan yükleme yeniden denenir.
+        """
+        entry = self.entries[model_id]
+        now = time.monotonic()
+        if entry.version is None or now - entry.version_checked >= self.version_check_s:
+            version = model_version(model_id)
+            entry.version_checked = now
+            if entry.state == "failed" and entry.version not in (None, version):
+                with entry.lock:
+                    entry.state, entry.error = "pending", None
+            elif entry.state == "ready" and entry.loaded_version != version:
+                self._evict(entry, "model dosyaları değişti")
+            entry.version = version
+        return entry.version
+
+    def get(self, model_id: str):
+        """Modeli döndür; henüz yüklenmediyse yükle. Yüklenemeyen model için None"""
+        entry = self.entries[model_id]
+        self.version(model_id)
+        model = entry.model
+        if model is None and entry.state == "pending":
+            model = self._load(entry)
+        entry.last_used = time.monotonic()
+        return model
+
+    def _load(self, entry: ModelEntry):
+        with entry.lock:
+            if entry.state != "pending":
+                return entry.model
+            start = time.perf_counter()
+            version = model_version(entry.model_id)
+            try:
+                model = self.factory(entry.model_id)
+            except Exception as e:
+                # Dosyası eksik modeller her istekte yeniden denenmez
+                entry.error = str(e)
+                entry.state = "failed"
+                return None
+            finally:
+                entry.load_seconds = time.perf_counter() - start
+            entry.memory_bytes = estimate_nbytes(model)
+            entry.model = model
+            entry.loaded_version = version
+            entry.last_used = time.monotonic()
+            entry.loads += 1
+            entry.state = "ready"
+        self._enforce_budget(keep=entry)
+        return model
+
+    def _evict(self, entry: ModelEntry, reason: str):
+        with entry.lock:
+            if entry.state != "ready":
+                return
+            # Devam eden istekler kendi referanslarıyla tamamlanır; bellek sonra serbest kalır
+            entry.model = None
+            entry.memory_bytes = None
+            entry.evictions += 1
+            entry.state = "pending"
+        print(f"♻️ {entry.model_id} modeli bellekten atıldı ({reason})")
+
+    def _enforce_budget(self, keep: ModelEntry = None):
+        if not self.memory_budget:
+            return
+        ready = [entry for entry in self.entries.values() if entry.state == "ready"]
+        total = sum(entry.memory_bytes or 0 for entry in ready)
+        # En uzun süredir kullanılmayandan başlayarak bütçeye inene kadar at
+        for entry in sorted(ready, key=lambda e: e.last_used):
+            if total <= self.memory_budget:
+                break
+            if entry is keep:
+                continue
+            total -= entry.memory_bytes or 0
+            self._evict(entry, "bellek bütçesi")
+
+    def evict_idle(self, now: float = None):
+        """ttl süresinden uzun süredir kullanılmayan modelleri at"""
+        if not self.ttl:
+            return
+        now = time.monotonic() if now is None else now
+        for entry in self.entries.values():
+            if entry.state == "ready" and now - entry.last_used > self.ttl:
+                self._evict(entry, f"{now - entry.last_used:.0f} sn boşta")
+
+    def preload(self, spec: str = PRELOAD):
+        """spec: "all", "none" veya virgüllü model listesi"""
+        if spec == "none":
+            model_ids = []
+        elif spec == "all":
+            model_ids = list(self.entries)
+        else:
+            model_ids = [model_id.strip() for model_id in spec.split(",") if model_id.strip()]
+        unknown = [model_id for model_id in model_ids if model_id not in self.entries]
+        if unknown:
+            print(f"⚠️ HEALTHAI_PRELOAD içinde bilinmeyen model atlandı: {', '.join(unknown)} "
+                  f"(geçerli: {', '.join(self.entries)})")
+            model_ids = [model_id for model_id in model_ids if model_id in self.entries]
+        for model_id in model_ids:
+            self._load(self.entries[model_id])
+        print("📦 Model kayıt defteri:")
+        for status in self.status():
+            memory = f"{status['memory_mb']} MB" if status["memory_mb"] is not None else "-"
+            load_ms = status["load_ms"] if status["load_ms"] is not None else "-"
+            print(f"   {status['id']:<14} {status['state']:<8} {load_ms:>8} ms  {memory}")
+
+    def load_all(self):
+        self.preload("all")
+
+    def status(self) -> list:
+        return [entry.status() for entry in self.entries.values()]
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kural Tabanlı Risk Skorlama Motoru
+Tahmin endpoint'lerindeki eşik kuralları tek bir bildirimsel tabloda tutulur ve
+NumPy maske/ağırlık dizilerine derlenir; tek çağrı N hastayı birlikte skorlar.
+"""
+
+import itertools
+import operator
+
+import numpy as np
+
+# ============== RULE TABLE ==============
+#
+# Her kural grubu: (özellik, [(operatör, eşik, ağırlık), ...])
+# Grup içindeki kurallar if/elif zinciri gibi davranır: ilk eşleşen kural uygulanır.
+# Farklı gruplar birbirinden bağımsızdır ve ağırlıkları toplanır.
+
+RULES = {
+    "asthma": [
+        ("Smoking", [("==", 1, 15)]),
+        ("FamilyHistoryAsthma", [("==", 1, 12)]),
+        ("HistoryOfAllergies", [("==", 1, 10)]),
+        ("Wheezing", [("==", 1, 18)]),
+        ("ShortnessOfBreath", [("==", 1, 15)]),
+        ("DustExposure", [(">", 6, 10)]),
+        ("PollenExposure", [(">", 6, 8)]),
+        ("LungFunctionFEV1", [("<", 2.5, 12)]),
+    ],
+    "diabetes": [
+        ("HighBP", [("==", 1, 15)]),
+        ("HighChol", [("==", 1, 12)]),
+        ("BMI", [(">", 30, 20), (">", 25, 10)]),
+        ("Smoker", [("==", 1, 8)]),
+        ("HeartDiseaseorAttack", [("==", 1, 15)]),
+        ("PhysActivity", [("==", 0, 10)]),
+        ("GenHlth", [(">=", 4, 10)]),
+        ("Age", [(">=", 9, 10)]),
+    ],
+    "hypertension": [
+        ("Age", [(">", 60, 15), (">", 45, 8)]),
+        ("Salt_Intake", [(">", 8, 18), (">", 6, 10)]),
+        ("Stress_Score", [(">", 7, 12)]),
+        ("Sleep_Duration", [("<", 6, 8)]),
+        ("BMI", [(">", 30, 15), (">", 25, 8)]),
+        ("BP_History_Encoded", [("==", 2, 20), ("==", 1, 10)]),
+        ("Family_History_Encoded", [("==", 1, 10)]),
+        ("Exercise_Level_Encoded", [("==", 0, 8)]),
+        ("Smoking_Encoded", [("==", 1, 12)]),
+    ],
+    "parkinson": [
+        ("age", [(">", 70, 12)]),
+        ("tremor_score", [(">", 3, 18), (">", 1.5, 10)]),
+        ("rigidity", [(">", 3, 15)]),
+        ("bradykinesia", [(">", 3, 18)]),
+        ("postural_instability", [(">", 2.5, 12)]),
+        ("motor_updrs", [(">", 50, 20), (">", 30, 10)]),
+        ("levodopa_response", [("<", 50, 10)]),
+        ("disease_duration", [(">", 5, 8)]),
+    ],
+    "animal_bite": [
+        # Snake, Dog, Bee, Scorpion, Cat
+        ("Animal_Type", [("==", 0, 25), ("==", 1, 15), ("==", 2, 18), ("==", 3, 22), ("==", 4, 10)]),
+        # Lower ext, Upper ext, Hand, Face, Neck
+        ("Body_Part", [("==", 0, 8), ("==", 1, 10), ("==", 2, 12), ("==", 3, 20), ("==", 4, 25)]),
+        ("Allergy_History", [("==", 1, 20)]),
+        ("First_Aid_Applied", [("==", 0, 15)]),
+        ("Hospital_Time_Hours", [(">", 4, 15), (">", 2, 8)]),
+        ("Chronic_Disease", [("==", 1, 10)]),
+        ("Age", [(">", 65, 8), ("<", 10, 8)]),
+    ],
+}
+
+# Risk skoru -> seviye eşikleri ve yanıt alanları
+RESPONSE_SPECS = {
+    "asthma": {
+        "cuts": (20, 40, 65),
+        "risk_levels": ("Çok Düşük", "Düşük", "Orta", "Yüksek"),
+        "probability_keys": ("no_risk", "low", "medium", "high"),
+        "probability_steps": (15, 25),
+        "no_risk_offset": 10,
+    },
+    "diabetes": {
+        "cuts": (25, 50, 75),
+        "risk_levels": ("Minimal", "Düşük", "Orta (Prediyabet)", "Yüksek (Diyabet)"),
+        "probability_keys": ("minimal", "low", "prediabetes", "diabetes"),
+        "probability_steps": (20, 30),
+        "no_risk_offset": 0,
+    },
+    "hypertension": {
+        "cuts": (25, 50, 75),
+        "risk_levels": ("Minimal", "Prehipertansiyon", "Hipertansiyon", "İleri Hipertansiyon"),
+        "probability_keys": ("normal", "prehypertension", "hypertension", "severe"),
+        "probability_steps": (25, 35),
+        "no_risk_offset": 0,
+    },
+    "parkinson": {
+        "cuts": (25, 50, 75),
+        "risk_levels": ("Minimal", "Hafif", "Orta", "İleri"),
+        "probability_keys": ("no_risk", "mild", "moderate", "severe"),
+        "probability_steps": (25, 35),
+        "no_risk_offset": 0,
+    },
+    "animal_bite": {
+        "cuts": (25, 50, 75),
+        "risk_levels": ("Minimal", "Düşük", "Orta", "Yüksek - ACİL"),
+        "probability_keys": ("minimal", "low", "moderate", "emergency"),
+        "probability_steps": (20, 30),
+        "no_risk_offset": 0,
+    },
+}
+
+MAX_RISK_SCORE = 100
+
+_OPERATORS = {
+    "==": np.equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+}
+
+# Tek satırlık tablo anahtarı için Python karşılıkları
+_PY_OPERATORS = {
+    "==": operator.eq,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+}
+
+# ============== COMPILED SCORER ==============
+
+class RuleScorer:
+    """Kural tablosunu (grup x kural) NumPy dizilerine derleyip toplu skorlayan sınıf"""
+
+    def __init__(self, rules: list, feature_order: list, cuts: tuple):
+        n_groups = len(rules)
+        width = max(len(group_rules) for _, group_rules in rules)
+
+        self.feature_order = list(feature_order)
+        self.group_features = np.array(
+            [self.feature_order.index(feature) for feature, _ in rules], dtype=np.intp
+        )
+        # Boş hücreler NaN eşik alır, hiçbir karşılaştırma NaN ile doğru olmaz
+        self.thresholds = np.full((n_groups, width), np.nan)
+        self.weights = np.zeros((n_groups, width))
+        op_cells = {op: np.zeros((n_groups, width), dtype=bool) for op in _OPERATORS}
+
+        for g, (_, group_rules) in enumerate(rules):
+            for k, (op, threshold, weight) in enumerate(group_rules):
+                if op not in _OPERATORS:
+                    raise ValueError(f"Bilinmeyen operatör: {op}")
+                op_cells[op][g, k] = True
+                self.thresholds[g, k] = threshold
+                self.weights[g, k] = weight
+
+        # Yalnızca tabloda kullanılan operatörler değerlendirilir
+        self.op_cells = [
+            (_OPERATORS[op], cells, self.thresholds[cells])
+            for op, cells in op_cells.items() if cells.any()
+        ]
+        self.flat_weights = self.weights.ravel()
+        self.cuts = np.asarray(cuts)
+
+    def masks(self, X: np.ndarray) -> np.ndarray:
+        """Her (hasta, grup, kural) hücresi için ilk eşleşen kural maskesi"""
+        values = X[:, self.group_features]
+        mask = np.zeros((X.shape[0],) + self.thresholds.shape, dtype=bool)
+        for op, cells, thresholds in self.op_cells:
+            group_idx = np.nonzero(cells)[0]
+            mask[:, cells] = op(values[:, group_idx], thresholds)
+        # if/elif semantiği: grup içinde yalnızca ilk doğru kural sayılır
+        return mask & (np.cumsum(mask, axis=2) == 1)
+
+    def score(self, X: np.ndarray) -> tuple:
+        """(risk_score, severity) dizilerini döndür"""
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[np.newaxis, :]
+        mask = self.masks(X).reshape(X.shape[0], -1)
+        # Ağırlıklar küçük tamsayılar, float64 toplamı tam sonuç verir
+        risk_scores = np.minimum(mask @ self.flat_weights, MAX_RISK_SCORE).astype(np.int64)
+        severities = np.searchsorted(self.cuts, risk_scores, side="right")
+        return risk_scores, severities
+
+
+# ============== LOOKUP TABLE ==============
+
+class RuleTable:
+    """Kural gruplarının tüm sonuç kombinasyonları için önceden hesaplanmış tablo
+
+    Her grubun sonucu "ilk eşleşen kural sırası + 1" (eşleşme yoksa 0) olarak
+    ceil(log2(kural sayısı + 1)) bitte saklanır; gruplar yan yana paketlenerek tek bir
+    tamsayı anahtar oluşturur. Tablo tüm anahtarlar için risk_score / severity ve
+    'prediction' sözlüğünü bir kez hesaplar; istek başına yalnızca anahtar bulunur.
+    """
+
+    def __init__(self, rules: list, feature_order: list, spec: dict):
+        self.groups = []
+        shift = 0
+        for feature, group_rules in rules:
+            conditions = [(_PY_OPERATORS[op], threshold) for op, threshold, _ in group_rules]
+            self.groups.append((feature_order.index(feature), conditions, shift))
+            shift += len(group_rules).bit_length()
+        self.bits = shift
+
+        # Kullanılmayan bit kombinasyonları -1 kalır
+        self.risk_scores = np.full(1 << self.bits, -1, dtype=np.int64)
+        outcome_ranges = [range(len(group_rules) + 1) for _, group_rules in rules]
+        for outcomes in itertools.product(*outcome_ranges):
+            key = sum(outcome << group_shift for outcome, (_, _, group_shift) in zip(outcomes, self.groups))
+            score = sum(
+                group_rules[outcome - 1][2]
+                for outcome, (_, group_rules) in zip(outcomes, rules) if outcome
+            )
+            self.risk_scores[key] = min(score, MAX_RISK_SCORE)
+
+        self.cells = np.flatnonzero(self.risk_scores >= 0)
+        self.severities = np.full_like(self.risk_scores, -1)
+        self.severities[self.cells] = np.searchsorted(spec["cuts"], self.risk_scores[self.cells], side="right")
+        self.predictions = [None] * len(self.risk_scores)
+        for key, prediction in zip(
+            self.cells.tolist(),
+            build_predictions(spec, self.risk_scores[self.cells], self.severities[self.cells])
+        ):
+            self.predictions[key] = prediction
+
+    def key(self, values) -> int:
+        """Özellik sırasındaki tek satır (liste) için paketlenmiş anahtar"""
+        key = 0
+        for index, conditions, shift in self.groups:
+            value = values[index]
+            for outcome, (op, threshold) in enumerate(conditions, 1):
+                if op(value, threshold):
+                    key |= outcome << shift
+                    break
+        return key
+
+    def lookup(self, values) -> dict:
+        return self.predictions[self.key(values)]
+
+
+def build_predictions(spec: dict, risk_scores: np.ndarray, severities: np.ndarray) -> list:
+    """Skor dizilerinden endpoint'lerin döndürdüğü 'prediction' sözlüklerini üret"""
+    low, mid = spec["probability_steps"]
+    risk_levels = spec["risk_levels"]
+    k0, k1, k2, k3 = spec["probability_keys"]
+
+    first = np.maximum(0, 100 - risk_scores - spec["no_risk_offset"]).tolist()
+    second = np.where(severities >= 1, low, 5).tolist()
+    third = np.where(severities >= 2, mid, 5).tolist()
+    fourth = np.where(severities == 3, risk_scores, 5).tolist()
+
+    return [
+        {
+            "risk_level": risk_levels[severity],
+            "severity": severity,
+            "risk_score": risk_score,
+            "probabilities": {k0: p0, k1: p1, k2: p2, k3: p3}
+        }
+        for severity, risk_score, p0, p1, p2, p3 in zip(
+            severities.tolist(), risk_scores.tolist(), first, second, third, fourth
+        )
+    ]
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Toplu Skorlama
+CSV/Parquet hasta dosyaları parça parça okunur, her parça tek scaler + RF + GB geçişiyle
+skorlanır ve sonuç dosyasına eklenir; bellek kullanımı parça boyutuyla sınırlıdır.
+"""
+
+import multiprocessing
+import os
+import pickle
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from registry import model_path
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # isteğe bağlı bağımlılık, yalnızca Parquet için
+    pa = pq = None
+
+# Varsayılan parça boyutu (satır)
+CHUNK_ROWS = 50_000
+
+# genel_risk_skoru = olasılıklar · ağırlıklar (model/*/assessment.py ile aynı)
+RISK_WEIGHTS = {
+    "asthma": (0, 100),
+    "diabetes": (0, 25, 60, 100),
+    "hypertension": (0, 30, 65, 100),
+    "parkinson": (0, 33, 66, 100),
+    "animal_bite": (0, 25, 60, 100),
+}
+
+# Sınıf olasılığı sütunları (assessment.py'deki risk_dagilimi anahtarları)
+CLASS_NAMES = {
+    "asthma": ("no_asthma", "has_asthma"),
+    "diabetes": ("minimal", "dusuk", "orta", "yuksek"),
+    "hypertension": ("minimal", "dusuk", "orta", "yuksek"),
+    "parkinson": ("risk_yok", "hafif", "orta", "ileri"),
+    "animal_bite": ("minimal", "dusuk", "orta", "yuksek"),
+}
+
+PARQUET_SUFFIXES = (".parquet", ".pq")
+
+
+def feature_columns(model_id: str) -> list:
+    """Modelin beklediği sütun sırası: varsa feature_columns.pkl, yoksa API'nin sırası"""
+    path = os.path.join(model_path(model_id), "feature_columns.pkl")
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return list(pickle.load(f))
+    from main import FEATURE_ORDERS
+    return FEATURE_ORDERS[model_id]
+
+
+def is_parquet(path: str) -> bool:
+    return path.lower().endswith(PARQUET_SUFFIXES)
+
+
+def _require_pyarrow():
+    if pq is None:
+        raise SystemExit("❌ Parquet dosyaları için pyarrow gerekli (pip install pyarrow)")
+
+
+def read_chunks(path: str, columns: list, chunk_rows: int = CHUNK_ROWS):
+    """Dosyayı yalnızca gereken sütunlarla, chunk_rows satırlık DataFrame'ler olarak oku"""
+    if is_parquet(path):
+        _require_pyarrow()
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_rows)
+
+
+def input_columns(path: str) -> list:
+    if is_parquet(path):
+        _require_pyarrow()
+        return list(pq.ParquetFile(path).schema_arrow.names)
+    return list(pd.read_csv(path, nrows=0).columns)
+
+
+class ChunkWriter:
+    """Sonuç parçalarını sırayla CSV veya Parquet dosyasına ekler"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.parquet = is_parquet(path)
+        if self.parquet:
+            _require_pyarrow()
+        self._writer = None
+        self._file = None
+
+    def write(self, df: pd.DataFrame):
+        if self.parquet:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+        else:
+            header = self._file is None
+            if header:
+                self._file = open(self.path, "w", newline="", encoding="utf-8")
+            df.to_csv(self._file, header=header, index=False)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ChunkScorer:
+    """Bir hastalık modeliyle DataFrame parçalarını skorlar
+
+    column_map: {dosyadaki sütun: modeldeki özellik}; keep: sonuca aynen kopyalanan sütunlar
+    (örn. hasta kimliği). Özelliklerinden biri eksik (NaN) olan satırlar skorlanmaz;
+    seviye -1, skor ve olasılıklar boş yazılır.
+    """
+
+    def __init__(self, model_id: str, model=None, column_map: dict = None, keep: list = None):
+        self.model_id = model_id
+        self.features = feature_columns(model_id)
+        self.column_map = dict(column_map or {})
+        self.keep = list(keep or [])
+        renamed = {feature: source for source, feature in self.column_map.items()}
+        self.source_columns = [renamed.get(feature, feature) for feature in self.features]
+        self.weights = np.asarray(RISK_WEIGHTS[model_id], dtype=np.float64)
+        self.class_columns = [f"olasilik_{name}" for name in CLASS_NAMES[model_id]]
+        if model is None:
+            from main import load_assessment
+            try:
+                model = load_assessment(model_id)
+            except RuntimeError as e:
+                # Kural tabanlı modellerin (diabetes, hypertension, animal_bite) m1/m2/m3 dosyası yoktur
+                raise SystemExit(
+                    f"❌ {model_id} modeli yüklenemedi, toplu skorlama eğitilmiş ensemble gerektirir: {e}"
+                ) from e
+        self.model = model
+
+    @property
+    def read_columns(self) -> list:
+        return list(dict.fromkeys(self.keep + self.source_columns))
+
+    def check_columns(self, available: list):
+        missing = [column for column in self.read_columns if column not in available]
+        if missing:
+            raise SystemExit(
+                f"❌ Girdide eksik sütunlar: {', '.join(missing)} "
+                f"(--map dosyadaki_ad=özellik ile eşleyebilirsiniz)"
+            )
+
+    def score(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        # Sayıya çevrilemeyen hücreler (metin, boş dize) NaN olur; satır eksik değerli gibi atlanır
+        X = chunk[self.source_columns].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+        valid = ~np.isnan(X).any(axis=1)
+        proba = np.full((len(X), len(self.weights)), np.nan)
+        if valid.all():
+            proba = self.model.predict_arrays(X, self.features)[0]
+        elif valid.any():
+            proba[valid] = self.model.predict_arrays(X[valid], self.features)[0]
+
+        out = chunk[self.keep].reset_index(drop=True) if self.keep else pd.DataFrame(index=range(len(X)))
+        out["seviye"] = np.where(valid, np.argmax(np.nan_to_num(proba), axis=1), -1)
+        out["genel_risk_skoru"] = np.round(proba @ self.weights, 1)
+        for i, column in enumerate(self.class_columns):
+            out[column] = proba[:, i]
+        return out
+
+
+class Progress:
+    """Satır/sn ilerleme göstergesi (stderr)"""
+
+    def __init__(self, label: str = "", stream=sys.stderr):
+        self.label = label
+        self.stream = stream
+        self.rows = 0
+        self.skipped = 0
+        self.started = time.perf_counter()
+        self.finished = None
+
+    @property
+    def rate(self) -> float:
+        elapsed = (self.finished or time.perf_counter()) - self.started
+        return self.rows / elapsed if elapsed > 0 else 0.0
+
+    def update(self, rows: int, skipped: int = 0):
+        self.rows += rows
+        self.skipped += skipped
+        self.stream.write(f"\r   {self.label}{self.rows:>12,} satır  {self.rate:>10,.0f} satır/sn")
+        self.stream.flush()
+
+    def done(self):
+        self.finished = time.perf_counter()
+        self.stream.write("\n")
+
+
+def score_file(model_id: str, src: str, dst: str, chunk_rows: int = CHUNK_ROWS,
+               column_map: dict = None, keep: list = None, model=None) -> Progress:
+    """src dosyasını parça parça skorlayıp dst'ye yaz"""
+    scorer = ChunkScorer(model_id, model=model, column_map=column_map, keep=keep)
+    scorer.check_columns(input_columns(src))
+    progress = Progress()
+    with ChunkWriter(dst) as writer:
+        for chunk in read_chunks(src, scorer.read_columns, chunk_rows):
+            out = scorer.score(chunk)
+            writer.write(out)
+            progress.update(len(out), int((out["seviye"] < 0).sum()))
+    progress.done()
+    return progress
+
+
+# ============== ÇOK ÇEKİRDEKLİ SKORLAMA ==============
+
+# Worker süreçlerindeki skorlayıcı; fork ile başlatılan worker'lar üst sürecinkini devralır
+# (model dizileri yazmada kopyalanan sayfalar olarak paylaşılır), spawn'da yeniden yüklenir
+_worker_scorer = None
+
+
+def _init_worker(model_id: str, column_map: dict, keep: list):
+    global _worker_scorer
+    if _worker_scorer is None or _worker_scorer.model_id != model_id:
+        _worker_scorer = ChunkScorer(model_id, column_map=column_map, keep=keep)
+
+
+def _score_shard(chunk: pd.DataFrame) -> tuple:
+    started = time.perf_counter()
+    out = _worker_scorer.score(chunk)
+    return out, os.getpid(), time.perf_counter() - started
+
+
+def score_file_parallel(model_id: str, src: str, dst: str, workers: int, chunk_rows: int = CHUNK_ROWS,
+                        column_map: dict = None, keep: list = None) -> tuple:
+    """src'yi chunk_rows satırlık parçalara bölüp workers süreçte skorla; sonuçlar girdi sırasıyla yazılır
+
+    Bellekte en fazla 2 * workers parça bulunur. (Progress, {pid: (parça, satır, meşgul sn)}) döndürür.
+    """
+    global _worker_scorer
+    scorer = ChunkScorer(model_id, column_map=column_map, keep=keep)
+    scorer.check_columns(input_columns(src))
+    _worker_scorer = scorer
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("fork" if "fork" in methods else "spawn")
+
+    progress = Progress()
+    stats = {}
+    pending = []
+    max_in_flight = 2 * workers
+
+    def write_oldest():
+        out, pid, seconds = pending.pop(0).result()
+        writer.write(out)
+        progress.update(len(out), int((out["seviye"] < 0).sum()))
+        shards, rows, busy = stats.get(pid, (0, 0, 0.0))
+        stats[pid] = (shards + 1, rows + len(out), busy + seconds)
+
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker,
+                             initargs=(model_id, column_map, keep)) as pool, ChunkWriter(dst) as writer:
+        for chunk in read_chunks(src, scorer.read_columns, chunk_rows):
+            pending.append(pool.submit(_score_shard, chunk))
+            if len(pending) >= max_in_flight:
+                write_oldest()
+        while pending:
+            write_oldest()
+    progress.done()
+    return progress, stats
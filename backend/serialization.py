@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON Kodlama
+Yanıt gövdeleri FastAPI'nin JSONResponse çıktısıyla bayt bayt aynı üretilir.
+HEALTHAI_JSON=orjson ile (kuruluysa) orjson kullanılır; orjson'un float biçimi
+stdlib'den farklı olduğu aralıklarda (|x| < 1e-4 veya |x| >= 1e16) stdlib'e düşülür.
+"""
+
+import json
+import math
+import os
+from typing import Mapping
+
+try:
+    import orjson
+except ImportError:  # isteğe bağlı bağımlılık
+    orjson = None
+
+# "stdlib" (varsayılan) veya "orjson"
+JSON_ENCODER = os.environ.get("HEALTHAI_JSON", "stdlib")
+
+if JSON_ENCODER == "orjson" and orjson is None:
+    print("⚠️ HEALTHAI_JSON=orjson ama orjson kurulu değil, stdlib json kullanılacak")
+
+USE_ORJSON = JSON_ENCODER == "orjson" and orjson is not None
+
+_ENSEMBLE_KEYS = ("predicted_class", "probabilities", "rf_proba", "gb_proba")
+
+# orjson ve json.dumps bu aralıktaki float'ları aynı yazar
+_SAFE_FLOAT_MIN = 1e-4
+_SAFE_FLOAT_MAX = 1e16
+
+
+def _json_default(value):
+    # Salt okunur öneri tabloları (MappingProxyType) dict olarak yazılır
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"{type(value).__name__} JSON'a çevrilemez")
+
+
+def _orjson_safe(value) -> bool:
+    """İçerikteki tüm float'lar orjson'da stdlib ile aynı biçimde mi yazılır?"""
+    if type(value) is float:
+        return value == 0 or _SAFE_FLOAT_MIN <= abs(value) < _SAFE_FLOAT_MAX
+    if isinstance(value, (str, int, bool)) or value is None:
+        return True
+    if isinstance(value, Mapping):
+        return all(_orjson_safe(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return all(_orjson_safe(item) for item in value)
+    return False
+
+
+def _encode_stdlib(content) -> bytes:
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":"),
+        default=_json_default
+    ).encode("utf-8")
+
+
+def encode_json(content) -> bytes:
+    """FastAPI'nin JSONResponse kodlamasıyla birebir aynı çıktı"""
+    if USE_ORJSON and _orjson_safe(content):
+        return orjson.dumps(content, default=_json_default)
+    return _encode_stdlib(content)
+
+
+def _float_list(values: list) -> bytes:
+    # json.dumps float'ları float.__repr__ ile yazar; nan/inf geçerli JSON değildir
+    # (toplam yalnızca taşarsa sonlu değerlerde de ValueError olur, o zaman stdlib'e düşülür)
+    if not math.isfinite(sum(values)):
+        raise ValueError("Out of range float values are not JSON compliant")
+    return ",".join(map(float.__repr__, values)).encode()
+
+
+def encode_ensemble(ensemble) -> bytes:
+    """BaseRiskAssessment.predict çıktısını kodla (genel kodlayıcıdan hızlı, aynı baytlar)
+
+    nan/inf içeren olasılıklar genel kodlayıcıya bırakılır; o da allow_nan=False ile ValueError verir.
+    """
+    if ensemble is None:
+        return b"null"
+    if tuple(ensemble) != _ENSEMBLE_KEYS:
+        return encode_json(ensemble)
+    try:
+        return b'{"predicted_class":%d,"probabilities":[%b],"rf_proba":[%b],"gb_proba":[%b]}' % (
+            ensemble["predicted_class"],
+            _float_list(ensemble["probabilities"]),
+            _float_list(ensemble["rf_proba"]),
+            _float_list(ensemble["gb_proba"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return encode_json(ensemble)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Canlı Model İstatistikleri
+/api/health, /api/models ve /api/statistics yanıtları sabit değerler yerine registry'deki
+modellerden ve gerçek istek sayaçlarından üretilir.
+
+  - Model özeti (dosya SHA-256 özetleri, n_features_in_, feature_importances_, model_info.json
+    doğruluğu) model sürümü değişene kadar önbellekte tutulur; yalnızca değişen model yeniden hesaplanır.
+  - İstek sayaçları her tahmin isteğinde O(1) güncellenir (saniyelik sayaç halkası + son
+    LATENCY_WINDOW gecikme); yüzdelikler en fazla STATS_TTL saniyede bir ve yalnızca yeni istek
+    geldiyse yeniden hesaplanır.
+"""
+
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from metrics import PREDICT_PREFIX, route_labels
+from registry import model_path
+
+# Hız ve yüzdeliklerin hesaplandığı pencere
+RATE_WINDOW_S = 60
+LATENCY_WINDOW = int(os.environ.get("HEALTHAI_STATS_WINDOW", "2048"))
+# Önbellekteki istek özeti en fazla bu kadar saniye bayat kalır
+STATS_TTL = float(os.environ.get("HEALTHAI_STATS_TTL", "1"))
+
+# Özetlenen model dosyaları (model dizinine göre)
+DIGEST_FILES = ("m1.pkl", "m2.pkl", "m3.pkl")
+TOP_FEATURES = 5
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def model_files(model_id: str) -> dict:
+    """Dosya adı -> SHA-256 (eksik dosyalar için None)"""
+    files = {}
+    for name in DIGEST_FILES:
+        path = os.path.join(model_path(model_id), name)
+        files[name] = file_digest(path) if os.path.exists(path) else None
+    return files
+
+
+def recorded_accuracy(model_id: str):
+    """Eğitim betiğinin model_info.json'a yazdığı ensemble doğruluğu (%), yoksa None"""
+    try:
+        with open(os.path.join(model_path(model_id), "model_info.json"), encoding="utf-8") as f:
+            accuracy = json.load(f)["accuracy"]["ensemble"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return round(float(accuracy) * 100, 1)
+
+
+def estimator_summary(model, feature_names: list) -> dict:
+    """Yüklü BaseRiskAssessment'tan özellik sayısı ve RF özellik önemleri
+
+    mmap biçiminde sklearn nesnesi yoktur; değerler dönüştürme sırasında meta.json'a yazılanlardan okunur.
+    """
+    if model.rf_model is not None:
+        n_features = int(model.rf_model.n_features_in_)
+        importances = model.rf_model.feature_importances_
+    else:
+        meta = getattr(model.flat, "meta", None) or {}
+        n_features = meta.get("n_features")
+        importances = meta.get("feature_importances")
+    if importances is None:
+        return {"n_features": n_features, "feature_importance": None}
+    importances = np.asarray(importances, dtype=np.float64)
+    order = np.argsort(importances, kind="stable")[::-1]
+    return {
+        "n_features": n_features,
+        "feature_importance": [
+            {"feature": feature_names[i], "importance": round(float(importances[i]) * 100, 2)}
+            for i in order.tolist()
+        ],
+    }
+
+
+class ModelSummaries:
+    """Model başına özet; registry sürümü ve yükleme sayısı değişmedikçe yeniden hesaplanmaz"""
+
+    def __init__(self, registry, feature_orders: dict):
+        self.registry = registry
+        self.feature_orders = feature_orders
+        self._files = {}  # model_id -> (disk sürümü, özetler, doğruluk)
+        self._estimators = {}  # model_id -> ((yükleme sayısı, sürüm), özet)
+
+    def files(self, model_id: str) -> tuple:
+        version = self.registry.version(model_id)
+        cached = self._files.get(model_id)
+        if cached is None or cached[0] != version:
+            cached = self._files[model_id] = (version, model_files(model_id), recorded_accuracy(model_id))
+        return cached[1], cached[2]
+
+    def estimator(self, model_id: str):
+        """Yüklü modelin özeti; model yüklü değilse None (yükleme tetiklenmez)"""
+        entry = self.registry.entries[model_id]
+        model = entry.model
+        if model is None or not model.is_loaded:
+            return None
+        key = (entry.loads, entry.loaded_version)
+        cached = self._estimators.get(model_id)
+        if cached is None or cached[0] != key:
+            cached = self._estimators[model_id] = (key, estimator_summary(model, self.feature_orders[model_id]))
+        return cached[1]
+
+    def model(self, model_id: str, state: str, estimator) -> dict:
+        """state / estimator: tahminleri sunan kayıt defterindeki durum ve estimator() özeti
+
+        Process havuzunda ikisi de worker'dan gelir (ana süreç model yüklemez).
+        """
+        files, accuracy = self.files(model_id)
+        summary = estimator or {"n_features": None, "feature_importance": None}
+        return {
+            "state": state,
+            "version": self.registry.entries[model_id].version,
+            "accuracy": accuracy,
+            "features": summary["n_features"],
+            "input_fields": len(self.feature_orders[model_id]),
+            "files": files,
+            "feature_importance": summary["feature_importance"],
+        }
+
+
+# ============== İSTEK SAYAÇLARI ==============
+
+class RouteStats:
+    """Tek model/rota için sayaçlar; olay döngüsünden güncellenir (kilitsiz)"""
+
+    __slots__ = ("count", "errors", "latencies", "cursor", "second_counts", "second_marks")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.latencies = np.zeros(LATENCY_WINDOW)
+        self.cursor = 0
+        # second_counts[s % RATE_WINDOW_S], second_marks hücrenin hangi saniyeye ait olduğunu tutar
+        self.second_counts = [0] * RATE_WINDOW_S
+        self.second_marks = [-1] * RATE_WINDOW_S
+
+    def record(self, seconds: float, failed: bool, now: float):
+        self.latencies[self.cursor % LATENCY_WINDOW] = seconds
+        self.cursor += 1
+        self.count += 1
+        if failed:
+            self.errors += 1
+        second = int(now)
+        slot = second % RATE_WINDOW_S
+        if self.second_marks[slot] != second:
+            self.second_marks[slot] = second
+            self.second_counts[slot] = 0
+        self.second_counts[slot] += 1
+
+    def summary(self, now: float) -> dict:
+        current = int(now)
+        recent = sum(
+            n for n, mark in zip(self.second_counts, self.second_marks) if current - mark < RATE_WINDOW_S
+        )
+        window = self.latencies[:min(self.cursor, LATENCY_WINDOW)]
+        p50, p95, p99 = (np.percentile(window, (50, 95, 99)) * 1000).tolist() if len(window) else (None,) * 3
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "rate_per_s": round(recent / RATE_WINDOW_S, 3),
+            "p50_ms": round(p50, 3) if p50 is not None else None,
+            "p95_ms": round(p95, 3) if p95 is not None else None,
+            "p99_ms": round(p99, 3) if p99 is not None else None,
+        }
+
+
+class RequestStats:
+    """(model, rota) -> RouteStats; özet STATS_TTL boyunca ve yeni istek gelmedikçe yeniden kullanılır"""
+
+    def __init__(self, ttl: float = STATS_TTL):
+        self.routes = {}
+        self.started = time.time()
+        self.ttl = ttl
+        self._summary = None
+        self._summary_at = 0.0
+        self._summary_total = -1
+        self._active = False
+
+    @property
+    def total(self) -> int:
+        return sum(stats.count for stats in self.routes.values())
+
+    def record(self, model: str, route: str, seconds: float, failed: bool):
+        stats = self.routes.get((model, route))
+        if stats is None:
+            stats = self.routes[(model, route)] = RouteStats()
+        stats.record(seconds, failed, time.time())
+
+    def summary(self) -> dict:
+        """model -> rota -> sayaçlar"""
+        now = time.time()
+        total = self.total
+        stale = now - self._summary_at >= self.ttl
+        # Yeni istek yoksa yalnızca pencereden düşen istekler hızı değiştirebilir
+        if self._summary is None or stale and (total != self._summary_total or self._active):
+            summary = {}
+            for (model, route), stats in sorted(self.routes.items()):
+                summary.setdefault(model, {})[route] = stats.summary(now)
+            self._summary, self._summary_at, self._summary_total = summary, now, total
+            self._active = any(route["rate_per_s"] for routes in summary.values() for route in routes.values())
+        return self._summary
+
+
+class RequestStatsMiddleware:
+    """Her tahmin isteğinin süresini ve 5xx yanıtlarını model/rota başına sayar"""
+
+    def __init__(self, app, stats: RequestStats, models: frozenset):
+        self.app = app
+        self.stats = stats
+        # Etiket sayısı sınırlı kalsın diye yalnızca bilinen modeller sayılır
+        self.models = models
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(PREDICT_PREFIX):
+            return await self.app(scope, receive, send)
+        model, route = route_labels(scope["path"])
+        if model not in self.models or route not in ("single", "batch"):
+            return await self.app(scope, receive, send)
+        status = 500
+
+        async def send_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_status)
+        finally:
+            self.stats.record(model, route, time.perf_counter() - started, status >= 500)
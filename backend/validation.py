@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vektörel Girdi Doğrulama
+HEALTHAI_VALIDATION=vector ile batch gövdeleri satır başına Pydantic nesnesi kurulmadan,
+doğrudan ham JSON listesinden float64 matrise yazılır ve ge/le sınırları tüm matris üzerinde
+tek seferde kontrol edilir. Hızlı yoldan geçemeyen satırlar (eksik alan, yanlış tür, sınır dışı
+değer) Pydantic'e bırakılır; böylece 422 hata gövdesi birebir aynı kalır.
+"""
+
+import os
+from itertools import chain
+from operator import itemgetter
+from typing import Annotated, List
+
+import numpy as np
+from fastapi.exceptions import RequestValidationError
+from pydantic import SkipValidation, TypeAdapter, ValidationError
+
+# "pydantic" (varsayılan) veya "vector"
+VALIDATION = os.environ.get("HEALTHAI_VALIDATION", "pydantic")
+
+_MISSING = object()
+_NUMBER_TYPES = {int, float}
+
+
+def batch_body(schema: type) -> type:
+    """Batch endpoint gövde tipi
+
+    vector modunda FastAPI gövdeyi yalnızca JSON olarak çözer (eksik gövde / JSON hataları aynı
+    kalır), doğrulama SchemaValidator'a bırakılır; OpenAPI şeması her iki modda aynıdır.
+    """
+    if VALIDATION == "vector":
+        return Annotated[List[schema], SkipValidation]
+    return List[schema]
+
+
+class SchemaValidator:
+    """Bir Pydantic girdi şemasının ge/le sınırlarını dizi olarak tutan doğrulayıcı"""
+
+    def __init__(self, schema: type, feature_order: list):
+        self.schema = schema
+        self.fields = list(schema.model_fields)
+        self.columns = [self.fields.index(name) for name in feature_order]
+        self.defaults = []
+        lo, hi, integer = [], [], []
+        for field in schema.model_fields.values():
+            ge, le = -np.inf, np.inf
+            for constraint in field.metadata:
+                if getattr(constraint, "ge", None) is not None:
+                    ge = constraint.ge
+                if getattr(constraint, "le", None) is not None:
+                    le = constraint.le
+            lo.append(ge)
+            hi.append(le)
+            integer.append(field.annotation is int)
+            self.defaults.append(_MISSING if field.is_required() else field.default)
+        self.lo = np.array(lo, dtype=np.float64)
+        self.hi = np.array(hi, dtype=np.float64)
+        self.integer = np.array(integer)
+        self._getter = itemgetter(*self.fields)
+        self._list_adapter = TypeAdapter(List[schema])
+
+    def _values(self, row) -> list:
+        try:
+            return self._getter(row)
+        except KeyError:
+            # Varsayılanı olan alanlar eksik olabilir
+            return [row.get(name, default) for name, default in zip(self.fields, self.defaults)]
+
+    def matrix(self, rows) -> np.ndarray:
+        """Ham JSON satırlarını doğrula ve özellik sırasına göre float64 matrise dönüştür
+
+        Geçersiz satır varsa Pydantic'in ürettiği hatalarla RequestValidationError yükseltir.
+        """
+        if type(rows) is not list:
+            self._invalid_body(rows)
+        try:
+            # Yaygın durum: tüm satırlar tam ve yalnızca sayı içeriyor -> tek np.array çağrısı
+            values = list(map(self._getter, rows))
+            if not set(map(type, chain.from_iterable(values))) <= _NUMBER_TYPES:
+                raise TypeError
+            X = np.array(values, dtype=np.float64).reshape(len(rows), len(self.fields))
+            ok = np.ones(len(rows), dtype=bool)
+        except (KeyError, TypeError, OverflowError):
+            X, ok = self._matrix_rows(rows)
+        ok &= ((X >= self.lo) & (X <= self.hi)).all(axis=1)
+        ok &= (X[:, self.integer] == np.floor(X[:, self.integer])).all(axis=1)
+        bad = np.flatnonzero(~ok)
+        if len(bad):
+            self._revalidate(rows, X, bad.tolist())
+        return X[:, self.columns]
+
+    def _matrix_rows(self, rows: list) -> tuple:
+        """Satır satır doldurma; hızlı yoldan geçemeyen satırlar ok=False işaretlenir"""
+        X = np.empty((len(rows), len(self.fields)), dtype=np.float64)
+        ok = np.ones(len(rows), dtype=bool)
+        for i, row in enumerate(rows):
+            try:
+                values = self._values(row)
+                if set(map(type, values)) <= _NUMBER_TYPES:
+                    X[i] = values
+                    continue
+            except (AttributeError, TypeError, OverflowError):
+                pass
+            ok[i] = False
+        return X, ok
+
+    def _revalidate(self, rows: list, X: np.ndarray, indices: list):
+        """Hızlı yoldan geçemeyen satırları Pydantic ile doğrula
+
+        Pydantic'in kabul ettiği satırlar (örn. "5" veya true gibi dönüştürülebilir değerler)
+        dönüştürülmüş değerleriyle matrise yazılır; hatalar satır sırasıyla toplanır.
+        """
+        errors = []
+        for i in indices:
+            try:
+                model = self.schema.model_validate(rows[i], from_attributes=True)
+            except ValidationError as e:
+                errors.extend(
+                    {**error, "loc": ("body", i, *error["loc"])} for error in e.errors()
+                )
+                continue
+            X[i] = [getattr(model, name) for name in self.fields]
+        if errors:
+            raise RequestValidationError(errors, body=rows)
+
+    def _invalid_body(self, body):
+        """Liste olmayan gövde: hata mesajını List[şema] doğrulaması üretsin"""
+        try:
+            self._list_adapter.validate_python(body, from_attributes=True)
+        except ValidationError as e:
+            errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors()]
+            raise RequestValidationError(errors, body=body)
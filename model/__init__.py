@@ -0,0 +1,5 @@
+"""
+Hastalık modelleri paketi
+Ortak sonuç tipleri model.batch_assessment'ta; hastalık sınıfları model.<hastalık>.assessment
+modüllerindedir (depo kökünden içe aktarılır veya `python -m` ile çalıştırılır).
+"""
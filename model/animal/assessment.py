@@ -1,12 +1,15 @@
-import os, pickle
-import numpy as np
-import pandas as pd
+import os
+
+from model.batch_assessment import EnsembleRiskAssessment, freeze
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-class AnimalBiteRiskAssessment:
+class AnimalBiteRiskAssessment(EnsembleRiskAssessment):
     """Akdeniz Bölgesi Hayvan Isırığı/Sokması Risk Değerlendirme Sistemi"""
     
+    # Aşama süresi metriklerindeki model etiketi (backend model kimliği)
+    MODEL_ID = 'animal_bite'
+    
     # Sabitler
     ANIMALS = ['Yılan', 'Köpek', 'Arı/Eşek Arısı', 'Akrep', 'Kedi']
     ANIMALS_EN = ['Snake', 'Dog', 'Bee_Wasp', 'Scorpion', 'Cat']
@@ -16,173 +19,140 @@ class AnimalBiteRiskAssessment:
     BODY_PARTS = ['Alt Ekstremite', 'Üst Ekstremite', 'El', 'Yüz/Baş', 'Boyun/Gövde']
     OCCUPATIONS = ['Çiftçi/Tarım', 'Dış Mekan İşçisi', 'Öğrenci/Çocuk', 'Şehir İşçisi']
     
+    # Hayvan türüne göre tedavi önerileri (tüm değerlendirmeler paylaşır, salt okunur)
+    TREATMENTS = freeze({
+        0: {  # Yılan
+            'ilk_yardim': (
+                '• Sakin kalın, hareket etmeyin',
+                '• Isırık bölgesini kalp altında tutun',
+                '• Sıkı giysi/takı çıkarın',
+                '• YAPMAYIN: Kesme, emme, turnike, buz',
+            ),
+            'tibbi': (
+                '• ANTİVENOM değerlendirmesi',
+                '• Tetanos profilaksisi',
+                '• Yara bakımı ve antibiyotik',
+                '• Vital bulgular takibi',
+                '• Koagülasyon testleri',
+            ),
+            'uyari': "Akdeniz'de engerek yılanları yaygın. İlk 4-6 saat kritik!"
+        },
+        1: {  # Köpek
+            'ilk_yardim': (
+                '• Yarayı 10-15 dk su ve sabunla yıkayın',
+                '• Antiseptik uygulayın',
+                '• Temiz bezle kapatın',
+                '• Kanama varsa baskı uygulayın',
+            ),
+            'tibbi': (
+                '• KUDUZ RİSKİ değerlendirmesi',
+                '• Kuduz aşısı (gerekirse)',
+                '• Tetanos profilaksisi',
+                '• Antibiyotik tedavisi',
+                '• Yara debridmanı (gerekirse)',
+            ),
+            'uyari': 'Sahipsiz köpek ısırığında KUDUZ AŞISI gerekebilir!'
+        },
+        2: {  # Arı
+            'ilk_yardim': (
+                '• İğneyi KAZIYARAK çıkarın (sıkmayın)',
+                '• Bölgeyi yıkayın',
+                '• Buz uygulayın (15 dk)',
+                '• Antihistaminik alabilirsiniz',
+            ),
+            'tibbi': (
+                '• ANAFİLAKSİ takibi',
+                '• EPİNEFRİN (şok durumunda)',
+                '• Kortikosteroid',
+                '• Antihistaminik IV',
+                '• Sıvı resüsitasyonu',
+            ),
+            'uyari': 'Alerji öyküsü varsa ANAFİLAKSİ riski çok yüksek!'
+        },
+        3: {  # Akrep
+            'ilk_yardim': (
+                '• Sokma bölgesini yıkayın',
+                '• Buz uygulayın',
+                '• Sakin kalın',
+                '• YAPMAYIN: Kesme, emme, turnike',
+            ),
+            'tibbi': (
+                '• ANTİVENOM değerlendirmesi',
+                '• Ağrı yönetimi',
+                '• Kas gevşetici (spazm için)',
+                '• Kardiyak monitörizasyon',
+                '• Solunum desteği (gerekirse)',
+            ),
+            'uyari': "Sarı akrep (Androctonus) Akdeniz'de tehlikeli! Çocuklarda daha ciddi."
+        },
+        4: {  # Kedi
+            'ilk_yardim': (
+                '• Yarayı bol su ve sabunla yıkayın',
+                '• Antiseptik uygulayın',
+                '• Derin ısırıklarda dikkat (enfeksiyon riski yüksek)',
+                '• Temiz bezle kapatın',
+            ),
+            'tibbi': (
+                '• Antibiyotik tedavisi (genellikle gerekli)',
+                '• Tetanos profilaksisi',
+                '• Kuduz değerlendirmesi',
+                '• Pasteurella enfeksiyonu takibi',
+                '• Kedi tırmığı hastalığı (Bartonella) taraması',
+            ),
+            'uyari': 'Kedi ısırıkları %30-50 oranında enfekte olur!'
+        }
+    })
+    
+    # assess_batch sınıf adları ve 1-3. sınıfların genel risk skoru ağırlıkları
+    CLASS_NAMES = ('minimal', 'dusuk', 'orta', 'yuksek')
+    RISK_WEIGHTS = (25, 60, 100)
+    
+    # Sonuç sözlüğünün anahtar sırası ve risk_dagilimi etiketleri
+    RESULT_KEYS = ('tahmin', 'seviye', 'hayvan', 'genel_risk_skoru', 'risk_dagilimi', 'tedavi',
+                   'aciliyet', 'takip', 'risk_faktorleri')
+    RISK_LABELS = ('Minimal', 'Düşük', 'Orta', 'Yüksek')
+    SEVERITY_NAMES = ('Minimal Risk', 'Düşük Risk', 'Orta Düzey Risk', 'Yüksek Risk')
+    
+    # Seviyeye göre (aciliyet, takip)
+    URGENCY = (
+        ('Düşük', 'Evde gözlem yeterli, belirtiler kötüleşirse başvurun'),
+        ('Orta', '24 saat içinde sağlık kuruluşuna başvurun'),
+        ('Yüksek', 'HEMEN sağlık kuruluşuna başvurun'),
+        ('ÇOK YÜKSEK - ACİL', '112\'yi HEMEN arayın!')
+    )
+    
+    # (hayvan türü, seviye) -> paylaşılan metin alanları; ilk kullanımda doldurulur
+    _templates = {}
+    
     def __init__(self):
-        with open(os.path.join(BASE_DIR, "m1.pkl"), "rb") as f:
-            self.rf_model = pickle.load(f)
-        with open(os.path.join(BASE_DIR, "m2.pkl"), "rb") as f:
-            self.gb_model = pickle.load(f)
-        with open(os.path.join(BASE_DIR, "m3.pkl"), "rb") as f:
-            self.scaler = pickle.load(f)
+        super().__init__(BASE_DIR)
     
-    def assess_risk(self, patient_data):
-        """Risk değerlendirmesi yap"""
+    def _model_input(self, patient_data):
+        """Modelin özellik sütunları (açıklama alanları dışarıda kalır)"""
         feature_cols = ['Age', 'Gender', 'Location', 'Season', 'Time_of_Day', 'Animal_Type',
                         'Body_Part', 'Occupation_Risk', 'Allergy_History', 'Previous_Bite',
                         'First_Aid_Applied', 'Hospital_Time_Hours', 'Chronic_Disease']
-        
-        df = pd.DataFrame([patient_data])
-        X_scaled = self.scaler.transform(df[feature_cols])
-        
-        rf_proba = self.rf_model.predict_proba(X_scaled)[0]
-        gb_proba = self.gb_model.predict_proba(X_scaled)[0]
-        ensemble_proba = (rf_proba + gb_proba) / 2
-        predicted_severity = np.argmax(ensemble_proba)
-        
-        risk_percentages = {
-            'minimal': ensemble_proba[0] * 100,
-            'dusuk': ensemble_proba[1] * 100,
-            'orta': ensemble_proba[2] * 100,
-            'yuksek': ensemble_proba[3] * 100
-        }
-        
-        overall_risk = (ensemble_proba[1] * 25 + ensemble_proba[2] * 60 + ensemble_proba[3] * 100)
-        assessment = self._generate_assessment(predicted_severity, risk_percentages, 
-                                                overall_risk, patient_data)
-        return assessment
+        return super()._model_input(patient_data)[feature_cols]
     
-    def _generate_assessment(self, severity, percentages, overall_risk, data):
-        """Değerlendirme ve öneriler oluştur"""
-        
-        animal = self.ANIMALS[data['Animal_Type']]
-        
-        severity_names = {
-            0: f"{animal} Isırığı/Sokması - Minimal Risk",
-            1: f"{animal} Isırığı/Sokması - Düşük Risk",
-            2: f"{animal} Isırığı/Sokması - Orta Düzey Risk",
-            3: f"{animal} Isırığı/Sokması - Yüksek Risk"
-        }
-        
-        result = {
-            'tahmin': severity_names[severity],
-            'seviye': severity,
-            'hayvan': animal,
-            'genel_risk_skoru': round(overall_risk, 1),
-            'risk_dagilimi': {
-                'Minimal': round(percentages['minimal'], 1),
-                'Düşük': round(percentages['dusuk'], 1),
-                'Orta': round(percentages['orta'], 1),
-                'Yüksek': round(percentages['yuksek'], 1)
-            }
-        }
-        
-        # Hayvan türüne göre özel tedavi
-        result['tedavi'] = self._get_animal_treatment(data['Animal_Type'], severity, data)
-        
-        # Genel aciliyet
-        if severity == 0:
-            result['aciliyet'] = 'Düşük'
-            result['takip'] = 'Evde gözlem yeterli, belirtiler kötüleşirse başvurun'
-        elif severity == 1:
-            result['aciliyet'] = 'Orta'
-            result['takip'] = '24 saat içinde sağlık kuruluşuna başvurun'
-        elif severity == 2:
-            result['aciliyet'] = 'Yüksek'
-            result['takip'] = 'HEMEN sağlık kuruluşuna başvurun'
-        else:
-            result['aciliyet'] = 'ÇOK YÜKSEK - ACİL'
-            result['takip'] = '112\'yi HEMEN arayın!'
-        
-        # Risk faktörleri
-        result['risk_faktorleri'] = self._analyze_risk_factors(data)
-        
-        return result
+    def _severity_template(self, severity, data):
+        """Hayvan türü ve seviyenin paylaşılan metin alanları"""
+        key = (data['Animal_Type'], severity)
+        template = self._templates.get(key)
+        if template is None:
+            animal = self.ANIMALS[data['Animal_Type']]
+            aciliyet, takip = self.URGENCY[severity]
+            template = self._templates[key] = freeze({
+                'tahmin': f"{animal} Isırığı/Sokması - {self.SEVERITY_NAMES[severity]}",
+                'hayvan': animal,
+                'tedavi': self._get_animal_treatment(data['Animal_Type'], severity, data),
+                'aciliyet': aciliyet,
+                'takip': takip
+            })
+        return template
     
     def _get_animal_treatment(self, animal_type, severity, data):
         """Hayvan türüne göre tedavi önerileri"""
-        treatments = {
-            0: {  # Yılan
-                'ilk_yardim': [
-                    '• Sakin kalın, hareket etmeyin',
-                    '• Isırık bölgesini kalp altında tutun',
-                    '• Sıkı giysi/takı çıkarın',
-                    '• YAPMAYIN: Kesme, emme, turnike, buz'
-                ],
-                'tibbi': [
-                    '• ANTİVENOM değerlendirmesi',
-                    '• Tetanos profilaksisi',
-                    '• Yara bakımı ve antibiyotik',
-                    '• Vital bulgular takibi',
-                    '• Koagülasyon testleri'
-                ],
-                'uyari': 'Akdeniz\'de engerek yılanları yaygın. İlk 4-6 saat kritik!'
-            },
-            1: {  # Köpek
-                'ilk_yardim': [
-                    '• Yarayı 10-15 dk su ve sabunla yıkayın',
-                    '• Antiseptik uygulayın',
-                    '• Temiz bezle kapatın',
-                    '• Kanama varsa baskı uygulayın'
-                ],
-                'tibbi': [
-                    '• KUDUZ RİSKİ değerlendirmesi',
-                    '• Kuduz aşısı (gerekirse)',
-                    '• Tetanos profilaksisi',
-                    '• Antibiyotik tedavisi',
-                    '• Yara debridmanı (gerekirse)'
-                ],
-                'uyari': 'Sahipsiz köpek ısırığında KUDUZ AŞISI gerekebilir!'
-            },
-            2: {  # Arı
-                'ilk_yardim': [
-                    '• İğneyi KAZIYARAK çıkarın (sıkmayın)',
-                    '• Bölgeyi yıkayın',
-                    '• Buz uygulayın (15 dk)',
-                    '• Antihistaminik alabilirsiniz'
-                ],
-                'tibbi': [
-                    '• ANAFİLAKSİ takibi',
-                    '• EPİNEFRİN (şok durumunda)',
-                    '• Kortikosteroid',
-                    '• Antihistaminik IV',
-                    '• Sıvı resüsitasyonu'
-                ],
-                'uyari': 'Alerji öyküsü varsa ANAFİLAKSİ riski çok yüksek!'
-            },
-            3: {  # Akrep
-                'ilk_yardim': [
-                    '• Sokma bölgesini yıkayın',
-                    '• Buz uygulayın',
-                    '• Sakin kalın',
-                    '• YAPMAYIN: Kesme, emme, turnike'
-                ],
-                'tibbi': [
-                    '• ANTİVENOM değerlendirmesi',
-                    '• Ağrı yönetimi',
-                    '• Kas gevşetici (spazm için)',
-                    '• Kardiyak monitörizasyon',
-                    '• Solunum desteği (gerekirse)'
-                ],
-                'uyari': 'Sarı akrep (Androctonus) Akdeniz\'de tehlikeli! Çocuklarda daha ciddi.'
-            },
-            4: {  # Kedi
-                'ilk_yardim': [
-                    '• Yarayı bol su ve sabunla yıkayın',
-                    '• Antiseptik uygulayın',
-                    '• Derin ısırıklarda dikkat (enfeksiyon riski yüksek)',
-                    '• Temiz bezle kapatın'
-                ],
-                'tibbi': [
-                    '• Antibiyotik tedavisi (genellikle gerekli)',
-                    '• Tetanos profilaksisi',
-                    '• Kuduz değerlendirmesi',
-                    '• Pasteurella enfeksiyonu takibi',
-                    '• Kedi tırmığı hastalığı (Bartonella) taraması'
-                ],
-                'uyari': 'Kedi ısırıkları %30-50 oranında enfekte olur!'
-            }
-        }
-        
-        return treatments.get(animal_type, treatments[1])
+        return self.TREATMENTS.get(animal_type, self.TREATMENTS[1])
     
     def _analyze_risk_factors(self, data):
         """Risk faktörlerini analiz et"""
@@ -9,11 +9,16 @@ import numpy as np
 import pandas as pd
 import sys
 
+from model.batch_assessment import BatchAssessment, as_frame, stage_timer
+
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 class AsthmaRiskAssessment:
     """Astım Hastalığı Risk Değerlendirme Sistemi"""
     
+    # Aşama süresi metriklerindeki model etiketi (backend model kimliği)
+    MODEL_ID = 'asthma'
+    
     def __init__(self):
         model_dir = BASE_DIR 
         try:
@@ -35,19 +40,29 @@ class AsthmaRiskAssessment:
     
     def assess_risk(self, patient_data):
         """Hasta verisini analiz et ve risk değerlendirmesi yap"""
+        t = stage_timer(self.MODEL_ID, "assess_risk")
         # DataFrame oluştur
         df = pd.DataFrame([patient_data])
         
         # Özellikleri sırala
         df = df[self.feature_cols]
+        t.lap("dataframe")
         
         # Normalizasyon
         X_scaled = self.m3.transform(df)
+        t.lap("scaler")
         
         # Tahminler
         m1_proba = self.m1.predict_proba(X_scaled)[0]
+        t.lap("rf_predict_proba")
         m2_proba = self.m2.predict_proba(X_scaled)[0]
-        
+        t.lap("gb_predict_proba")
+        assessment = self._assessment_from_proba(m1_proba, m2_proba)
+        t.lap("assessment")
+        return assessment
+    
+    def _assessment_from_proba(self, m1_proba, m2_proba):
+        """Tek hastanın model olasılıklarından değerlendirme oluştur"""
         # Ensemble tahmin
         ensemble_proba = (m1_proba + m2_proba) / 2
         predicted_asthma = int(np.argmax(ensemble_proba))
@@ -74,8 +89,39 @@ class AsthmaRiskAssessment:
             }
         }
     
+    def assess_batch(self, patients):
+        """Çok sayıda hastayı tek scaler + predict_proba geçişiyle değerlendir
+        
+        patients: DataFrame, dict listesi veya sütunları feature_columns.pkl sırasında 2-D dizi.
+        BatchAssessment döndürür; batch[i] assess_risk ile aynı sözlüğü, öneriler için
+        generate_recommendations(batch[i], batch.patient(i)) kullanılır.
+        """
+        t = stage_timer(self.MODEL_ID, "assess_batch")
+        df, records = as_frame(patients, self.feature_cols)
+        t.lap("dataframe")
+        X_scaled = self.m3.transform(df)
+        t.lap("scaler")
+        m1_proba = self.m1.predict_proba(X_scaled)
+        t.lap("rf_predict_proba")
+        m2_proba = self.m2.predict_proba(X_scaled)
+        t.lap("gb_predict_proba")
+        ensemble_proba = (m1_proba + m2_proba) / 2
+        batch = BatchAssessment(self, records, ('no_asthma', 'has_asthma'), ensemble_proba,
+                                ensemble_proba[:, 1] * 100, m1_proba, m2_proba)
+        t.lap("assessment")
+        return batch
+    
+    def _batch_item(self, batch, i):
+        return self._assessment_from_proba(batch.rf_proba[i], batch.gb_proba[i])
+    
     def generate_recommendations(self, assessment, patient_data):
         """Değerlendirme ve öneriler oluştur"""
+        t = stage_timer(self.MODEL_ID, "recommendations")
+        recommendations = self._recommendations(assessment, patient_data)
+        t.lap("recommendations")
+        return recommendations
+    
+    def _recommendations(self, assessment, patient_data):
         risk = assessment['risk_percentage']
         has_asthma = assessment['has_asthma']
         
@@ -1,32 +1,36 @@
-import os, pickle
+import os
 import numpy as np
-import pandas as pd
 import sys
-import os
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Modellerin arka planda yüklenmesi için paylaşılan yardımcı model/ dizininde
+if os.path.dirname(BASE_DIR) not in sys.path:
+    sys.path.append(os.path.dirname(BASE_DIR))
+from background_loader import BackgroundLoader
+
 class AsthmaRiskSystem:
     """Astım Risk Değerlendirme Sistemi"""
     
     def __init__(self):
-        model_dir = BASE_DIR
+        # Modeller (ve scikit-learn importu) hasta bilgileri girilirken arka planda yüklenir
         try:
-            with open(os.path.join(model_dir, "m1.pkl"), "rb") as f:
-                self.m1 = pickle.load(f)
-
-            with open(os.path.join(model_dir, "m2.pkl"), "rb") as f:
-                self.m2 = pickle.load(f)
-
-            with open(os.path.join(model_dir, "m3.pkl"), "rb") as f:
-                self.m3 = pickle.load(f)
-
-            with open(os.path.join(model_dir, "feature_columns.pkl"), "rb") as f:
-                self.feature_cols = pickle.load(f)
-            print("✅ Modeller başarıyla yüklendi!\n")
+            self._loader = BackgroundLoader(BASE_DIR, ("m1.pkl", "m2.pkl", "m3.pkl", "feature_columns.pkl"))
+        except FileNotFoundError as e:
+            print(f"❌ Model yükleme hatası: {e}")
+            print(f"Model klasörü: {BASE_DIR}")
+            sys.exit(1)
+        self.m1 = self.m2 = self.m3 = self.feature_cols = None
+    
+    def _load_models(self):
+        """İlk değerlendirmede arka plandaki yüklemenin bitmesini bekle"""
+        if self.m3 is not None:
+            return
+        try:
+            self.m1, self.m2, self.m3, self.feature_cols = self._loader.result()
         except Exception as e:
             print(f"❌ Model yükleme hatası: {e}")
-            print(f"Model klasörü: {model_dir}")
+            print(f"Model klasörü: {BASE_DIR}")
             sys.exit(1)
     
     def get_user_input(self):
@@ -159,6 +163,9 @@ class AsthmaRiskSystem:
     
     def assess(self, data):
         """Risk değerlendirmesi yap"""
+        import pandas as pd  # scikit-learn ile arka planda zaten yüklenmiştir
+        
+        self._load_models()
         df = pd.DataFrame([data])
         df = df[self.feature_cols]
         X_scaled = self.m3.transform(df)
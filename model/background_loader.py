@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arka Planda Model Yükleme
+model/*/main.py etkileşimli betikleri pickle dosyalarını (ve onlarla gelen scikit-learn
+importunu) kullanıcı bilgileri girerken bir arka plan thread'inde yükler; ilk soru beklemeden
+ekrana gelir ve modeller ilk değerlendirmede hazır olur.
+"""
+
+import os
+import pickle
+import threading
+
+
+class BackgroundLoader:
+    """Pickle dosyalarını arka planda yükle; result() yükleme bitene kadar bekler
+
+    Eksik dosyalar kurucuda (FileNotFoundError) bildirilir; yükleme hataları result()'ta yeniden fırlatılır.
+    """
+
+    def __init__(self, base_dir: str, names: tuple):
+        self.paths = [os.path.join(base_dir, name) for name in names]
+        missing = [path for path in self.paths if not os.path.exists(path)]
+        if missing:
+            raise FileNotFoundError(f"Model dosyası bulunamadı: {', '.join(missing)}")
+        self._result = None
+        self._error = None
+        self._thread = threading.Thread(target=self._load, name="model-loader", daemon=True)
+        self._thread.start()
+
+    def _load(self):
+        try:
+            result = []
+            for path in self.paths:
+                with open(path, "rb") as f:
+                    result.append(pickle.load(f))
+            self._result = result
+        except Exception as e:
+            self._error = e
+
+    def result(self) -> list:
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._result
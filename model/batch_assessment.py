@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Risk Değerlendirme Sonuç Tipleri ve Ortak Tahmin Hattı
+model/*/assessment.py sınıflarının assess_risk / assess_batch metotları tarafından paylaşılır;
+model.batch_assessment olarak depo kökünden içe aktarılır.
+"""
+
+import os
+import pickle
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+
+def freeze(value):
+    """İç içe dict/list/tuple yapısını salt okunur hâle getir (MappingProxyType / tuple)
+
+    Seviye şablonları tüm değerlendirmelerce paylaşıldığından sonuçlar üzerinden değiştirilemezler.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """freeze'in tersi (sözlükler için): MappingProxyType -> dict; tuple'lar JSON'a liste olarak yazılır"""
+    if isinstance(value, MappingProxyType):
+        return {key: thaw(item) for key, item in value.items()}
+    return value
+
+
+def as_frame(patients, features) -> tuple:
+    """Hasta verisini (model girdisi, hasta kayıtları) DataFrame çiftine dönüştür
+
+    patients: DataFrame, sözlük listesi veya sütunları features sırasında olan 2-D dizi.
+    Dizi verilirse tüm değerleri tamsayı olan sütunlar int'e çevrilir; böylece kategorik
+    alanlar (örn. Animal_Type) assess_risk'teki gibi liste indeksi olarak kullanılabilir.
+    """
+    features = list(features)
+    if isinstance(patients, list) and patients and isinstance(patients[0], dict):
+        patients = pd.DataFrame(patients)
+    if isinstance(patients, pd.DataFrame):
+        return patients[features], patients
+    X = np.asarray(patients, dtype=np.float64)
+    if X.ndim != 2 or X.shape[1] != len(features):
+        raise ValueError(f"{len(features)} sütunlu 2-D dizi bekleniyordu, gelen: {X.shape}")
+    frame = pd.DataFrame(X, columns=features)
+    integral = (X == np.floor(X)).all(axis=0)
+    frame = frame.astype({name: np.int64 for name, flag in zip(features, integral) if flag})
+    return frame, frame
+
+
+class _NoTimer:
+    """Örnekleme kapalıyken kullanılan, hiçbir şey kaydetmeyen zamanlayıcı"""
+
+    __slots__ = ()
+
+    def lap(self, stage: str):
+        pass
+
+
+NO_TIMER = _NoTimer()
+
+# (model, rota) -> lap(stage) metodu olan zamanlayıcı veya None; backend metrics.timer'ı kurar
+_stage_timer_factory = None
+
+
+def install_stage_timer(factory):
+    """assess_risk / assess_batch aşama sürelerini ölçecek zamanlayıcı fabrikasını kur (None: kapat)"""
+    global _stage_timer_factory
+    _stage_timer_factory = factory
+
+
+def stage_timer(model: str, route: str):
+    """Örneklenen çağrı için zamanlayıcı, aksi halde lap() çağrıları boşa giden NO_TIMER"""
+    if _stage_timer_factory is None:
+        return NO_TIMER
+    return _stage_timer_factory(model, route) or NO_TIMER
+
+
+_MISSING = object()
+
+
+class PatientSnapshot(Mapping):
+    """Hasta verisinin sahibin alan sırasındaki değer tuple'ı olarak salt okunur kopyası
+
+    fields (alan adı -> sıra) sahip sınıfça tüm değerlendirmelere paylaştırılır; verideki diğer
+    anahtarlar alınmaz. Veride olmayan alanlar (örn. isteğe bağlı _real_age) KeyError verir.
+    """
+
+    __slots__ = ("fields", "values")
+
+    def __init__(self, fields: dict, data):
+        self.fields = fields
+        self.values = tuple(data[name] if name in data else _MISSING for name in fields)
+
+    def __getitem__(self, key):
+        value = self.values[self.fields[key]]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return (name for name, value in zip(self.fields, self.values) if value is not _MISSING)
+
+    def __len__(self) -> int:
+        return sum(value is not _MISSING for value in self.values)
+
+
+class LazyAssessment(Mapping):
+    """assess_risk sonucu: eski sözlükle aynı anahtar/değerleri veren salt okunur görünüm
+
+    Hasta başına yalnızca seviye, genel risk, olasılık satırı ve hasta verisinin oluşturma anındaki
+    PatientSnapshot'ı tutulur; çağıranın sözlüğü sonradan değişse de sonuç değişmez. Metin alanları (tahmin, doktor_onerisi, detaylar...) sınıfın salt okunur seviye şablonundan
+    paylaşılır: listeler tuple, iç sözlükler (tedavi) MappingProxyType'tır. risk_faktorleri ilk
+    erişimde hesaplanıp saklanır. JSON vb. için to_dict() kullanılır.
+
+    owner sözleşmesi: RESULT_KEYS (anahtar sırası), RISK_LABELS (risk_dagilimi etiketleri),
+    patient_fields (alan adı -> sıra), _severity_template(seviye, veri) -> paylaşılan sözlük,
+    _analyze_risk_factors(veri) -> liste.
+    """
+
+    __slots__ = ("owner", "severity", "overall_risk", "proba", "data", "_risk_factors")
+
+    def __init__(self, owner, severity, overall_risk, proba, data):
+        self.owner = owner
+        self.severity = severity
+        self.overall_risk = overall_risk
+        self.proba = proba
+        self.data = PatientSnapshot(owner.patient_fields, data)
+        self._risk_factors = None
+
+    def __getitem__(self, key):
+        if key == "seviye":
+            return self.severity
+        if key == "genel_risk_skoru":
+            return round(self.overall_risk, 1)
+        if key == "risk_dagilimi":
+            return {label: round(p * 100, 1) for label, p in zip(self.owner.RISK_LABELS, self.proba)}
+        if key == "risk_faktorleri":
+            if self._risk_factors is None:
+                self._risk_factors = self.owner._analyze_risk_factors(self.data)
+            return self._risk_factors
+        if key not in self.owner.RESULT_KEYS:
+            raise KeyError(key)
+        return self.owner._severity_template(self.severity, self.data)[key]
+
+    def __iter__(self):
+        return iter(self.owner.RESULT_KEYS)
+
+    def __len__(self) -> int:
+        return len(self.owner.RESULT_KEYS)
+
+    def __repr__(self) -> str:
+        return f"LazyAssessment(seviye={self.severity}, genel_risk_skoru={self['genel_risk_skoru']})"
+
+    def to_dict(self) -> dict:
+        """Tüm alanları hesaplanmış düz sözlük; şablondaki iç sözlükler kopyalanır, tuple'lar paylaşılır"""
+        return {key: thaw(self[key]) for key in self.owner.RESULT_KEYS}
+
+
+def patient_row(frame: pd.DataFrame, i: int) -> dict:
+    """frame'in i. satırı; sütun tipleri korunur (int sütun int, float sütun float verir)
+
+    Her sütundan yalnızca istenen hücre okunur, sütunlar listeye çevrilip saklanmaz.
+    """
+    row = {}
+    for name in frame.columns:
+        value = frame[name].to_numpy()[i]
+        row[name] = value.tolist() if isinstance(value, np.generic) else value
+    return row
+
+
+class BatchAssessment:
+    """assess_batch sonucu
+
+    Sütunsal diziler (seviye, genel_risk_skoru, olasılıklar) hemen hesaplanır. Hasta başına
+    metinli değerlendirme (öneriler, risk faktörleri) yalnızca batch[i] ile istendiğinde,
+    assess_risk ile aynı biçimde üretilir.
+    """
+
+    def __init__(self, owner, patients: pd.DataFrame, class_names, ensemble_proba: np.ndarray,
+                 overall_risk: np.ndarray, rf_proba: np.ndarray, gb_proba: np.ndarray):
+        self.owner = owner
+        self.patients = patients
+        self.class_names = tuple(class_names)
+        self.ensemble_proba = ensemble_proba
+        self.rf_proba = rf_proba
+        self.gb_proba = gb_proba
+        self.seviye = np.argmax(ensemble_proba, axis=1)
+        self.overall_risk = overall_risk
+
+    @property
+    def genel_risk_skoru(self) -> np.ndarray:
+        return np.round(self.overall_risk, 1)
+
+    def __len__(self) -> int:
+        return len(self.seviye)
+
+    def patient(self, i: int) -> dict:
+        """i. hastanın kaydı, istendiğinde tek satır olarak okunur"""
+        return patient_row(self.patients, i)
+
+    def __getitem__(self, i: int) -> dict:
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        return self.owner._batch_item(self, i % len(self))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.owner._batch_item(self, i)
+
+    def to_table(self) -> "AssessmentTable":
+        """Sonuçları kompakt kayıt dizisine aktar (yalnızca 4 sınıflı modeller)"""
+        return AssessmentTable.from_batches([self])
+
+    def to_frame(self) -> pd.DataFrame:
+        """Sütunsal özet: seviye, genel_risk_skoru ve sınıf başına yüzde"""
+        frame = pd.DataFrame({
+            "seviye": self.seviye,
+            "genel_risk_skoru": self.genel_risk_skoru,
+        }, index=self.patients.index)
+        for k, name in enumerate(self.class_names):
+            frame[name] = np.round(self.ensemble_proba[:, k] * 100, 1)
+        return frame
+
+
+class EnsembleRiskAssessment:
+    """RF + GB ensemble'lı 4 sınıflı değerlendirme sınıflarının ortak tahmin hattı
+
+    Alt sınıf sözleşmesi: MODEL_ID, RESULT_KEYS, RISK_LABELS, CLASS_NAMES (assess_batch sınıf adları),
+    RISK_WEIGHTS (1-3. sınıfların genel risk ağırlıkları), SEVERITY_TEMPLATES ve
+    _analyze_risk_factors(veri). Şablon hasta verisine bağlıysa _severity_template, girdi sözlüğü
+    modele doğrudan verilemiyorsa _model_input ezilir.
+    """
+
+    # Model özellikleri dışında sonucun okuduğu isteğe bağlı hasta alanları (PatientSnapshot'a alınır)
+    EXTRA_FIELDS = ()
+
+    def __init__(self, model_dir: str):
+        with open(os.path.join(model_dir, "m1.pkl"), "rb") as f:
+            self.rf_model = pickle.load(f)
+
+        with open(os.path.join(model_dir, "m2.pkl"), "rb") as f:
+            self.gb_model = pickle.load(f)
+
+        with open(os.path.join(model_dir, "m3.pkl"), "rb") as f:
+            self.scaler = pickle.load(f)
+
+        fields = (*self.scaler.feature_names_in_, *self.EXTRA_FIELDS)
+        self.patient_fields = {name: i for i, name in enumerate(fields)}
+
+    def _model_input(self, patient_data) -> pd.DataFrame:
+        """assess_risk'te scaler'a verilecek tek satırlık DataFrame"""
+        return pd.DataFrame([patient_data])
+
+    def _overall_risk(self, ensemble_proba):
+        """Sınıf olasılıklarından 0-100 genel risk (tek satır veya satır başına dizi)"""
+        w1, w2, w3 = self.RISK_WEIGHTS
+        return ensemble_proba[..., 1] * w1 + ensemble_proba[..., 2] * w2 + ensemble_proba[..., 3] * w3
+
+    def assess_risk(self, patient_data):
+        """
+        Hasta verisini analiz et ve risk değerlendirmesi yap
+
+        Parameters:
+        -----------
+        patient_data : dict
+            Hasta verileri
+
+        Returns:
+        --------
+        LazyAssessment : Risk değerlendirmesi ve öneriler (salt okunur sözlük görünümü)
+        """
+        t = stage_timer(self.MODEL_ID, "assess_risk")
+        df = self._model_input(patient_data)
+        t.lap("dataframe")
+        X_scaled = self.scaler.transform(df)
+        t.lap("scaler")
+        rf_proba = self.rf_model.predict_proba(X_scaled)[0]
+        t.lap("rf_predict_proba")
+        gb_proba = self.gb_model.predict_proba(X_scaled)[0]
+        t.lap("gb_predict_proba")
+        ensemble_proba = (rf_proba + gb_proba) / 2
+        assessment = self._assessment_from_proba(ensemble_proba, patient_data)
+        t.lap("assessment")
+        return assessment
+
+    def _assessment_from_proba(self, ensemble_proba, patient_data):
+        """Tek hastanın ensemble olasılıklarından değerlendirme oluştur"""
+        predicted_severity = np.argmax(ensemble_proba)
+        overall_risk = self._overall_risk(ensemble_proba)
+        return LazyAssessment(self, predicted_severity, overall_risk, ensemble_proba, patient_data)
+
+    def assess_batch(self, patients):
+        """
+        Çok sayıda hastayı tek scaler + predict_proba geçişiyle değerlendir
+
+        Parameters:
+        -----------
+        patients : pd.DataFrame, dict listesi veya 2-D array
+            Satır başına bir hasta; dizi verilirse sütunlar scaler.feature_names_in_ sırasında olmalı
+
+        Returns:
+        --------
+        BatchAssessment : seviye, genel_risk_skoru ve olasılık dizileri;
+            batch[i] istenince assess_risk ile aynı değerlendirmeyi üretir
+        """
+        t = stage_timer(self.MODEL_ID, "assess_batch")
+        df, records = as_frame(patients, self.scaler.feature_names_in_)
+        t.lap("dataframe")
+        X_scaled = self.scaler.transform(df)
+        t.lap("scaler")
+        rf_proba = self.rf_model.predict_proba(X_scaled)
+        t.lap("rf_predict_proba")
+        gb_proba = self.gb_model.predict_proba(X_scaled)
+        t.lap("gb_predict_proba")
+        ensemble_proba = (rf_proba + gb_proba) / 2
+        overall_risk = self._overall_risk(ensemble_proba)
+        batch = BatchAssessment(self, records, self.CLASS_NAMES, ensemble_proba, overall_risk, rf_proba, gb_proba)
+        t.lap("assessment")
+        return batch
+
+    def _batch_item(self, batch, i):
+        return self._assessment_from_proba(batch.ensemble_proba[i], batch.patient(i))
+
+    def _severity_template(self, severity, patient_data):
+        """Seviyenin paylaşılan metin alanları"""
+        return self.SEVERITY_TEMPLATES[severity]
+
+
+# AssessmentTable satırı (48 bayt): model kodu, seviye, kaynak batch ve içindeki satır,
+# dört sınıf olasılığı ve yuvarlanmamış genel risk
+RESULT_DTYPE = np.dtype([
+    ("model", np.uint8),
+    ("seviye", np.int8),
+    ("kaynak", np.uint16),
+    ("satir", np.uint32),
+    ("olasilik", np.float64, (4,)),
+    ("genel_risk", np.float64),
+])
+
+
+class AssessmentRow:
+    """AssessmentTable'daki bir değerlendirmenin görünümü; değer kopyalamaz"""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: "AssessmentTable", index: int):
+        self.table = table
+        self.index = index
+
+    @property
+    def owner(self):
+        return self.table.models[self.table.records["model"][self.index]]
+
+    @property
+    def seviye(self) -> int:
+        return int(self.table.records["seviye"][self.index])
+
+    @property
+    def olasilik(self) -> np.ndarray:
+        return self.table.records["olasilik"][self.index]
+
+    @property
+    def genel_risk_skoru(self) -> float:
+        return round(float(self.table.records["genel_risk"][self.index]), 1)
+
+    def __repr__(self) -> str:
+        return (f"AssessmentRow({type(self.owner).__name__}, seviye={self.seviye}, "
+                f"genel_risk_skoru={self.genel_risk_skoru})")
+
+    def to_dict(self) -> dict:
+        """assess_risk ile aynı sözlük; yalnızca API/rapor sınırında çağrılmalı"""
+        return self.table.assessment(self.index).to_dict()
+
+
+class AssessmentTable:
+    """Çok sayıda değerlendirme için kompakt sonuç kabı
+
+    Hasta başına Python nesnesi, sözlük veya metin tutulmaz: sonuçlar RESULT_DTYPE tipli tek
+    bir kayıt dizisindedir (records) ve filtreleme/gruplama bu dizi üzerinde vektörel yapılır.
+    table[i] __slots__'lu bir AssessmentRow döndürür. risk_faktorleri için kaynak batch'lerin
+    hasta kayıtlarına referans tutulur (kopyalanmaz); to_dict() yalnızca ilgili satırı okur.
+    """
+
+    def __init__(self, records: np.ndarray, models, patients):
+        self.records = records
+        self.models = tuple(models)
+        self.patients = list(patients)
+
+    @classmethod
+    def from_batches(cls, batches) -> "AssessmentTable":
+        """Bir veya daha fazla (farklı modellere ait olabilen) BatchAssessment'ı birleştir"""
+        batches = list(batches)
+        if len(batches) > np.iinfo(np.uint16).max + 1:
+            raise ValueError(f"En fazla {np.iinfo(np.uint16).max + 1} batch birleştirilebilir")
+        models = []
+        records = np.empty(sum(len(batch) for batch in batches), dtype=RESULT_DTYPE)
+        start = 0
+        for source, batch in enumerate(batches):
+            if batch.ensemble_proba.shape[1] != 4 or not hasattr(batch.owner, "_severity_template"):
+                raise TypeError(f"{type(batch.owner).__name__} 4 sınıflı LazyAssessment modeli değil")
+            if not any(batch.owner is model for model in models):
+                models.append(batch.owner)
+            part = records[start:start + len(batch)]
+            part["model"] = next(code for code, model in enumerate(models) if model is batch.owner)
+            part["seviye"] = batch.seviye
+            part["kaynak"] = source
+            part["satir"] = np.arange(len(batch))
+            part["olasilik"] = batch.ensemble_proba
+            part["genel_risk"] = batch.overall_risk
+            start += len(batch)
+        return cls(records, models, [batch.patients for batch in batches])
+
+    @property
+    def nbytes(self) -> int:
+        return self.records.nbytes
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, i: int) -> AssessmentRow:
+        if not -len(self) <= i < len(self):
+            raise IndexError(i)
+        return AssessmentRow(self, i % len(self))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield AssessmentRow(self, i)
+
+    def patient(self, i: int) -> dict:
+        """i. değerlendirmenin hasta kaydı; kaynak batch'ten tek satır okunur"""
+        frame = self.patients[int(self.records["kaynak"][i])]
+        return patient_row(frame, int(self.records["satir"][i]))
+
+    def assessment(self, i: int) -> LazyAssessment:
+        """i. değerlendirme, assess_risk'in döndürdüğü tipte"""
+        owner = self.models[self.records["model"][i]]
+        return owner._assessment_from_proba(self.records["olasilik"][i], self.patient(i))
+
+    def to_dicts(self) -> list:
+        return [self.assessment(i).to_dict() for i in range(len(self))]
+
+    def to_frame(self) -> pd.DataFrame:
+        """Sütunsal özet: model, seviye, genel_risk_skoru ve sınıf başına yüzde"""
+        names = np.array([type(model).__name__ for model in self.models])
+        frame = pd.DataFrame({
+            "model": pd.Categorical.from_codes(self.records["model"], names),
+            "seviye": self.records["seviye"],
+            "genel_risk_skoru": np.round(self.records["genel_risk"], 1),
+        })
+        for k in range(4):
+            frame[f"olasilik_{k}"] = np.round(self.records["olasilik"][:, k] * 100, 1)
+        return frame
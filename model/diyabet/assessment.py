@@ -1,98 +1,51 @@
-import os, pickle
-import numpy as np
-import pandas as pd
+import os
+
+from model.batch_assessment import EnsembleRiskAssessment, freeze
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-class DiabetesRiskAssessment:
+class DiabetesRiskAssessment(EnsembleRiskAssessment):
     """Diyabet Hastalığı Risk Değerlendirme Sistemi"""
     
-    def __init__(self):
-        with open(os.path.join(BASE_DIR, "m1.pkl"), "rb") as f:
-            self.rf_model = pickle.load(f)
-
-        with open(os.path.join(BASE_DIR, "m2.pkl"), "rb") as f:
-            self.gb_model = pickle.load(f)
-
-        with open(os.path.join(BASE_DIR, "m3.pkl"), "rb") as f:
-            self.scaler = pickle.load(f)
+    # Aşama süresi metriklerindeki model etiketi (backend model kimliği)
+    MODEL_ID = 'diabetes'
     
-    def assess_risk(self, patient_data):
-        """
-        Hasta verisini analiz et ve risk değerlendirmesi yap
-        
-        Parameters:
-        -----------
-        patient_data : dict
-            Hasta verileri
-            
-        Returns:
-        --------
-        dict : Risk değerlendirmesi ve öneriler
-        """
-        # _real_age gibi ekstra alanları çıkar
-        data_clean = {k: v for k, v in patient_data.items() if not k.startswith('_')}
-        df = pd.DataFrame([data_clean])
-        X_scaled = self.scaler.transform(df)
-        rf_proba = self.rf_model.predict_proba(X_scaled)[0]
-        gb_proba = self.gb_model.predict_proba(X_scaled)[0]
-        ensemble_proba = (rf_proba + gb_proba) / 2
-        predicted_severity = np.argmax(ensemble_proba)
-        
-        risk_percentages = {
-            'minimal': ensemble_proba[0] * 100,
-            'dusuk': ensemble_proba[1] * 100,
-            'orta': ensemble_proba[2] * 100,
-            'yuksek': ensemble_proba[3] * 100
-        }
-        
-        overall_risk = (ensemble_proba[1] * 25 + ensemble_proba[2] * 60 + ensemble_proba[3] * 100)
-        assessment = self._generate_assessment(predicted_severity, risk_percentages, 
-                                                overall_risk, patient_data)
-        return assessment
+    # assess_batch sınıf adları ve 1-3. sınıfların genel risk skoru ağırlıkları
+    CLASS_NAMES = ('minimal', 'dusuk', 'orta', 'yuksek')
+    RISK_WEIGHTS = (25, 60, 100)
     
-    def _generate_assessment(self, severity, percentages, overall_risk, patient_data):
-        """Değerlendirme ve öneriler oluştur"""
-        
-        severity_names = {
-            0: "Diyabet Riski Minimal",
-            1: "Düşük Diyabet Riski",
-            2: "Orta Düzey Risk (Prediyabet Olabilir)",
-            3: "Yüksek Risk (Diyabet Olabilir)"
-        }
-        
-        result = {
-            'tahmin': severity_names[severity],
-            'seviye': severity,
-            'genel_risk_skoru': round(overall_risk, 1),
-            'risk_dagilimi': {
-                'Minimal': round(percentages['minimal'], 1),
-                'Düşük': round(percentages['dusuk'], 1),
-                'Orta (Prediyabet)': round(percentages['orta'], 1),
-                'Yüksek (Diyabet)': round(percentages['yuksek'], 1)
-            }
-        }
-        
-        if severity == 0:
-            result['doktor_onerisi'] = '❌ Acil doktor kontrolü gerekmiyor'
-            result['tedavi_onerisi'] = '✅ Sağlıklı yaşam tarzını sürdürün'
-            result['takip'] = 'Yıllık check-up yeterli'
-            result['aciliyet'] = 'Düşük'
-            result['detaylar'] = [
+    # Risk faktörlerinde gerçek yaş için okunur (Age yalnızca yaş grubu kodudur)
+    EXTRA_FIELDS = ('_real_age',)
+    
+    # Sonuç sözlüğünün anahtar sırası ve risk_dagilimi etiketleri
+    RESULT_KEYS = ('tahmin', 'seviye', 'genel_risk_skoru', 'risk_dagilimi', 'doktor_onerisi',
+                   'tedavi_onerisi', 'takip', 'aciliyet', 'detaylar', 'risk_faktorleri')
+    RISK_LABELS = ('Minimal', 'Düşük', 'Orta (Prediyabet)', 'Yüksek (Diyabet)')
+    
+    # Seviye başına metin alanları; tüm değerlendirmeler bu değiştirilemez şablonları paylaşır
+    SEVERITY_TEMPLATES = freeze((
+        {
+            'tahmin': 'Diyabet Riski Minimal',
+            'doktor_onerisi': '❌ Acil doktor kontrolü gerekmiyor',
+            'tedavi_onerisi': '✅ Sağlıklı yaşam tarzını sürdürün',
+            'takip': 'Yıllık check-up yeterli',
+            'aciliyet': 'Düşük',
+            'detaylar': (
                 '• Düzenli egzersiz yapın (haftada 150 dakika)',
                 '• Dengeli beslenmeye devam edin',
                 '• İdeal kilonuzu koruyun (BMI 18.5-24.9)',
                 '• Yılda bir açlık kan şekeri kontrolü',
                 '• Bol su için, şekerli içeceklerden kaçının',
-                '• Stres yönetimi ve yeterli uyku'
-            ]
-            
-        elif severity == 1:
-            result['doktor_onerisi'] = '⚠️ 6 ay içinde check-up yaptırın'
-            result['tedavi_onerisi'] = '🏃 YAŞAM TARZI DEĞİŞİKLİĞİ ÖNERİLİYOR'
-            result['takip'] = '6 ayda bir kontrol'
-            result['aciliyet'] = 'Orta'
-            result['detaylar'] = [
+                '• Stres yönetimi ve yeterli uyku',
+            ),
+        },
+        {
+            'tahmin': 'Düşük Diyabet Riski',
+            'doktor_onerisi': '⚠️ 6 ay içinde check-up yaptırın',
+            'tedavi_onerisi': '🏃 YAŞAM TARZI DEĞİŞİKLİĞİ ÖNERİLİYOR',
+            'takip': '6 ayda bir kontrol',
+            'aciliyet': 'Orta',
+            'detaylar': (
                 '• Açlık kan şekeri (FPG) ve HbA1c testi yaptırın',
                 '• %5-7 kilo vermeye çalışın',
                 '• Günde 30 dakika yürüyüş yapın',
@@ -100,15 +53,16 @@ class DiabetesRiskAssessment:
                 '• Tam tahıllı gıdaları tercih edin',
                 '• Porsiyon kontrolü yapın',
                 '• Lipid profili kontrolü',
-                '• 6 ayda bir doktor kontrolü'
-            ]
-            
-        elif severity == 2:
-            result['doktor_onerisi'] = '🚨 1-2 AY içinde endokrinoloji/dahiliye uzmanına başvurun'
-            result['tedavi_onerisi'] = '💊 PREDİYABET TEDAVİSİ GEREKEBİLİR'
-            result['takip'] = '3 ayda bir kontrol ZORUNLU'
-            result['aciliyet'] = 'Yüksek'
-            result['detaylar'] = [
+                '• 6 ayda bir doktor kontrolü',
+            ),
+        },
+        {
+            'tahmin': 'Orta Düzey Risk (Prediyabet Olabilir)',
+            'doktor_onerisi': '🚨 1-2 AY içinde endokrinoloji/dahiliye uzmanına başvurun',
+            'tedavi_onerisi': '💊 PREDİYABET TEDAVİSİ GEREKEBİLİR',
+            'takip': '3 ayda bir kontrol ZORUNLU',
+            'aciliyet': 'Yüksek',
+            'detaylar': (
                 '• Oral Glukoz Tolerans Testi (OGTT) yaptırın',
                 '• HbA1c testi ve açlık insülin ölçümü',
                 '• Metformin başlanabilir (doktor kararıyla)',
@@ -119,15 +73,16 @@ class DiabetesRiskAssessment:
                 '• Karbonhidrat sayımını öğrenin',
                 '• Evde kan şekeri takibi başlayın',
                 '• Böbrek fonksiyonları takibi',
-                '• 3 ayda bir HbA1c kontrolü ZORUNLU'
-            ]
-            
-        else:  # severity == 3
-            result['doktor_onerisi'] = '🚨🚨 HEMEN endokrinoloji uzmanına başvurun!'
-            result['tedavi_onerisi'] = '🏥 DİYABET TEDAVİSİ GEREKİYOR OLABİLİR'
-            result['takip'] = 'Haftalık/aylık kontrol (doktor belirleyecek)'
-            result['aciliyet'] = 'ÇOK YÜKSEK - ACİL'
-            result['detaylar'] = [
+                '• 3 ayda bir HbA1c kontrolü ZORUNLU',
+            ),
+        },
+        {
+            'tahmin': 'Yüksek Risk (Diyabet Olabilir)',
+            'doktor_onerisi': '🚨🚨 HEMEN endokrinoloji uzmanına başvurun!',
+            'tedavi_onerisi': '🏥 DİYABET TEDAVİSİ GEREKİYOR OLABİLİR',
+            'takip': 'Haftalık/aylık kontrol (doktor belirleyecek)',
+            'aciliyet': 'ÇOK YÜKSEK - ACİL',
+            'detaylar': (
                 '• ACİL: Açlık kan şekeri ve HbA1c testi',
                 '• Tam idrar tahlili (idrarda şeker/protein)',
                 '• Böbrek fonksiyon testleri',
@@ -140,13 +95,17 @@ class DiabetesRiskAssessment:
                 '• Günde 2-3 kez kan şekeri ölçümü',
                 '• Sigara ve alkolü bırakın',
                 '• Yılda 1 göz ve ayak muayenesi',
-                '• Düzenli böbrek fonksiyon takibi'
-            ]
-        
-        # Risk faktörleri analizi
-        result['risk_faktorleri'] = self._analyze_risk_factors(patient_data)
-        
-        return result
+                '• Düzenli böbrek fonksiyon takibi',
+            ),
+        },
+    ))
+    
+    def __init__(self):
+        super().__init__(BASE_DIR)
+    
+    def _model_input(self, patient_data):
+        """_real_age gibi ekstra alanları çıkar"""
+        return super()._model_input({k: v for k, v in patient_data.items() if not k.startswith('_')})
     
     def _analyze_risk_factors(self, data):
         """Risk faktörlerini analiz et"""
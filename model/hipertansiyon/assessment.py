@@ -1,114 +1,67 @@
-import os, pickle
-import numpy as np
-import pandas as pd
+import os
+
+from model.batch_assessment import EnsembleRiskAssessment, freeze
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-class HypertensionRiskAssessment:
+class HypertensionRiskAssessment(EnsembleRiskAssessment):
     """Hipertansiyon (Yüksek Tansiyon) Risk Değerlendirme Sistemi"""
     
-    def __init__(self):
-        with open(os.path.join(BASE_DIR, "m1.pkl"), "rb") as f:
-            self.rf_model = pickle.load(f)
-
-        with open(os.path.join(BASE_DIR, "m2.pkl"), "rb") as f:
-            self.gb_model = pickle.load(f)
-
-        with open(os.path.join(BASE_DIR, "m3.pkl"), "rb") as f:
-            self.scaler = pickle.load(f)
+    # Aşama süresi metriklerindeki model etiketi (backend model kimliği)
+    MODEL_ID = 'hypertension'
     
-    def assess_risk(self, patient_data):
-        """
-        Hasta verisini analiz et ve risk değerlendirmesi yap
-        
-        Parameters:
-        -----------
-        patient_data : dict
-            Hasta verileri
-            
-        Returns:
-        --------
-        dict : Risk değerlendirmesi ve öneriler
-        """
-        df = pd.DataFrame([patient_data])
-        X_scaled = self.scaler.transform(df)
-        rf_proba = self.rf_model.predict_proba(X_scaled)[0]
-        gb_proba = self.gb_model.predict_proba(X_scaled)[0]
-        ensemble_proba = (rf_proba + gb_proba) / 2
-        predicted_severity = np.argmax(ensemble_proba)
-        
-        risk_percentages = {
-            'minimal': ensemble_proba[0] * 100,
-            'dusuk': ensemble_proba[1] * 100,
-            'orta': ensemble_proba[2] * 100,
-            'yuksek': ensemble_proba[3] * 100
-        }
-        
-        overall_risk = (ensemble_proba[1] * 30 + ensemble_proba[2] * 65 + ensemble_proba[3] * 100)
-        assessment = self._generate_assessment(predicted_severity, risk_percentages, 
-                                                overall_risk, patient_data)
-        return assessment
+    # assess_batch sınıf adları ve 1-3. sınıfların genel risk skoru ağırlıkları
+    CLASS_NAMES = ('minimal', 'dusuk', 'orta', 'yuksek')
+    RISK_WEIGHTS = (30, 65, 100)
     
-    def _generate_assessment(self, severity, percentages, overall_risk, patient_data):
-        """Değerlendirme ve öneriler oluştur"""
-        
-        severity_names = {
-            0: "Hipertansiyon Riski Minimal",
-            1: "Düşük Risk (Prehipertansiyon Eğilimi)",
-            2: "Orta Düzey Risk (Hipertansiyon - Kontrollü)",
-            3: "Yüksek Risk (İleri Hipertansiyon)"
-        }
-        
-        result = {
-            'tahmin': severity_names[severity],
-            'seviye': severity,
-            'genel_risk_skoru': round(overall_risk, 1),
-            'risk_dagilimi': {
-                'Minimal': round(percentages['minimal'], 1),
-                'Düşük (Prehipertansiyon)': round(percentages['dusuk'], 1),
-                'Orta (Kontrollü HT)': round(percentages['orta'], 1),
-                'Yüksek (İleri HT)': round(percentages['yuksek'], 1)
-            }
-        }
-        
-        if severity == 0:
-            result['doktor_onerisi'] = '❌ Acil doktor kontrolü gerekmiyor'
-            result['tedavi_onerisi'] = '✅ Sağlıklı yaşam tarzını sürdürün'
-            result['takip'] = 'Yıllık tansiyon kontrolü yeterli'
-            result['aciliyet'] = 'Düşük'
-            result['detaylar'] = [
+    # Sonuç sözlüğünün anahtar sırası ve risk_dagilimi etiketleri
+    RESULT_KEYS = ('tahmin', 'seviye', 'genel_risk_skoru', 'risk_dagilimi', 'doktor_onerisi',
+                   'tedavi_onerisi', 'takip', 'aciliyet', 'detaylar', 'risk_faktorleri')
+    RISK_LABELS = ('Minimal', 'Düşük (Prehipertansiyon)', 'Orta (Kontrollü HT)', 'Yüksek (İleri HT)')
+    
+    # Seviye başına metin alanları; tüm değerlendirmeler bu değiştirilemez şablonları paylaşır
+    SEVERITY_TEMPLATES = freeze((
+        {
+            'tahmin': 'Hipertansiyon Riski Minimal',
+            'doktor_onerisi': '❌ Acil doktor kontrolü gerekmiyor',
+            'tedavi_onerisi': '✅ Sağlıklı yaşam tarzını sürdürün',
+            'takip': 'Yıllık tansiyon kontrolü yeterli',
+            'aciliyet': 'Düşük',
+            'detaylar': (
                 '• Düşük tuzlu beslenmeye devam edin (<6g/gün)',
                 '• Düzenli egzersiz yapın (haftada 150 dakika)',
                 '• İdeal kilonuzu koruyun (BMI 18.5-24.9)',
                 '• Yılda en az 2 kez tansiyon ölçtürün',
                 '• Stresi yönetin, yeterli uyuyun (7-8 saat)',
-                '• Sigara ve aşırı alkolden kaçının'
-            ]
-            
-        elif severity == 1:
-            result['doktor_onerisi'] = '⚠️ 3-6 ay içinde kardiyoloji kontrolü'
-            result['tedavi_onerisi'] = '🏃 YAŞAM TARZI DEĞİŞİKLİĞİ ZORUNLU'
-            result['takip'] = '3 ayda bir kontrol'
-            result['aciliyet'] = 'Orta'
-            result['detaylar'] = [
+                '• Sigara ve aşırı alkolden kaçının',
+            ),
+        },
+        {
+            'tahmin': 'Düşük Risk (Prehipertansiyon Eğilimi)',
+            'doktor_onerisi': '⚠️ 3-6 ay içinde kardiyoloji kontrolü',
+            'tedavi_onerisi': '🏃 YAŞAM TARZI DEĞİŞİKLİĞİ ZORUNLU',
+            'takip': '3 ayda bir kontrol',
+            'aciliyet': 'Orta',
+            'detaylar': (
                 '• Evde düzenli tansiyon takibi başlayın (sabah-akşam)',
                 '• DASH diyetine geçin (meyve, sebze, az yağlı süt ürünleri)',
-                '• Günlük tuz alımını <6g\'a düşürün',
+                "• Günlük tuz alımını <6g'a düşürün",
                 '• %5-10 kilo vermeye çalışın',
                 '• Günde 30-45 dakika tempolu yürüyüş yapın',
                 '• Stresi azaltın (meditasyon, derin nefes, yoga)',
                 '• Alkol tüketimini sınırlayın (E:<2, K:<1 kadeh/gün)',
                 '• Kafein alımını azaltın',
                 '• Holter tansiyon monitörizasyonu yaptırın',
-                '• 3 ayda bir kardiyoloji kontrolü'
-            ]
-            
-        elif severity == 2:
-            result['doktor_onerisi'] = '🚨 1-2 AY içinde kardiyoloji uzmanına başvurun'
-            result['tedavi_onerisi'] = '💊 İLAÇ TEDAVİSİ + YAŞAM TARZI DEĞİŞİKLİĞİ'
-            result['takip'] = 'Aylık kontrol ZORUNLU'
-            result['aciliyet'] = 'Yüksek'
-            result['detaylar'] = [
+                '• 3 ayda bir kardiyoloji kontrolü',
+            ),
+        },
+        {
+            'tahmin': 'Orta Düzey Risk (Hipertansiyon - Kontrollü)',
+            'doktor_onerisi': '🚨 1-2 AY içinde kardiyoloji uzmanına başvurun',
+            'tedavi_onerisi': '💊 İLAÇ TEDAVİSİ + YAŞAM TARZI DEĞİŞİKLİĞİ',
+            'takip': 'Aylık kontrol ZORUNLU',
+            'aciliyet': 'Yüksek',
+            'detaylar': (
                 '• 24 saat ambulatuvar tansiyon izlemi (Holter) yaptırın',
                 '• Ekokardiyografi (kalp ultrason) çekilmeli',
                 '• Böbrek fonksiyonları kontrol edilmeli (kreatinin, BUN)',
@@ -120,15 +73,16 @@ class HypertensionRiskAssessment:
                 '• Günde 2 kez evde tansiyon ölçümü (kayıt tutun)',
                 '• Kilo kontrolü (BMI <25 hedef)',
                 '• Sigara BIRAKILMALI',
-                '• Aylık kardiyoloji kontrolü ZORUNLU'
-            ]
-            
-        else:  # severity == 3
-            result['doktor_onerisi'] = '🚨🚨 HEMEN kardiyoloji uzmanına başvurun!'
-            result['tedavi_onerisi'] = '🏥 YOĞUN TEDAVİ + HEDEF ORGAN KORUMA'
-            result['takip'] = 'Haftalık/2 haftada bir kontrol'
-            result['aciliyet'] = 'ÇOK YÜKSEK - ACİL'
-            result['detaylar'] = [
+                '• Aylık kardiyoloji kontrolü ZORUNLU',
+            ),
+        },
+        {
+            'tahmin': 'Yüksek Risk (İleri Hipertansiyon)',
+            'doktor_onerisi': '🚨🚨 HEMEN kardiyoloji uzmanına başvurun!',
+            'tedavi_onerisi': '🏥 YOĞUN TEDAVİ + HEDEF ORGAN KORUMA',
+            'takip': 'Haftalık/2 haftada bir kontrol',
+            'aciliyet': 'ÇOK YÜKSEK - ACİL',
+            'detaylar': (
                 '• ACİL: Tam kardiyak değerlendirme',
                 '• Ekokardiyografi (sol ventrikül hipertrofisi?)',
                 '• Böbrek fonksiyonları ve proteinüri taraması',
@@ -142,13 +96,13 @@ class HypertensionRiskAssessment:
                 '• Kalp: Sol ventrikül hipertrofisi takibi',
                 '• Böbrek: GFR ve proteinüri takibi',
                 '• Beyin: İnme risk değerlendirmesi',
-                '• Haftalık/2 haftada bir kontrol ZORUNLU'
-            ]
-        
-        # Risk faktörleri analizi
-        result['risk_faktorleri'] = self._analyze_risk_factors(patient_data)
-        
-        return result
+                '• Haftalık/2 haftada bir kontrol ZORUNLU',
+            ),
+        },
+    ))
+    
+    def __init__(self):
+        super().__init__(BASE_DIR)
     
     def _analyze_risk_factors(self, data):
         """Risk faktörlerini analiz et"""
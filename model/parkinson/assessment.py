@@ -1,109 +1,62 @@
-import os, pickle
-import numpy as np
-import pandas as pd
+import os
+
+from model.batch_assessment import EnsembleRiskAssessment, freeze
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-class ParkinsonRiskAssessment:
+class ParkinsonRiskAssessment(EnsembleRiskAssessment):
     """Parkinson Hastalığı Risk Değerlendirme Sistemi"""
     
-    def __init__(self):
-        with open(os.path.join(BASE_DIR, "m1.pkl"), "rb") as f:
-            self.rf_model = pickle.load(f)
-
-        with open(os.path.join(BASE_DIR, "m2.pkl"), "rb") as f:
-            self.gb_model = pickle.load(f)
-
-        with open(os.path.join(BASE_DIR, "m3.pkl"), "rb") as f:
-            self.scaler = pickle.load(f)
+    # Aşama süresi metriklerindeki model etiketi (backend model kimliği)
+    MODEL_ID = 'parkinson'
     
-    def assess_risk(self, patient_data):
-        """
-        Hasta verisini analiz et ve risk değerlendirmesi yap
-        
-        Parameters:
-        -----------
-        patient_data : dict
-            Hasta verileri
-            
-        Returns:
-        --------
-        dict : Risk değerlendirmesi ve öneriler
-        """
-        df = pd.DataFrame([patient_data])
-        X_scaled = self.scaler.transform(df)
-        rf_proba = self.rf_model.predict_proba(X_scaled)[0]
-        gb_proba = self.gb_model.predict_proba(X_scaled)[0]
-        ensemble_proba = (rf_proba + gb_proba) / 2
-        predicted_severity = np.argmax(ensemble_proba)
-        
-        risk_percentages = {
-            'risk_yok': ensemble_proba[0] * 100,
-            'hafif': ensemble_proba[1] * 100,
-            'orta': ensemble_proba[2] * 100,
-            'ileri': ensemble_proba[3] * 100
-        }
-        
-        overall_risk = (ensemble_proba[1] * 33 + ensemble_proba[2] * 66 + ensemble_proba[3] * 100)
-        assessment = self._generate_assessment(predicted_severity, risk_percentages, 
-                                                overall_risk, patient_data)
-        return assessment
+    # assess_batch sınıf adları ve 1-3. sınıfların genel risk skoru ağırlıkları
+    CLASS_NAMES = ('risk_yok', 'hafif', 'orta', 'ileri')
+    RISK_WEIGHTS = (33, 66, 100)
     
-    def _generate_assessment(self, severity, percentages, overall_risk, patient_data):
-        """Değerlendirme ve öneriler oluştur"""
-        
-        severity_names = {
-            0: "Parkinson Riski Yok / Minimal",
-            1: "Hafif Parkinson Belirtileri",
-            2: "Orta Düzey Parkinson",
-            3: "İleri Parkinson"
-        }
-        
-        result = {
-            'tahmin': severity_names[severity],
-            'seviye': severity,
-            'genel_risk_skoru': round(overall_risk, 1),
-            'risk_dagilimi': {
-                'Risk Yok': round(percentages['risk_yok'], 1),
-                'Hafif': round(percentages['hafif'], 1),
-                'Orta': round(percentages['orta'], 1),
-                'İleri': round(percentages['ileri'], 1)
-            }
-        }
-        
-        if severity == 0:
-            result['doktor_onerisi'] = '❌ Acil doktor kontrolü gerekmiyor'
-            result['tedavi_onerisi'] = '✅ Önleyici yaşam tarzı değişiklikleri'
-            result['takip'] = 'Yıllık kontrol yeterli'
-            result['aciliyet'] = 'Düşük'
-            result['detaylar'] = [
+    # Sonuç sözlüğünün anahtar sırası ve risk_dagilimi etiketleri
+    RESULT_KEYS = ('tahmin', 'seviye', 'genel_risk_skoru', 'risk_dagilimi', 'doktor_onerisi',
+                   'tedavi_onerisi', 'takip', 'aciliyet', 'detaylar', 'risk_faktorleri')
+    RISK_LABELS = ('Risk Yok', 'Hafif', 'Orta', 'İleri')
+    
+    # Seviye başına metin alanları; tüm değerlendirmeler bu değiştirilemez şablonları paylaşır
+    SEVERITY_TEMPLATES = freeze((
+        {
+            'tahmin': 'Parkinson Riski Yok / Minimal',
+            'doktor_onerisi': '❌ Acil doktor kontrolü gerekmiyor',
+            'tedavi_onerisi': '✅ Önleyici yaşam tarzı değişiklikleri',
+            'takip': 'Yıllık kontrol yeterli',
+            'aciliyet': 'Düşük',
+            'detaylar': (
                 '• Düzenli egzersiz yapın (haftada 3-4 gün, 30 dakika)',
                 '• Dengeli beslenme (Akdeniz diyeti önerilir)',
                 '• Zihinsel aktiviteler (bulmaca, okuma, sosyal aktiviteler)',
                 '• Uyku düzenine dikkat edin (7-8 saat)',
-                '• Kafa travmalarından korunun'
-            ]
-            
-        elif severity == 1:
-            result['doktor_onerisi'] = '⚠️ Nöroloji uzmanına başvurun (1-2 ay içinde)'
-            result['tedavi_onerisi'] = '💊 İLAÇ TEDAVİSİ ÖNERİLİYOR'
-            result['takip'] = '3-6 ayda bir kontrol'
-            result['aciliyet'] = 'Orta'
-            result['detaylar'] = [
+                '• Kafa travmalarından korunun',
+            ),
+        },
+        {
+            'tahmin': 'Hafif Parkinson Belirtileri',
+            'doktor_onerisi': '⚠️ Nöroloji uzmanına başvurun (1-2 ay içinde)',
+            'tedavi_onerisi': '💊 İLAÇ TEDAVİSİ ÖNERİLİYOR',
+            'takip': '3-6 ayda bir kontrol',
+            'aciliyet': 'Orta',
+            'detaylar': (
                 '• Levodopa veya dopamin agonistleri değerlendirilmeli',
                 '• MAO-B inhibitörleri (Rasajilin, Selejilin) düşünülebilir',
                 '• Fizik tedavi ve rehabilitasyon programı başlatın',
                 '• Egzersiz programı (özellikle denge ve kuvvet egzersizleri)',
                 '• Konuşma terapisi değerlendirmesi',
-                '• 3 ayda bir nöroloji kontrolü yapılmalı'
-            ]
-            
-        elif severity == 2:
-            result['doktor_onerisi'] = '🚨 ACİL nöroloji uzmanı konsültasyonu (1-2 hafta içinde)'
-            result['tedavi_onerisi'] = '💊💊 YAKIN TAKİP + İLAÇ TEDAVİSİ GEREKLİ'
-            result['takip'] = 'Aylık kontrol zorunlu'
-            result['aciliyet'] = 'Yüksek'
-            result['detaylar'] = [
+                '• 3 ayda bir nöroloji kontrolü yapılmalı',
+            ),
+        },
+        {
+            'tahmin': 'Orta Düzey Parkinson',
+            'doktor_onerisi': '🚨 ACİL nöroloji uzmanı konsültasyonu (1-2 hafta içinde)',
+            'tedavi_onerisi': '💊💊 YAKIN TAKİP + İLAÇ TEDAVİSİ GEREKLİ',
+            'takip': 'Aylık kontrol zorunlu',
+            'aciliyet': 'Yüksek',
+            'detaylar': (
                 '• Kombine ilaç tedavisi gerekebilir (Levodopa + COMT inhibitörü)',
                 '• İlaç dozları ve zamanlaması optimize edilmeli',
                 '• Fizik tedavi ve rehabilitasyon YOĞUNLAŞTIRILMALI',
@@ -111,15 +64,16 @@ class ParkinsonRiskAssessment:
                 '• Günlük yaşam aktiviteleri için ergoterapi',
                 '• Motor dalgalanmaları ve diskinezi izlenmeli',
                 '• Aylık nöroloji kontrolü ZORUNLU',
-                '• Destek gruplarına katılım önerilir'
-            ]
-            
-        else: # severity == 3
-            result['doktor_onerisi'] = '🚨🚨 ACİL hareket bozuklukları merkezine sevk (HEMEN)'
-            result['tedavi_onerisi'] = '🏥 CERRAHİ DEĞERLENDİRME + YOĞUN İLAÇ TEDAVİSİ'
-            result['takip'] = 'Haftalık/iki haftada bir kontrol'
-            result['aciliyet'] = 'ÇOK YÜKSEK - ACİL'
-            result['detaylar'] = [
+                '• Destek gruplarına katılım önerilir',
+            ),
+        },
+        {
+            'tahmin': 'İleri Parkinson',
+            'doktor_onerisi': '🚨🚨 ACİL hareket bozuklukları merkezine sevk (HEMEN)',
+            'tedavi_onerisi': '🏥 CERRAHİ DEĞERLENDİRME + YOĞUN İLAÇ TEDAVİSİ',
+            'takip': 'Haftalık/iki haftada bir kontrol',
+            'aciliyet': 'ÇOK YÜKSEK - ACİL',
+            'detaylar': (
                 '• DBS (Derin Beyin Stimülasyonu) ameliyatı değerlendirilmeli',
                 '• Apomorfin infüzyon pompası düşünülebilir',
                 '• Duodopa (jejunostomi) değerlendirmesi',
@@ -129,13 +83,13 @@ class ParkinsonRiskAssessment:
                 '• Beslenme desteği (gerekirse NGT)',
                 '• Psikiyatri konsültasyonu (depresyon/anksiyete için)',
                 '• Evde bakım hizmetleri düzenlemesi',
-                '• Haftalık/iki haftada bir hareket bozuklukları uzmanı takibi'
-            ]
-        
-        # Risk faktörleri analizi
-        result['risk_faktorleri'] = self._analyze_risk_factors(patient_data)
-        
-        return result
+                '• Haftalık/iki haftada bir hareket bozuklukları uzmanı takibi',
+            ),
+        },
+    ))
+    
+    def __init__(self):
+        super().__init__(BASE_DIR)
     
     def _analyze_risk_factors(self, data):
         """Risk faktörlerini analiz et"""
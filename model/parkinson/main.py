@@ -1,22 +1,32 @@
-import os, pickle
+import os
 import numpy as np
-import pandas as pd
 import sys
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Modellerin arka planda yüklenmesi için paylaşılan yardımcı model/ dizininde
+if os.path.dirname(BASE_DIR) not in sys.path:
+    sys.path.append(os.path.dirname(BASE_DIR))
+from background_loader import BackgroundLoader
+
 class ParkinsonRiskSystem:
     """Basitleştirilmiş Parkinson Risk Değerlendirme"""
     
     def __init__(self):
+        # Modeller (ve scikit-learn importu) hasta bilgileri girilirken arka planda yüklenir
+        try:
+            self._loader = BackgroundLoader(BASE_DIR, ("m1.pkl", "m2.pkl", "m3.pkl"))
+        except FileNotFoundError as e:
+            print(f"❌ Model yükleme hatası: {e}")
+            sys.exit(1)
+        self.rf_model = self.gb_model = self.scaler = None
+    
+    def _load_models(self):
+        """İlk değerlendirmede arka plandaki yüklemenin bitmesini bekle"""
+        if self.scaler is not None:
+            return
         try:
-            with open(os.path.join(BASE_DIR, "m1.pkl"), "rb") as f:
-                self.rf_model = pickle.load(f)
-            with open(os.path.join(BASE_DIR, "m2.pkl"), "rb") as f:
-                self.gb_model = pickle.load(f)
-            with open(os.path.join(BASE_DIR, "m3.pkl"), "rb") as f:
-                self.scaler = pickle.load(f)
-            print("✅ Modeller başarıyla yüklendi!\n")
+            self.rf_model, self.gb_model, self.scaler = self._loader.result()
         except Exception as e:
             print(f"❌ Model yükleme hatası: {e}")
             sys.exit(1)
@@ -73,6 +83,9 @@ class ParkinsonRiskSystem:
     
     def assess(self, data):
         """Risk değerlendirmesi yap"""
+        import pandas as pd  # scikit-learn ile arka planda zaten yüklenmiştir
+        
+        self._load_models()
         df = pd.DataFrame([data])
         X_scaled = self.scaler.transform(df)
         